@@ -0,0 +1,78 @@
+"""Benchmark string-level ID helpers against instance methods.
+
+For a sample of word IDs, times the usual instance-based operations
+(to_bcv(), simplify(), includes(), canon prefix, comparison) against
+their biblelib.word.fastid equivalents, and reports the speedup.
+
+Usage:
+    poetry run python benchmarks/bench_fastid.py
+    poetry run python benchmarks/bench_fastid.py --count 500000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from biblelib.word import BCID, BCVWPID, fastid, simplify, to_bcv
+
+
+def sample_wordids(count: int, seed: int = 42) -> list[str]:
+    """Return count random NT word ID strings with canon prefixes."""
+    rng = random.Random(seed)
+    return [
+        f"n{rng.randint(40, 66)}{rng.randint(1, 16):03d}{rng.randint(1, 30):03d}{rng.randint(1, 20):03d}"
+        for _ in range(count)
+    ]
+
+
+def timed(func: Callable[[list[str]], object], ids: list[str]) -> float:
+    """Return microseconds per ID for func over ids."""
+    start = time.perf_counter()
+    func(ids)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a table of per-ID times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000, help="word IDs to process")
+    args = parser.parse_args()
+    ids = sample_wordids(args.count)
+    chapter = BCID("41004")
+    cases: list[tuple[str, Callable[[list[str]], object], Callable[[list[str]], object]]] = [
+        (
+            "to_bcv",
+            lambda ids: [to_bcv(ID) for ID in ids],
+            lambda ids: [fastid.to_bcvid(ID) for ID in ids],
+        ),
+        (
+            "simplify",
+            lambda ids: [simplify(BCVWPID(ID), BCID).ID for ID in ids],
+            lambda ids: [fastid.simplify(ID, "BCID") for ID in ids],
+        ),
+        (
+            "includes",
+            lambda ids: [chapter.includes(BCVWPID(ID)) for ID in ids],
+            lambda ids: [fastid.includes("41004", ID) for ID in ids],
+        ),
+        (
+            "canon",
+            lambda ids: [BCVWPID(ID).canon_prefix for ID in ids],
+            lambda ids: [fastid.canon_prefix(ID) for ID in ids],
+        ),
+        (
+            "compare",
+            lambda ids: [BCVWPID(first) < BCVWPID(second) for first, second in zip(ids, ids[1:])],
+            lambda ids: [fastid.compare(first, second) < 0 for first, second in zip(ids, ids[1:])],
+        ),
+    ]
+    print(f"{'operation':<12}{'instance us':>12}{'fastid us':>12}{'speedup':>10}")
+    for name, instancefunc, fastfunc in cases:
+        instancetime = timed(instancefunc, ids)
+        fasttime = timed(fastfunc, ids)
+        print(f"{name:<12}{instancetime:>12.3f}{fasttime:>12.3f}{instancetime / fasttime:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark GNTMappings load modes for text columns.
+
+Times loading the GNT mapping table with text="full" (normalize all
+text on load), "lazy" (normalize on first access), and "none" (IDs
+only), taking the best of several runs. By default, a seeded
+synthetic table the size of the real one is generated; pass
+--sourcefile to time a local copy of the real mapping TSV.
+
+Usage:
+    poetry run python benchmarks/bench_gntload.py
+    poetry run python benchmarks/bench_gntload.py --sourcefile mappings-GNT-stripped.tsv --repeat 10
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import write_gnt_table
+
+from biblelib.word.mappings import GNTMappings
+
+
+def best_time(sourcefile: str, text: str, repeat: int, readtext: bool = False) -> float:
+    """Return the best time in seconds to load with a text mode, over repeat runs.
+
+    With readtext, the time includes reading every text form once.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        mappings = GNTMappings(sourcefile, text=text)
+        if readtext:
+            for mapping in mappings:
+                mapping.NA1904_Text, mapping.SBLGNT_Text
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark and print load times for each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sourcefile", default="", help="local GNT mapping TSV (default: synthetic)")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="size of the synthetic table, relative to the real one"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs for each mode")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sourcefile = args.sourcefile
+        if not sourcefile:
+            sourcefile = str(Path(tmpdir) / "gnt.tsv")
+            write_gnt_table(Path(sourcefile), args.scale)
+        cases = [
+            ("full", "full", False),
+            ("lazy", "lazy", False),
+            ("none (IDs only)", "none", False),
+            ("full + read text", "full", True),
+            ("lazy + read text", "lazy", True),
+        ]
+        fulltime = best_time(sourcefile, "full", args.repeat)
+        print(f"{'mode':<20}{'seconds':>10}{'vs full':>10}")
+        for name, text, readtext in cases:
+            seconds = fulltime if name == "full" else best_time(sourcefile, text, args.repeat, readtext)
+            print(f"{name:<20}{seconds:>10.3f}{seconds / fulltime:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark sorting and hashing large collections of reference IDs.
+
+For a seeded sample of word IDs (about the size of a full-corpus
+token list), times sorted() (with and without key=attrgetter("ID"))
+and set() on BCVWPID and BCVID instances, and on a mixture of BCID
+and BCVID instances, with ID strings as the baseline.
+
+Usage:
+    poetry run python benchmarks/bench_idorder.py
+    poetry run python benchmarks/bench_idorder.py --count 100000
+"""
+
+import argparse
+import random
+import time
+from operator import attrgetter
+from typing import Callable
+
+from biblelib.word import BCID, BCVID, BCVWPID
+
+
+def sample_wordids(count: int, seed: int = 42) -> list[str]:
+    """Return count random NT word ID strings, with duplicates."""
+    rng = random.Random(seed)
+    return [
+        f"{rng.randint(40, 66)}{rng.randint(1, 16):03d}{rng.randint(1, 30):03d}{rng.randint(1, 20):03d}1"
+        for _ in range(count)
+    ]
+
+
+def timed(func: Callable[[list], object], items: list) -> float:
+    """Return milliseconds for func over items, or NaN if the items can't be compared."""
+    start = time.perf_counter()
+    try:
+        func(items)
+    except TypeError:
+        return float("nan")
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    """Run the benchmark and print a table of times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=400000, help="word IDs to sort and hash")
+    args = parser.parse_args()
+    ids = sample_wordids(args.count)
+    collections: dict[str, list] = {
+        "ID strings": ids,
+        "BCVWPID": [BCVWPID.from_trusted(ID) for ID in ids],
+        "BCVID": [BCVID.from_trusted(ID[:8]) for ID in ids],
+        "BCID + BCVID": [
+            BCID.from_trusted(ID[:5]) if index % 2 else BCVID.from_trusted(ID[:8]) for index, ID in enumerate(ids)
+        ],
+    }
+    bykey = attrgetter("ID")
+    print(f"{'items':<16}{'sorted ms':>12}{'by ID ms':>12}{'set ms':>12}")
+    for name, items in collections.items():
+        keytime = timed(lambda items: sorted(items, key=bykey), items) if name != "ID strings" else float("nan")
+        print(f"{name:<16}{timed(sorted, items):>12.1f}{keytime:>12.1f}{timed(set, items):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark interned reference instances on a full-corpus workload.
+
+Simulates loading a word-level corpus of the Protestant canon: each
+token is annotated with its verse (BCVID) and chapter (simplify() to
+BCID), so every verse and chapter instance is constructed once per
+word. Reports time, peak traced memory, and memory retained by the
+loaded rows, with and without enable_interning(), and the pool's
+hit/miss counters.
+
+Usage:
+    poetry run python benchmarks/bench_intern.py
+    poetry run python benchmarks/bench_intern.py --words 20 --maxsize 4096
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from biblelib.versification import get_versetable
+from biblelib.word import BCID, BCVID
+from biblelib.word.bcvwpid import disable_interning, enable_interning, simplify
+
+
+def corpus_verses() -> list[str]:
+    """Return the verse ID strings of the Protestant canon in the eng versification."""
+    versetable = get_versetable("eng")
+    last = versetable.book_span("66")[1]
+    return [versetable.from_ordinal(ordinal) for ordinal in range(last + 1)]
+
+
+def load(verses: list[str], words: int) -> list[tuple[BCVID, BCID]]:
+    """Return a (verse, chapter) row for each of words tokens in every verse."""
+    rows = []
+    for verseid in verses:
+        for _ in range(words):
+            verse = BCVID(verseid)
+            rows.append((verse, simplify(verse, BCID)))
+    return rows
+
+
+def measure(verses: list[str], words: int) -> tuple[float, int, int]:
+    """Return seconds, peak traced bytes, and bytes retained by the rows for a load."""
+    gc.collect()
+    start = time.perf_counter()
+    rows = load(verses, words)
+    elapsed = time.perf_counter() - start
+    del rows
+    gc.collect()
+    tracemalloc.start()
+    rows = load(verses, words)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return elapsed, peak, retained
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=13, help="tokens per verse")
+    parser.add_argument("--maxsize", type=int, default=65536, help="IDPool maxsize")
+    args = parser.parse_args()
+    verses = corpus_verses()
+    print(f"{len(verses)} verses x {args.words} words = {len(verses) * args.words} rows")
+    print(f"{'mode':<10}{'seconds':>10}{'peak MB':>10}{'kept MB':>10}")
+    disable_interning()
+    elapsed, peak, retained = measure(verses, args.words)
+    print(f"{'plain':<10}{elapsed:>10.2f}{peak / 1e6:>10.1f}{retained / 1e6:>10.1f}")
+    pool = enable_interning(maxsize=args.maxsize)
+    elapsed, peak, retained = measure(verses, args.words)
+    print(f"{'interned':<10}{elapsed:>10.2f}{peak / 1e6:>10.1f}{retained / 1e6:>10.1f}")
+    print(f"pool: {pool.stats()}")
+    disable_interning()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark localized reference parsing by round-tripping rendered references.
+
+For every bundled `books_<lang>.tsv`, render sample verse and range
+references with `to_nameref(lang=...)` and `to_abbrevref(lang=...)`,
+parse them back with LocalizedRefParser, and report accuracy (the
+share that round-trip to the same ID) and parsing time.
+
+Usage:
+    poetry run python benchmarks/bench_localparse.py
+    poetry run python benchmarks/bench_localparse.py --count 100000 --show-errors
+"""
+
+import argparse
+import random
+import time
+
+from biblelib.book import Books, get_localized_books, localized_languages
+from biblelib.book.booktrie import get_booktrie
+from biblelib.versification import get_versetable
+from biblelib.word import BCVID, BCVIDRange
+from biblelib.word.localref import get_localizedrefparser
+
+BOOKS = Books()
+
+
+def sample_refs(lang: str, count: int, seed: int = 42) -> list[BCVID | BCVIDRange]:
+    """Return count random verses and ranges from books that lang localizes."""
+    versetable = get_versetable("eng")
+    localized = get_localized_books(lang)
+    assert localized is not None
+    chapters = [
+        bcid
+        for bcid in versetable.lastverses
+        if bcid[:2] in BOOKS._ensure_usfmnumbermap() and BOOKS.fromusfmnumber(bcid[:2]).usfmname in localized._data
+    ]
+    rng = random.Random(seed)
+    refs: list[BCVID | BCVIDRange] = []
+    for _ in range(count):
+        bcid = rng.choice(chapters)
+        verse = rng.randint(1, versetable.lastverses[bcid])
+        startid = BCVID(f"{bcid}{verse:03d}")
+        if rng.random() < 0.25:
+            endverse = rng.randint(verse, versetable.lastverses[bcid])
+            refs.append(BCVIDRange(startid, BCVID(f"{bcid}{endverse:03d}")))
+        else:
+            refs.append(startid)
+    return refs
+
+
+def main() -> None:
+    """Run the benchmark and print a table of accuracy and per-reference times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="references per language and style")
+    parser.add_argument("--show-errors", action="store_true", help="print references that fail to round-trip")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    get_booktrie()
+    print(f"trie build: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"{'lang':<6}{'style':<8}{'accuracy':>10}{'us/ref':>9}")
+    totalrefs = totalcorrect = 0
+    for lang in localized_languages():
+        refparser = get_localizedrefparser(lang)
+        refs = sample_refs(lang, args.count)
+        for style in ("name", "abbrev"):
+            strings = [ref.to_nameref(lang=lang) if style == "name" else ref.to_abbrevref(lang=lang) for ref in refs]
+            start = time.perf_counter()
+            parsed = []
+            for string in strings:
+                try:
+                    parsed.append(refparser.parse(string).ID)
+                except ValueError:
+                    parsed.append("")
+            elapsed = (time.perf_counter() - start) / len(strings) * 1e6
+            correct = sum(ref.ID == ID for ref, ID in zip(refs, parsed))
+            totalrefs += len(refs)
+            totalcorrect += correct
+            print(f"{lang:<6}{style:<8}{correct / len(refs):>10.2%}{elapsed:>9.2f}")
+            if args.show_errors:
+                for ref, string, ID in zip(refs, strings, parsed):
+                    if ref.ID != ID:
+                        print(f"    {string!r}: expected {ref.ID}, got {ID or 'error'}")
+    print(f"overall accuracy: {totalcorrect / totalrefs:.2%}")
+
+
+if __name__ == "__main__":
+    main()
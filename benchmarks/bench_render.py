@@ -0,0 +1,63 @@
+"""Benchmark localized reference rendering across all bundled languages.
+
+Compares the per-call lookup path that `to_nameref(lang=...)` used
+before RefRenderer (localization cache, separator lookup, USFM name
+lookup, and an asserting name lookup per reference) with a precompiled
+RefRenderer, for every `books_<lang>.tsv`.
+
+Usage:
+    poetry run python benchmarks/bench_render.py
+    poetry run python benchmarks/bench_render.py --count 100000
+"""
+
+import argparse
+import random
+import time
+
+from biblelib.book import Books, get_localized_books, localized_languages
+from biblelib.versification import get_versetable
+from biblelib.word.refrender import get_refrenderer, preload_refrenderers
+
+BOOKS = Books()
+
+
+def lookup_render(ID: str, lang: str) -> str:
+    """Render a reference with per-call lookups, as to_nameref(lang=...) did."""
+    localized = get_localized_books(lang)
+    assert localized is not None
+    bookname = localized.get_name(BOOKS.fromusfmnumber(ID[:2]).usfmname)
+    return f"{bookname} {int(ID[2:5])}{localized.cv_sep}{int(ID[5:8])}"
+
+
+def sample_ids(count: int, seed: int = 42) -> list[str]:
+    """Return count random verse IDs from the Protestant canon in the eng versification."""
+    versetable = get_versetable("eng")
+    rng = random.Random(seed)
+    protestant = versetable.book_span("66")[1] + 1
+    return [versetable.from_ordinal(rng.randrange(protestant)) for _ in range(count)]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of per-reference times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50000, help="references per language")
+    args = parser.parse_args()
+    IDs = sample_ids(args.count)
+    start = time.perf_counter()
+    preload_refrenderers()
+    print(f"preload: {(time.perf_counter() - start) * 1000:.1f} ms for {len(localized_languages())} languages")
+    print(f"{'lang':<6}{'lookup us/ref':>15}{'renderer us/ref':>17}{'speedup':>9}")
+    for lang in localized_languages():
+        renderer = get_refrenderer(lang, "name")
+        start = time.perf_counter()
+        expected = [lookup_render(ID, lang) for ID in IDs]
+        lookup = (time.perf_counter() - start) / len(IDs) * 1e6
+        start = time.perf_counter()
+        rendered = renderer.render_many(IDs)
+        compiled = (time.perf_counter() - start) / len(IDs) * 1e6
+        assert rendered == expected, f"Rendering mismatch for {lang}"
+        print(f"{lang:<6}{lookup:>15.3f}{compiled:>17.3f}{lookup / compiled:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark mapping table load time and memory as the tables grow.
+
+For each scale factor, writes synthetic GNT and WLCM mapping tables
+(see synthetic.py), then loads each one in a fresh interpreter, builds
+its MARBLE index with one lookup, and reports the time and the growth
+in peak resident memory. Needs no downloaded data.
+
+Usage:
+    poetry run python benchmarks/bench_scaling.py
+    poetry run python benchmarks/bench_scaling.py --scales 1,5,10,50 --seed 7
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from synthetic import write_tables
+
+ROOT = Path(__file__).resolve().parent.parent
+# run in a new interpreter, so each load starts from the same memory
+LOADCODE = """
+import json, resource, sys, time
+from biblelib.word.mappings import {cls}
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+mappings = {cls}(sys.argv[1])
+loaded = time.perf_counter()
+mappings.{lookup}(sys.argv[2])
+indexed = time.perf_counter()
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"rows": len(mappings), "load": loaded - start, "index": indexed - loaded, "rss": after - before}}))
+"""
+
+
+def measure(cls: str, lookup: str, path: Path, marbleid: str) -> dict:
+    """Return rows, load and index seconds, and peak RSS growth in KB for loading path."""
+    result = subprocess.run(
+        [sys.executable, "-c", LOADCODE.format(cls=cls, lookup=lookup), str(path), marbleid],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+    )
+    measurement: dict = json.loads(result.stdout)
+    return measurement
+
+
+def main() -> None:
+    """Run the benchmark and print a table for each table and scale."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1,2,5", help="comma-separated scale factors, up to 50")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for the tables")
+    args = parser.parse_args()
+    print(f"{'table':<14}{'scale':>7}{'rows':>10}{'load s':>9}{'index s':>9}{'peak MB':>9}{'bytes/row':>11}")
+    for scale in [float(scale) for scale in args.scales.split(",")]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            gntpath, wlcmpath = write_tables(Path(tmpdir), scale, args.seed)
+            for name, cls, lookup, path, marbleid in [
+                ("GNTMappings", "GNTMappings", "marble2sblgnt", gntpath, "04100100100002"),
+                ("WLCMMappings", "WLCMMappings", "marble2macula", wlcmpath, "00100100100002"),
+            ]:
+                result = measure(cls, lookup, path, marbleid)
+                # ru_maxrss is in KB on Linux
+                print(
+                    f"{name:<14}{scale:>7g}{result['rows']:>10}{result['load']:>9.2f}{result['index']:>9.2f}"
+                    f"{result['rss'] / 1024:>9.1f}{result['rss'] * 1024 / result['rows']:>11.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
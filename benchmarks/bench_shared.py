@@ -0,0 +1,98 @@
+"""Benchmark bulk fromubs() conversion in a process pool, with and without shared mappings.
+
+Converts every MARBLE ID in synthetic mapping tables (see synthetic.py)
+with a pool of worker processes, two ways:
+- load: each worker loads and indexes the mapping tables itself
+- shared: SharedMappingExecutor publishes the indexes once in shared
+  memory, and workers attach to them
+
+and reports the wall time (including starting the workers) and the memory
+only each worker uses (USS, from /proc/self/smaps_rollup, so Linux
+only). Needs no downloaded data.
+
+Usage:
+    poetry run python benchmarks/bench_shared.py
+    poetry run python benchmarks/bench_shared.py --workers 8 --scale 2
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from synthetic import write_tables
+
+from biblelib.word import fromubs
+from biblelib.word.mappings import GNTMappings, SharedMappingExecutor, SharedMarbleTable, WLCMMappings, marble
+
+
+def _usemappings(gntpath: str, wlcmpath: str) -> None:
+    """Point the shared mapping getters in this process at the synthetic tables."""
+    marble.gnt_mappings = cache(lambda: GNTMappings(gntpath, text="none"))
+    marble.wlcm_mappings = cache(lambda: WLCMMappings(wlcmpath))
+
+
+def _memory(_: int) -> tuple[int, float]:
+    """Return this worker's process ID and USS in MB."""
+    # pause, so each worker takes one of these
+    time.sleep(0.2)
+    values: dict[str, int] = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) == 3 and fields[2] == "kB":
+                values[fields[0].rstrip(":")] = int(fields[1])
+    return os.getpid(), (values["Private_Clean"] + values["Private_Dirty"]) / 1024
+
+
+def run(
+    executor: Executor, convert: Callable[[Iterable[str]], Iterator[list]], refs: list[str], workers: int
+) -> tuple[float, float]:
+    """Convert refs, and return the seconds and the mean worker USS in MB."""
+    start = time.perf_counter()
+    converted = sum(1 for _ in convert(refs))
+    seconds = time.perf_counter() - start
+    assert converted == len(refs)
+    usses = dict(executor.map(_memory, range(workers)))
+    return seconds, sum(usses.values()) / len(usses)
+
+
+def main() -> None:
+    """Run the benchmark and print the results for each way."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes")
+    parser.add_argument("--scale", type=float, default=1.0, help="size of the synthetic mapping tables")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for the tables")
+    parser.add_argument("--chunksize", type=int, default=1000, help="references sent to a worker at a time")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = [str(path) for path in write_tables(Path(tmpdir), args.scale, args.seed)]
+        gnt = GNTMappings(paths[0], text="none")
+        wlcm = WLCMMappings(paths[1])
+        refs = [mapping.MARBLE_IDs for mapping in wlcm] + [mapping.MARBLE_ID for mapping in gnt if mapping.MARBLE_ID]
+        print(f"{len(refs)} references, {args.workers} workers")
+        print(f"{'way':<8}{'seconds':>9}{'worker USS MB':>15}")
+        # start workers fresh, so they don't inherit the tables loaded here
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(args.workers, context, initializer=_usemappings, initargs=tuple(paths)) as executor:
+            seconds, uss = run(
+                executor, lambda refs: executor.map(fromubs, refs, chunksize=args.chunksize), refs, args.workers
+            )
+        print(f"{'load':<8}{seconds:>9.2f}{uss:>15.1f}")
+        start = time.perf_counter()
+        with SharedMarbleTable.publish(gnt, wlcm) as table:
+            published = time.perf_counter() - start
+            with SharedMappingExecutor(args.workers, table=table, mp_context=context) as executor:
+                seconds, uss = run(
+                    executor, lambda refs: executor.fromubs(refs, chunksize=args.chunksize), refs, args.workers
+                )
+            print(f"{'shared':<8}{published + seconds:>9.2f}{uss:>15.1f}  ({table.shm.size / 1e6:.1f} MB shared)")
+
+
+if __name__ == "__main__":
+    main()
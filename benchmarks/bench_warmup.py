@@ -0,0 +1,150 @@
+"""Benchmark per-worker memory in a pre-fork server, with and without warmup().
+
+Runs each mode in a fresh interpreter, which forks worker processes
+that each do the same small workload (MARBLE lookups, book lookups,
+reference rendering, pericopes), then report their memory while all
+of them are still alive:
+- cold: the parent loads nothing, so each worker loads its own data
+- warm: the parent calls warmup(freeze=False) before forking
+- frozen: the parent calls warmup(), which also freezes what it loaded
+
+USS is memory only that worker uses, and PSS adds its share of the
+pages it shares with the others (from /proc/self/smaps_rollup, so
+Linux only). The mapping tables are synthetic (see synthetic.py), so
+no download is needed.
+
+Usage:
+    poetry run python benchmarks/bench_warmup.py
+    poetry run python benchmarks/bench_warmup.py --workers 8 --scale 2
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import traceback
+from functools import cache
+from pathlib import Path
+from time import perf_counter
+
+from synthetic import write_tables
+
+MODES = ("cold", "warm", "frozen")
+
+
+def _memory() -> dict[str, float]:
+    """Return this process's RSS, PSS, and USS in MB."""
+    values: dict[str, int] = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) == 3 and fields[2] == "kB":
+                values[fields[0].rstrip(":")] = int(fields[1])
+    uss = values["Private_Clean"] + values["Private_Dirty"]
+    return {"rss": values["Rss"] / 1024, "pss": values["Pss"] / 1024, "uss": uss / 1024}
+
+
+def _workload() -> None:
+    """Do what a request handler might: look up and render references."""
+    from biblelib.book import Books
+    from biblelib.pericope import get_pericopedict
+    from biblelib.word import BCVID, fromusfm
+    from biblelib.word.mappings.marble import gnt_mappings, wlcm_mappings
+    from biblelib.word.refrender import get_refrenderer
+
+    gnt = gnt_mappings()
+    for mapping in gnt.data[::100]:
+        gnt.marble2sblgnt(mapping.MARBLE_ID)
+    wlcm = wlcm_mappings()
+    for mapping in wlcm.data[::100]:
+        wlcm.marble2macula(mapping.MARBLE_IDs)
+    books = Books()
+    for name in ("Gen", "Matthew", "1 Cor", "Rev"):
+        books.findbook(name)
+    renderer = get_refrenderer("fra")
+    for ref in ("MAT 5:3", "ROM 8:28", "GEN 1:1"):
+        renderer.render(fromusfm(ref))
+    get_pericopedict().get_pericope(BCVID("41004003"))
+
+
+def run(mode: str, workers: int, gntpath: str, wlcmpath: str) -> dict:
+    """Fork workers in mode, and return the parent's memory and each worker's memory and seconds."""
+    from biblelib.word.mappings import GNTMappings, WLCMMappings, marble
+
+    # point the shared mapping getters at the synthetic tables
+    marble.gnt_mappings = cache(lambda: GNTMappings(gntpath, text="lazy"))
+    marble.wlcm_mappings = cache(lambda: WLCMMappings(wlcmpath))
+    if mode != "cold":
+        from biblelib import warmup
+
+        warmup(freeze=mode == "frozen")
+    parent = _memory()
+    release_read, release_write = os.pipe()
+    results = []
+    for _ in range(workers):
+        result_read, result_write = os.pipe()
+        if os.fork() == 0:
+            try:
+                os.close(result_read)
+                os.close(release_write)
+                start = perf_counter()
+                _workload()
+                seconds = perf_counter() - start
+                os.write(result_write, json.dumps({"seconds": seconds, **_memory()}).encode())
+                os.close(result_write)
+                # stay alive until every worker is measured, so pages stay shared
+                os.read(release_read, 1)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                # never return into the parent's code
+                os._exit(0)
+        os.close(result_write)
+        results.append(result_read)
+    measurements = []
+    for result_read in results:
+        with os.fdopen(result_read, "rb") as f:
+            measurements.append(json.loads(f.read()))
+    os.close(release_write)
+    for _ in range(workers):
+        os.wait()
+    return {"parent": parent, "workers": measurements}
+
+
+def main() -> None:
+    """Run the benchmark and print a summary for each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes")
+    parser.add_argument("--scale", type=float, default=1.0, help="size of the synthetic mapping tables")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for the tables")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--tables", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode:
+        # running one mode in a fresh interpreter
+        print(json.dumps(run(args.mode, args.workers, *args.tables)))
+        return
+    print(
+        f"{'mode':<8}{'parent RSS':>12}{'worker PSS':>12}{'worker USS':>12}{'total PSS':>11}{'worker s':>10}  (MB, means)"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tables = [str(path) for path in write_tables(Path(tmpdir), args.scale, args.seed)]
+        for mode in MODES:
+            command = [sys.executable, __file__, "--mode", mode, "--workers", str(args.workers), "--tables", *tables]
+            result = json.loads(subprocess.run(command, capture_output=True, text=True, check=True).stdout)
+            workers = result["workers"]
+
+            def mean(key: str) -> float:
+                return sum(worker[key] for worker in workers) / len(workers)
+
+            total = result["parent"]["pss"] + sum(worker["pss"] for worker in workers)
+            print(
+                f"{mode:<8}{result['parent']['rss']:>12.1f}{mean('pss'):>12.1f}{mean('uss'):>12.1f}"
+                f"{total:>11.1f}{mean('seconds'):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""Run the biblelib benchmark suite and save machine-readable results.
+
+Times the library's hot paths: imports, Books construction, reference
+parsing and rendering, versification files, mapping tables (read from
+synthetic local TSVs, so no download is needed), pericope lookup, and
+verse range enumeration. Each case runs several times, and the best
+and median times are reported.
+
+With --output, results are written as JSON, along with the biblelib
+and Python versions. With --compare, times are compared against a
+previous results file, and the exit status is 1 if any case is slower
+than the threshold, so results from different releases can be
+compared in CI.
+
+Usage:
+    poetry run python benchmarks/suite.py
+    poetry run python benchmarks/suite.py --filter render --repeat 10
+    poetry run python benchmarks/suite.py --output benchmarks/results/0.5.4.json
+    poetry run python benchmarks/suite.py --compare benchmarks/results/0.5.4.json
+"""
+
+import argparse
+import atexit
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cache, partial
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from synthetic import write_gnt_table, write_wlcm_table
+
+from biblelib import CANONIDS, VERSIFICATIONIDS
+from biblelib.book import Books, localized_languages
+from biblelib.book.book import _read_books
+from biblelib.pericope import PericopeDict
+from biblelib.unit import VerseRange
+from biblelib.versification import VrefReader, get_versetable
+from biblelib.word import BCVID, frombiblia, fromname, fromusfm
+from biblelib.word.mappings import GNTMappings, WLCMMappings
+from biblelib.word.refrender import get_refrenderer
+
+ROOT = Path(__file__).resolve().parent.parent
+# the result format: increment on incompatible changes
+FORMAT = 1
+
+
+@dataclass
+class Case:
+    """A benchmark case.
+
+    setup() is run once, untimed, and returns the function to time and
+    the number of operations it performs. With selftimed, the function
+    returns its own time in seconds, for cases that must exclude
+    overhead (like starting an interpreter).
+    """
+
+    name: str
+    setup: Callable[[], tuple[Callable[[], Any], int]]
+    repeat: int = 5
+    selftimed: bool = False
+
+
+CASES: dict[str, Case] = {}
+
+
+def register(name: str, setup: Callable[[], tuple[Callable[[], Any], int]], **kwargs: Any) -> None:
+    """Add a case to the suite."""
+    assert name not in CASES, f"Duplicate case: {name}"
+    CASES[name] = Case(name, setup, **kwargs)
+
+
+@cache
+def _tmpdir() -> Path:
+    """Return a temporary directory, removed on exit."""
+    path = Path(tempfile.mkdtemp(prefix="biblelib-bench-"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+@cache
+def gnt_table() -> str:
+    """Return the path to a synthetic GNT mapping table."""
+    return str(write_gnt_table(_tmpdir() / "mappings-GNT-stripped.tsv"))
+
+
+@cache
+def wlcm_table() -> str:
+    """Return the path to a synthetic WLCM mapping table."""
+    return str(write_wlcm_table(_tmpdir() / "macula_to_marble_map.tsv"))
+
+
+@cache
+def protestant_ids() -> list[str]:
+    """Return every verse ID in the Protestant canon, with the eng versification."""
+    versetable = get_versetable("eng")
+    return [versetable.from_ordinal(ordinal) for ordinal in range(versetable.book_span("66")[1] + 1)]
+
+
+@cache
+def sample_ids(count: int = 20000, seed: int = 42) -> list[str]:
+    """Return a seeded random sample of Protestant verse IDs."""
+    rng = random.Random(seed)
+    return rng.choices(protestant_ids(), k=count)
+
+
+# imports: timed in a fresh interpreter
+def setup_import(module: str) -> tuple[Callable[[], float], int]:
+    """Time importing module in a new interpreter."""
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+
+    def run() -> float:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(ROOT)},
+        )
+        return float(result.stdout)
+
+    return run, 1
+
+
+for module in ("biblelib.word", "biblelib.unit"):
+    register(f"import.{module}", partial(setup_import, module), selftimed=True)
+
+
+# book metadata
+def setup_books(cold: bool) -> tuple[Callable[[], Any], int]:
+    """Time Books(), optionally clearing the cache of parsed books.tsv files first."""
+
+    def run() -> Books:
+        if cold:
+            _read_books.cache_clear()
+        return Books()
+
+    return run, 1
+
+
+register("book.Books.cold", partial(setup_books, True))
+register("book.Books.warm", partial(setup_books, False))
+
+
+# parsing
+def setup_parse(parser: Callable[[str], Any], render: Callable[[BCVID], str]) -> tuple[Callable[[], Any], int]:
+    """Time parsing rendered references to a sample of verses."""
+    refs = [render(BCVID(ID)) for ID in sample_ids()]
+    return (lambda: [parser(ref) for ref in refs]), len(refs)
+
+
+register("word.fromusfm", partial(setup_parse, fromusfm, BCVID.to_usfm))
+register("word.frombiblia", partial(setup_parse, frombiblia, BCVID.to_biblia))
+register("word.fromname", partial(setup_parse, fromname, BCVID.to_nameref))
+
+
+# rendering
+def setup_render(lang: str) -> tuple[Callable[[], Any], int]:
+    """Time rendering a sample of verses with book names in lang."""
+    IDs = sample_ids()
+    renderer = get_refrenderer(lang, "name")
+    return partial(renderer.render_many, IDs), len(IDs)
+
+
+for lang in ["eng", *localized_languages()]:
+    register(f"render.name.{lang}", partial(setup_render, lang))
+
+
+# versification
+def setup_vref(scheme: str, canon: str) -> tuple[Callable[[], Any], int]:
+    """Time reading a bundled vref file."""
+    return partial(VrefReader, scheme, canon), 1
+
+
+for scheme in sorted(VERSIFICATIONIDS):
+    for canon in sorted(CANONIDS):
+        register(f"versification.VrefReader.{scheme}.{canon}", partial(setup_vref, scheme, canon), repeat=3)
+
+
+# mapping tables
+def setup_gnt_load(text: str) -> tuple[Callable[[], Any], int]:
+    """Time loading the GNT mapping table."""
+    return partial(GNTMappings, gnt_table(), text=text), 1
+
+
+def setup_gnt_lookup(index: bool) -> tuple[Callable[[], Any], int]:
+    """Time looking up every MARBLE ID, with or without building the index first."""
+    gnt = GNTMappings(gnt_table(), text="none")
+    marbleids = [mapping.MARBLE_ID for mapping in gnt]
+
+    def run() -> list[str]:
+        if index:
+            gnt.marble_ids.clear()
+        return [gnt.marble2sblgnt(marbleid) for marbleid in marbleids]
+
+    return run, len(marbleids)
+
+
+def setup_wlcm_lookup(index: bool) -> tuple[Callable[[], Any], int]:
+    """Time looking up every MARBLE ID, with or without building the index first."""
+    wlcm = WLCMMappings(wlcm_table())
+    marbleids = [mapping.MARBLE_IDs for mapping in wlcm]
+
+    def run() -> list[list[str]]:
+        if index:
+            wlcm.marble_ids.clear()
+        return [wlcm.marble2macula(marbleid) for marbleid in marbleids]
+
+    return run, len(marbleids)
+
+
+for text in ("full", "lazy", "none"):
+    register(f"mappings.GNTMappings.load.{text}", partial(setup_gnt_load, text), repeat=3)
+register("mappings.GNTMappings.marble2sblgnt", partial(setup_gnt_lookup, False), repeat=3)
+register("mappings.GNTMappings.marble2sblgnt.index", partial(setup_gnt_lookup, True), repeat=3)
+register("mappings.WLCMMappings.load", lambda: (partial(WLCMMappings, wlcm_table()), 1), repeat=3)
+register("mappings.WLCMMappings.marble2macula", partial(setup_wlcm_lookup, False), repeat=3)
+register("mappings.WLCMMappings.marble2macula.index", partial(setup_wlcm_lookup, True), repeat=3)
+
+
+# pericopes
+def setup_pericopes() -> tuple[Callable[[], Any], int]:
+    """Time finding the pericope for every Protestant verse."""
+    pericopes = PericopeDict("eng", "BSB")
+    verses = [BCVID(ID) for ID in protestant_ids()]
+
+    def run() -> list[Any]:
+        found = []
+        for verse in verses:
+            try:
+                found.append(pericopes.get_pericope(verse))
+            except ValueError:
+                found.append(None)
+        return found
+
+    return run, len(verses)
+
+
+register("pericope.PericopeDict.get_pericope", setup_pericopes, repeat=1)
+
+
+# units
+def setup_enumerate() -> tuple[Callable[[], Any], int]:
+    """Time enumerating the verses of every Protestant book."""
+    versetable = get_versetable("eng")
+    spans = [versetable.book_span(f"{book:02d}") for book in range(1, 67)]
+    ranges = [
+        VerseRange(BCVID(versetable.from_ordinal(first)), BCVID(versetable.from_ordinal(last))) for first, last in spans
+    ]
+    return (lambda: [verserange.enumerate() for verserange in ranges]), len(ranges)
+
+
+register("unit.VerseRange.enumerate", setup_enumerate, repeat=3)
+
+
+def run_case(case: Case, repeat: Optional[int] = None) -> dict[str, Any]:
+    """Run case and return its timings."""
+    func, ops = case.setup()
+    times = []
+    for _ in range(repeat or case.repeat):
+        gc.collect()
+        if case.selftimed:
+            times.append(func())
+        else:
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        "best": best,
+        "median": statistics.median(times),
+        "repeat": len(times),
+        "ops": ops,
+        "us_per_op": best / ops * 1e6,
+    }
+
+
+def version() -> str:
+    """Return the biblelib version."""
+    try:
+        return metadata.version("biblelib")
+    except metadata.PackageNotFoundError:
+        # running from a source tree
+        for line in (ROOT / "pyproject.toml").read_text(encoding="utf-8").splitlines():
+            if line.startswith("version = "):
+                return line.split('"')[1]
+    return "unknown"
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print a comparison of results with baseline, and return the names of regressed cases."""
+    print(f"\nCompared with biblelib {baseline['biblelib']} ({baseline['timestamp']}):")
+    print(f"{'case':<50}{'baseline ms':>14}{'ms':>12}{'ratio':>8}")
+    regressions = []
+    for name, result in results["results"].items():
+        if name not in baseline["results"] or "best" not in baseline["results"][name]:
+            continue
+        if "best" not in result:
+            regressions.append(name)
+            print(f"{name:<50}  failed: {result['error']}")
+            continue
+        before = baseline["results"][name]["best"]
+        ratio = result["best"] / before
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = "  SLOWER"
+        print(f"{name:<50}{before * 1e3:>14.2f}{result['best'] * 1e3:>12.2f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main() -> None:
+    """Run the selected cases, print a table, and save or compare results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run cases whose names include this string")
+    parser.add_argument("--repeat", type=int, help="runs for each case (default: depends on the case)")
+    parser.add_argument("--output", default="", help="save results as JSON to this path")
+    parser.add_argument("--compare", default="", help="compare with results saved with --output")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio that counts as a regression")
+    parser.add_argument("--list", action="store_true", help="list the case names and exit")
+    args = parser.parse_args()
+    cases = [case for name, case in CASES.items() if args.filter in name]
+    if args.list:
+        print("\n".join(case.name for case in cases))
+        return
+    results: dict[str, Any] = {
+        "format": FORMAT,
+        "biblelib": version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": {},
+    }
+    print(f"{'case':<50}{'best ms':>12}{'median ms':>12}{'us/op':>12}")
+    for case in cases:
+        try:
+            result = results["results"][case.name] = run_case(case, args.repeat)
+        except Exception as err:
+            # record the failure, so it shows up in comparisons
+            results["results"][case.name] = {"error": repr(err)}
+            print(f"{case.name:<50}  failed: {err!r}")
+            continue
+        print(
+            f"{case.name:<50}{result['best'] * 1e3:>12.2f}{result['median'] * 1e3:>12.2f}{result['us_per_op']:>12.3f}"
+        )
+    if args.output:
+        outpath = Path(args.output)
+        outpath.parent.mkdir(parents=True, exist_ok=True)
+        outpath.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"\nSaved results to {outpath}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        assert baseline.get("format") == FORMAT, f"Unsupported results format in {args.compare}"
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than {args.threshold}x the baseline")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Write synthetic mapping tables for benchmarks and scaling tests.
+
+The tables have the same file names and columns as the real GNT and
+WLCM mapping files, so they can be read with
+GNTMappings(sourcefile=...) and WLCMMappings(sourcefile=...) without
+downloading data. IDs follow the verse counts (maxVerses) of a bundled
+versification, with a random number of words in each verse, so their
+distribution is like the real data's. Output is deterministic for a
+given seed.
+
+At scale 1, the tables have about as many rows as the real ones:
+larger scales add words to each verse (up to 999, the most a word ID
+can have), so up to 50x is supported.
+
+Usage:
+    poetry run python benchmarks/synthetic.py --outdir /tmp/mappings
+    poetry run python benchmarks/synthetic.py --outdir /tmp/mappings --scale 10 --seed 7
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Iterator
+
+from biblelib.versification import get_versetable
+
+# file names and columns of the real tables (see biblelib.data)
+GNT_FILENAME = "mappings-GNT-stripped.tsv"
+WLCM_FILENAME = "macula_to_marble_map.tsv"
+GNT_HEADER = ["NA1904_ID", "NA1904_Text", "NA27_ID", "NA28_ID", "SBLGNT_ID", "SBLGNT_Text", "MARBLE_ID"]
+WLCM_HEADER = ["MACULA_IDs", "MARBLE_IDs"]
+# the number of rows in the real tables
+GNT_ROWS = 138750
+WLCM_ROWS = 420059
+MAXSCALE = 50
+# decomposed accents, so normalization has work to do
+LETTERS = "αβγδεζηθικλμνξοπρστυφχψω"
+ACCENTS = ["", "\u0301", "\u0300", "\u0342", "\u0313\u0301"]
+PUNCTUATION = ["", "", "", "", "", ",", ".", "·"]
+# relative frequencies of Macula words with 1, 2, or 3 parts
+PARTCOUNTS = [1] * 6 + [2] * 3 + [3]
+
+
+def _verse_words(books: range, rows: int, rng: random.Random, versification: str = "eng") -> Iterator[tuple[str, int]]:
+    """Yield each verse ID in books with a random word count, totalling about rows."""
+    versetable = get_versetable(versification)
+    verses = [
+        f"{book:02d}{chapter:03d}{verse:03d}"
+        for book in books
+        for chapter, lastverse in enumerate(versetable.maxverses[f"{book:02d}"], 1)
+        for verse in range(1, lastverse + 1)
+    ]
+    mean = rows / len(verses)
+    # narrow the spread near the limit of 999 words, so the total stays close to rows
+    deviation = min(mean / 3, (999 - mean) / 3)
+    for verse in verses:
+        yield verse, min(999, max(1, round(rng.gauss(mean, deviation))))
+
+
+def _greek_word(rng: random.Random) -> str:
+    """Return a random Greek word form, with decomposed accents and any punctuation."""
+    word = "".join(rng.choice(LETTERS) + rng.choice(ACCENTS) for _ in range(rng.randint(1, 8)))
+    return word + rng.choice(PUNCTUATION)
+
+
+def _check_scale(scale: float) -> None:
+    """Check the scale factor."""
+    assert 0 < scale <= MAXSCALE, f"scale must be more than 0 and at most {MAXSCALE}: {scale}"
+
+
+def write_gnt_table(path: Path, scale: float = 1.0, seed: int = 42, versification: str = "eng") -> Path:
+    """Write a synthetic GNT mapping TSV to path, and return path.
+
+    As in the real data, a few words are missing from SBLGNT or from
+    MARBLE, and NA1904 and SBLGNT IDs have the "n" canon prefix.
+    """
+    _check_scale(scale)
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as f:
+        f.write("\t".join(GNT_HEADER) + "\n")
+        for verse, words in _verse_words(range(40, 67), round(GNT_ROWS * scale), rng, versification):
+            for word in range(1, words + 1):
+                ID = f"{verse}{word:03d}"
+                text = _greek_word(rng)
+                insblgnt = rng.random() > 0.01
+                marbleid = f"0{verse}{word * 2:05d}" if rng.random() > 0.005 else ""
+                row = [f"n{ID}", text, ID, ID, f"n{ID}" if insblgnt else "", text if insblgnt else "", marbleid]
+                f.write("\t".join(row) + "\n")
+    return path
+
+
+def write_wlcm_table(path: Path, scale: float = 1.0, seed: int = 42, versification: str = "eng") -> Path:
+    """Write a synthetic WLCM mapping TSV to path, and return path.
+
+    As in the real data, some Macula words have more than one part,
+    each with its own space-separated ID.
+    """
+    _check_scale(scale)
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as f:
+        f.write("\t".join(WLCM_HEADER) + "\n")
+        for verse, words in _verse_words(range(1, 40), round(WLCM_ROWS * scale), rng, versification):
+            for word in range(1, words + 1):
+                parts = " ".join(f"o{verse}{word:03d}{part}" for part in range(1, rng.choice(PARTCOUNTS) + 1))
+                f.write(f"{parts}\t0{verse}{word * 2:05d}\n")
+    return path
+
+
+def write_tables(outdir: Path, scale: float = 1.0, seed: int = 42, versification: str = "eng") -> tuple[Path, Path]:
+    """Write synthetic GNT and WLCM mapping tables to outdir, and return their paths."""
+    outdir.mkdir(parents=True, exist_ok=True)
+    return (
+        write_gnt_table(outdir / GNT_FILENAME, scale, seed, versification),
+        write_wlcm_table(outdir / WLCM_FILENAME, scale, seed, versification),
+    )
+
+
+def main() -> None:
+    """Write the tables and report their sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outdir", required=True, help="directory for the mapping files")
+    parser.add_argument("--scale", type=float, default=1.0, help=f"size relative to the real tables (up to {MAXSCALE})")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    parser.add_argument("--versification", default="eng", help="versification scheme for verse counts")
+    args = parser.parse_args()
+    for path in write_tables(Path(args.outdir), args.scale, args.seed, args.versification):
+        with path.open(encoding="utf-8") as f:
+            rows = sum(1 for _ in f) - 1
+        print(f"{path}: {rows} rows, {path.stat().st_size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
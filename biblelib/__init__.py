@@ -6,6 +6,10 @@ This namespace is intentionally bare: see individual packages
 """
 
 import socket
+from typing import Iterable, Optional
+
+# keep this in sync with pyproject.toml
+__version__ = "0.5.4"
 
 
 CANONIDS: set[str] = {
@@ -55,10 +59,23 @@ def has_connection(host: str = "8.8.8.8", port: int = 53, timeout: float = 3.0)
         return False
 
 
+def warmup(components: Optional[Iterable[str]] = None, freeze: bool = True) -> dict[str, float]:
+    """Load and index shared data now, before forking workers.
+
+    See biblelib.preload.warmup(): by default, loads every component.
+    """
+    # imported here so importing biblelib stays cheap
+    from .preload import COMPONENTS
+    from .preload import warmup as _warmup
+
+    return _warmup(COMPONENTS if components is None else components, freeze)
+
+
 __all__ = [
     "CANONIDS",
     "VERSIFICATIONIDS",
     "has_connection",
+    "warmup",
 ]
 
 
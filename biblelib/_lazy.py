@@ -0,0 +1,43 @@
+"""Import names into a package on first access (PEP 562).
+
+A package lists the names it imports lazily, and the modules they come
+from, and gets the module-level __getattr__() and __dir__() functions
+that import them:
+
+```python
+__getattr__, __dir__ = _lazy.attach(__name__, {"BookTrie": "booktrie"})
+```
+
+Keep the same names in an `if TYPE_CHECKING:` import block, so type
+checkers and editors see them.
+
+"""
+
+from importlib import import_module
+import sys
+from typing import Any, Callable
+
+
+def attach(package: str, lazy: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return __getattr__() and __dir__() for package, importing the names in lazy on first access.
+
+    lazy maps a name to the module of package it's imported from. A
+    name that's the same as its module is the module itself.
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Import a lazy name from its module on first access."""
+        module = lazy.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        imported = import_module(f".{module}", package)
+        value = imported if name == module else getattr(imported, name)
+        # later accesses find it directly
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        """Include lazy names."""
+        return sorted(set(vars(sys.modules[package])) | set(lazy))
+
+    return __getattr__, __dir__
@@ -4,15 +4,64 @@
 
 """
 
-from .book import Book, Books, LocalizedBooks, NTCanon, ProtestantCanon, CatholicCanon, get_localized_books
+from typing import TYPE_CHECKING
+
+from biblelib._lazy import attach
+
+from .book import (
+    Book,
+    Books,
+    LocalizedBooks,
+    NTCanon,
+    ProtestantCanon,
+    CatholicCanon,
+    CANONS,
+    book_bits,
+    canon_mask,
+    filter_by_canon,
+    get_localized_books,
+    localized_languages,
+    preload_localized_books,
+    sort_key,
+)
+from .fuzzy import NgramIndex, levenshtein, normalize_bookname
+
+if TYPE_CHECKING:
+    from .booktrie import BookTrie, get_booktrie
+
+# Other names are imported on first access (PEP 562), so importing
+# biblelib.book doesn't compile the book name trie code. Maps a name
+# to its module.
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "BookTrie": "booktrie",
+        "get_booktrie": "booktrie",
+    },
+)
 
 
 __all__ = [
+    # book
     "Book",
     "Books",
     "LocalizedBooks",
     "NTCanon",
     "ProtestantCanon",
     "CatholicCanon",
+    "CANONS",
+    "book_bits",
+    "canon_mask",
+    "filter_by_canon",
     "get_localized_books",
+    "localized_languages",
+    "preload_localized_books",
+    "sort_key",
+    # booktrie
+    "BookTrie",
+    "get_booktrie",
+    # fuzzy
+    "NgramIndex",
+    "levenshtein",
+    "normalize_bookname",
 ]
@@ -48,24 +48,39 @@ To do:
 """
 
 from collections import UserDict
+from copy import copy
 from csv import DictReader
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
 import re
-from typing import Any, Optional, Union
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Union
 import warnings
 
+from biblelib import metrics
+
+from . import tablecache
+from .fuzzy import NgramIndex, normalize_bookname
+
 
 # This directory: where books.tsv is also located.
 BOOKSPATH = Path(__file__).parent
+# metadata comments in books_<lang>.tsv, like "# cv_sep: ."
+_CV_SEP_RE = re.compile(r"^#\s*cv_sep:\s*(.+)$")
+# held while loading localizations and building lookup indexes, which
+# are published only when complete
+_lock = threading.Lock()
 
 
-@dataclass(order=True)
+@dataclass(order=True, frozen=True)
 class Book:
     """Dataclass for managing metadata identifying a book from the Bible.
 
     Typically accessed from Books, which instantiates the full set, or
-    subclasses (pending: for a given canon).
+    subclasses (pending: for a given canon). Instances are shared by
+    every Books instance, so they're frozen.
 
     Attributes:
         logosID (int): the index number of this book in the Logos
@@ -111,8 +126,7 @@ class Book:
     def __hash__(self) -> int:
         """Return a hash code.
 
-        Instances are populated with static data, so they're
-        functionally immutable (but don't change attribute values!).
+        Instances are populated with static data and frozen.
         """
         return hash(self.osisID)
 
@@ -214,21 +228,32 @@ class LocalizedBooks:
     cv_sep: str = field(default=":", init=False)
     _data: dict[str, dict[str, str]] = field(default_factory=dict, init=False, repr=False)
 
+    @metrics.timed("book.LocalizedBooks.load")
     def __post_init__(self) -> None:
         """Load localization data from the TSV file."""
         path = BOOKSPATH / f"books_{self.lang}.tsv"
         if not path.exists():
             raise FileNotFoundError(f"No localization file for language: {self.lang}")
-        with path.open(encoding="utf-8") as f:
-            lines = f.readlines()
+        # parsed once, then read from the table cache
+        cv_sep, self._data = tablecache.load(path, self._parse)
+        if cv_sep:
+            self.cv_sep = cv_sep
+
+    @staticmethod
+    def _parse(text: str) -> tuple[str, dict[str, dict[str, str]]]:
+        """Return the chapter-verse separator (or an empty string) and the names by USFM name from TSV text."""
+        lines = text.splitlines(keepends=True)
+        cv_sep = ""
         # Parse language-level metadata from comment lines (# key: value)
         for line in lines:
-            m = re.match(r"^#\s*cv_sep:\s*(.+)$", line.rstrip())
+            if line[0] != "#":
+                continue
+            m = _CV_SEP_RE.match(line.rstrip())
             if m:
-                self.cv_sep = m.group(1)
+                cv_sep = m.group(1)
                 break
         reader: DictReader = DictReader(filter(lambda row: row[0] != "#", iter(lines)), dialect="excel-tab")
-        self._data = {row["usfmname"]: {"name": row["name"], "abbrev": row["abbrev"]} for row in reader}
+        return cv_sep, {row["usfmname"]: {"name": row["name"], "abbrev": row["abbrev"]} for row in reader}
 
     def get_name(self, usfmname: str) -> str:
         """Return the full localized book name for a USFM name like ``"GEN"``."""
@@ -262,18 +287,168 @@ def get_localized_books(lang: str) -> Optional["LocalizedBooks"]:
         True
 
     """
-    if lang not in _LOCALIZED_BOOKS:
-        try:
-            _LOCALIZED_BOOKS[lang] = LocalizedBooks(lang)
-        except FileNotFoundError:
-            warnings.warn(
-                f"Language '{lang}' is not supported by biblelib; falling back to English.",
-                stacklevel=3,
-            )
-            _LOCALIZED_BOOKS[lang] = None
+    if lang in _LOCALIZED_BOOKS:
+        metrics.cache_hit("book.localized_books")
+        return _LOCALIZED_BOOKS[lang]
+    with _lock:
+        # another thread may have loaded it meanwhile
+        if lang in _LOCALIZED_BOOKS:
+            metrics.cache_hit("book.localized_books")
+        else:
+            metrics.cache_miss("book.localized_books")
+            localized: Optional[LocalizedBooks] = None
+            try:
+                localized = LocalizedBooks(lang)
+            except FileNotFoundError:
+                warnings.warn(
+                    f"Language '{lang}' is not supported by biblelib; falling back to English.",
+                    stacklevel=3,
+                )
+            _LOCALIZED_BOOKS[lang] = localized
     return _LOCALIZED_BOOKS[lang]
 
 
+def localized_languages() -> list[str]:
+    """Return the language codes with a bundled ``books_<lang>.tsv`` file.
+
+    Example::
+
+        >>> "fra" in localized_languages()
+        True
+
+    """
+    return sorted(path.stem[len("books_") :] for path in BOOKSPATH.glob("books_*.tsv"))
+
+
+def preload_localized_books() -> dict[str, "LocalizedBooks"]:
+    """Load and cache every bundled localization, returning them by language code.
+
+    Useful at startup for multilingual serving, so no request pays for
+    reading a localization file.
+    """
+    loaded: dict[str, LocalizedBooks] = {}
+    for lang in localized_languages():
+        localized = get_localized_books(lang)
+        assert localized is not None, f"Failed to load localization for {lang}"
+        loaded[lang] = localized
+    return loaded
+
+
+def _parse_books(text: str) -> list[dict[str, str]]:
+    """Return the rows of a books TSV file's text."""
+    # drop comment lines when reading`
+    reader: DictReader = DictReader(
+        filter(lambda row: row[0] != "#", text.splitlines(keepends=True)), dialect="excel-tab"
+    )
+    # make sure the fieldnames in the file are the same as the
+    # dataclass attributes
+    fieldnameset: set = set(reader.fieldnames[0].split("\t"))
+    assert not fieldnameset.difference(
+        Books.mappingfields
+    ), f"Fieldname discrepancy header: {fieldnameset} vs {Books.mappingfields}"
+    return list(reader)
+
+
+@cache
+def _read_books(source: Path) -> Mapping[str, Book]:
+    """Return a read-only map of USFM names to Book instances from a TSV file.
+
+    Cached so every Books instance shares one copy of the book table,
+    and the parsed rows are kept in the table cache so other processes
+    don't parse the file again.
+    """
+    return MappingProxyType({row["usfmname"]: Books.rowtobook(row) for row in tablecache.load(source, _parse_books)})
+
+
+metrics.register_cache("book.read_books", _read_books)
+
+
+class _FindIndex:
+    """The name indexes used by Books.findbook() and Books.suggestbooks().
+
+    An index depends only on the book tables it's built from, so it's
+    shared by every Books instance with the same tables (see
+    _get_findindex()), and lookups are cached by index and name.
+    """
+
+    def __init__(self, data: Mapping[str, Book], namemap: Mapping[str, Book], quickfixes: Iterable[str]) -> None:
+        """Build the indexes for data and namemap of a Books instance, and its quickfixes names."""
+        # exact names in any scheme: earlier schemes win, as with 'or'
+        self.exact: dict[str, Book] = {book.osisID: book for book in data.values()}
+        self.exact.update({book.biblia: book for book in data.values()})
+        self.exact.update(namemap)
+        self.exact.update(data)
+        # Earlier schemes win where normalized names collide
+        self.findindex: dict[str, Book] = {}
+        for attrname in ("usfmname", "name", "osisID", "biblia", "altname"):
+            for book in data.values():
+                key = normalize_bookname(getattr(book, attrname))
+                if key:
+                    self.findindex.setdefault(key, book)
+        for alt in quickfixes:
+            # a canon's data may not have the book
+            book = data.get(namemap[alt].usfmname)
+            if book:
+                self.findindex.setdefault(normalize_bookname(alt), book)
+        # prefixes that identify only one book
+        prefixbooks: dict[str, set[str]] = {}
+        for key, book in self.findindex.items():
+            for end in range(2, len(key)):
+                prefixbooks.setdefault(key[:end], set()).add(book.usfmname)
+        self.prefixindex: dict[str, Book] = {
+            prefix: data[usfmnames.pop()]
+            for prefix, usfmnames in prefixbooks.items()
+            if len(usfmnames) == 1 and prefix not in self.findindex
+        }
+        self.nameindex: Optional[NgramIndex] = None
+
+    def find(self, bookname: str) -> Optional[Book]:
+        """Return the book for a book name, or None."""
+        book = self.exact.get(bookname)
+        if book is None:
+            key = normalize_bookname(bookname)
+            book = self.findindex.get(key) or self.prefixindex.get(key)
+        return book
+
+    def suggest(self, key: str, maxdistance: int) -> tuple[tuple[Book, int], ...]:
+        """Return (book, edit distance) suggestions for a normalized name, closest first."""
+        if self.nameindex is None:
+            with _lock:
+                if self.nameindex is None:
+                    self.nameindex = NgramIndex(self.findindex)
+        suggestions: dict[str, tuple[Book, int]] = {}
+        for distance, name in self.nameindex.search(key, maxdistance=maxdistance):
+            book = self.findindex[name]
+            if book.usfmname not in suggestions:
+                suggestions[book.usfmname] = (book, distance)
+        return tuple(suggestions.values())
+
+
+@lru_cache(maxsize=32)
+def _get_findindex(
+    data: tuple[tuple[str, Book], ...], names: tuple[tuple[str, Book], ...], quickfixes: tuple[str, ...]
+) -> _FindIndex:
+    """Return the shared _FindIndex for the items of a Books instance's data and namemap, and its quickfixes names."""
+    return _FindIndex(dict(data), dict(names), quickfixes)
+
+
+@lru_cache(maxsize=4096)
+def _findbook(index: _FindIndex, bookname: str) -> Optional[Book]:
+    """Return index.find(bookname), cached."""
+    return index.find(bookname)
+
+
+@lru_cache(maxsize=1024)
+def _suggestbooks(index: _FindIndex, key: str, maxdistance: int) -> tuple[tuple[Book, int], ...]:
+    """Return index.suggest(key, maxdistance), cached."""
+    return index.suggest(key, maxdistance)
+
+
+metrics.register_cache("book.findindex", _get_findindex)
+metrics.register_cache("book.findbook", _findbook)
+metrics.register_cache("book.suggestbooks", _suggestbooks)
+
+
 class Books(UserDict):
     """A canonical collection of Bible Book instances."""
 
@@ -290,10 +465,16 @@ class Books(UserDict):
     osismap: dict = {}
     bibliamap: dict = {}
     usfmnumbermap: dict = {}
+    legacynumbermap: dict = {}
+    # normalized names and unique prefixes for findbook(), and a bigram
+    # index of normalized names for suggestbooks()
+    findindex: dict = {}
+    prefixindex: dict = {}
     # some minor standardization: this is not an extensible approach,
     # and long form names should use a different approach
     quickfixes = {"Psalm": "Psalms", "Song of Solomon": "Song of Songs"}
 
+    @metrics.timed("book.Books")
     def __init__(self, sourcefile: str = "", canon: str = "Protestant") -> None:
         """Initialize a Books instance.
 
@@ -314,16 +495,9 @@ class Books(UserDict):
             raise NotImplementedError("Canon support not yet implemented: default is Protestant.")
         # need smarts here about different canons
         # self.data = [Book(*b) for b in _bookdata]
-        with self.source.open(encoding="utf-8") as f:
-            # drop comment lines when reading`
-            reader: DictReader = DictReader(filter(lambda row: row[0] != "#", f), dialect="excel-tab")
-            # make sure the fieldnames in the file are the same as the
-            # dataclass attributes
-            fieldnameset: set = set(reader.fieldnames[0].split("\t"))
-            assert not fieldnameset.difference(
-                self.mappingfields
-            ), f"Fieldname discrepancy header: {fieldnameset} vs {self.mappingfields}"
-            self.data = {row["usfmname"]: self.rowtobook(row) for row in reader}
+        # the file is read once per process and its Book instances
+        # shared
+        self.data = dict(_read_books(self.source.resolve()))
         # initialize here so you have nameregexp before calling fromname().
         self.namemap = {b.name: b for _, b in self.data.items()}
         # Includes some hacks for common variations
@@ -360,8 +534,10 @@ class Books(UserDict):
             else:
                 logosID = int(logosID)
         if not self.logosmap:
-            # initialize on demand
-            self.logosmap = {b.logosID: b for _, b in self.data.items()}
+            with _lock:
+                if not self.logosmap:
+                    # initialize on demand
+                    self.logosmap = {b.logosID: b for _, b in self.data.items()}
         bookinst: Book = self.logosmap.get(logosID)
         assert bookinst, f"Invalid logoID: {logosID}"
         return bookinst
@@ -384,8 +560,10 @@ class Books(UserDict):
     def _ensure_osismap(self) -> dict[str, str]:
         """Generate the OSIS map if needed."""
         if not self.osismap:
-            # initialize on demand
-            self.osismap = {b.osisID: b for _, b in self.data.items()}
+            with _lock:
+                if not self.osismap:
+                    # initialize on demand
+                    self.osismap = {b.osisID: b for _, b in self.data.items()}
         return self.osismap
 
     def fromosis(self, osisID: str) -> Book:
@@ -403,8 +581,10 @@ class Books(UserDict):
     def _ensure_bibliamap(self) -> dict[str, str]:
         """Generate the Biblia map if needed."""
         if not self.bibliamap:
-            # initialize on demand
-            self.bibliamap = {b.biblia: b for _, b in self.data.items()}
+            with _lock:
+                if not self.bibliamap:
+                    # initialize on demand
+                    self.bibliamap = {b.biblia: b for _, b in self.data.items()}
         return self.bibliamap
 
     def frombiblia(self, biblia: str) -> Book:
@@ -419,6 +599,30 @@ class Books(UserDict):
         assert bookinst, f"Invalid Biblia book name: {biblia}"
         return bookinst
 
+    def _ensure_usfmnumbermap(self) -> dict[str, Book]:
+        """Generate the USFM number map if needed."""
+        if not self.usfmnumbermap:
+            with _lock:
+                if not self.usfmnumbermap:
+                    # initialize on demand
+                    self.usfmnumbermap = {b.usfmnumber: b for _, b in self.data.items()}
+        return self.usfmnumbermap
+
+    def _ensure_legacynumbermap(self) -> dict[str, Book]:
+        """Generate the legacy USFM number map if needed."""
+        if not self.legacynumbermap:
+            with _lock:
+                if not self.legacynumbermap:
+                    # maps "41" -> "40", etc. through 67/66, for the legacy
+                    # numbering system that assigns 41 to MAT. The resulting book
+                    # instance uses non-legacy numbers: this is just to get to the
+                    # right Book instance.
+                    _legacynumbermap = {str(i): str(i + 1) for i in list(range(40, 67))}
+                    self.legacynumbermap = {
+                        _legacynumbermap.get(b.usfmnumber, b.usfmnumber): b for _, b in self.data.items()
+                    }
+        return self.legacynumbermap
+
     def fromusfmnumber(self, usfmnumber: str, legacynumbering: bool = False) -> Book:
         """Return the book instance for a USFM number.
 
@@ -430,16 +634,10 @@ class Books(UserDict):
                 are numbered.
 
         """
-        # maps "41" -> "40", etc. through 67/66, for the legacy
-        # numbering system that assigns 41 to MAT. The resulting book
-        # instance uses non-legacy numbers: this is just to get to the
-        # right Book instance.
-        _legacynumbermap = {str(i): str(i + 1) for i in list(range(40, 67))}
         if legacynumbering:
-            usfmnumbermap = {_legacynumbermap.get(b.usfmnumber, b.usfmnumber): b for _, b in self.data.items()}
+            usfmnumbermap = self._ensure_legacynumbermap()
         else:
-            usfmnumbermap = {b.usfmnumber: b for _, b in self.data.items()}
-        #        return usfmnumbermap[usfmnumber]
+            usfmnumbermap = self._ensure_usfmnumbermap()
         bookinst: Book = usfmnumbermap.get(usfmnumber)
         assert bookinst, f"Invalid USFM number: {usfmnumber}"
         return bookinst
@@ -456,35 +654,69 @@ class Books(UserDict):
         ref: str = getattr(bookinst, style)
         return ref
 
-    def findbook(self, bookname: str) -> Book:
+    def build_indexes(self) -> None:
+        """Build all the lookup indexes now, rather than on first use."""
+        self._ensure_osismap()
+        self._ensure_bibliamap()
+        self._ensure_usfmnumbermap()
+        self._ensure_legacynumbermap()
+        self._ensure_findindex()
+
+    def _ensure_findindex(self) -> dict[str, Book]:
+        """Generate the normalized name and prefix indexes if needed."""
+        if not self.findindex:
+            with _lock:
+                if not self.findindex:
+                    self._build_findindex()
+        return self.findindex
+
+    def _build_findindex(self) -> None:
+        """Get the shared name indexes for this instance's books and names."""
+        self._findindex = _get_findindex(tuple(self.data.items()), tuple(self.namemap.items()), tuple(self.quickfixes))
+        self.prefixindex = self._findindex.prefixindex
+        # publish last: other threads use everything above once this is set
+        self.findindex = self._findindex.findindex
+
+    def findbook(self, bookname: str, fuzzy: bool = False) -> Book:
         """Find the book instance for a book name.
 
-        Case must match. If not found in any name map, raise a
-        ValueError.
+        Exact matches in any naming scheme are tried first. Otherwise,
+        case, accents, spaces, and periods are ignored, and a prefix
+        that identifies only one book also matches ("matth",
+        "1 sam"). With fuzzy, the closest name within an edit
+        distance of 2 matches, if only one book is that close. If
+        no book matches, raise a ValueError.
 
-        This may require looking at multiple naming schemes to find a
-        match. The first match is returned, but i don't believe order
-        consulted should change results.
+        Lookups are cached, so repeated names are fast.
 
         Args:
             bookname: the abbreviation or full name to use in looking up the Book,
                 like 'MATT', 'MRK, or "Matthew".
+            fuzzy: if True, allow misspelled names
 
         """
         # some minor standardization: this is not an extensible
         # approach, and long form names should use a different
         # approach
         bookname = self.quickfixes.get(bookname, bookname)
-        namemaps = [self.data, self.namemap, self.logosmap, self.bibliamap, self.osismap]
-        # there's probably a smarter way
-        self._ensure_osismap()
-        self._ensure_bibliamap()
-        for namemap in namemaps:
-            if bookname in namemap:
-                book: Book = namemap[bookname]
-                return book
-        else:
+        self._ensure_findindex()
+        book: Optional[Book] = _findbook(self._findindex, bookname)
+        if book is None and fuzzy:
+            suggestions = self.suggestbooks(bookname, limit=2)
+            if len(suggestions) == 1 or (len(suggestions) == 2 and suggestions[0][1] < suggestions[1][1]):
+                book = suggestions[0][0]
+        if book is None:
             raise ValueError(f"Book name not found: {bookname}")
+        return book
+
+    def suggestbooks(self, bookname: str, maxdistance: int = 2, limit: int = 5) -> list[tuple[Book, int]]:
+        """Return up to limit (book, edit distance) suggestions for a book name, closest first.
+
+        Names are compared after normalizing as for findbook().
+        Suggestions are cached, so repeated names are fast.
+        """
+        self._ensure_findindex()
+        return list(_suggestbooks(self._findindex, normalize_bookname(bookname), maxdistance)[:limit])
 
 
 class _Canon(Books):
@@ -496,14 +728,25 @@ class _Canon(Books):
         """Initialize a Books instance for a Canon."""
         super().__init__(*args, **kwargs)
         # reset the data to only recognized bookids, adding an ordinal
-        # for ordering
+        # for ordering. Copy each book so the ordinal doesn't leak into
+        # other canons that share the same Book instances
         srcdata = self.data
         self.data = {}
         for index, bookid in enumerate(self.bookids):
-            book = srcdata[bookid]
-            book.ordinal = index
+            book = copy(srcdata[bookid])
+            # the copy is private to this canon, so setting it on the
+            # frozen instance is safe
+            object.__setattr__(book, "ordinal", index)
             self.data[bookid] = book
 
+    def sort_key(self) -> Callable[[str], str]:
+        """Return a sort key function for ID strings in this canon's order: see sort_key()."""
+        return sort_key(type(self))
+
+    def mask(self) -> int:
+        """Return the membership bitmask for this canon: see canon_mask()."""
+        return canon_mask(type(self))
+
 
 class NTCanon(_Canon):
     """Return an Book instance representing the New Testament canon."""
@@ -554,3 +797,129 @@ class CatholicCanon(_Canon):
 
 
 # maybe subclass Books for specific canons??
+
+
+# canon names for sort_key()
+CANONS: dict[str, type[_Canon]] = {"nt": NTCanon, "protestant": ProtestantCanon, "catholic": CatholicCanon}
+
+
+CanonSpec = Union[str, type[_Canon], _Canon]
+
+
+def _canonclass(canon: CanonSpec) -> type[_Canon]:
+    """Return the _Canon subclass for a canon name, class, or instance."""
+    if isinstance(canon, str):
+        assert canon.lower() in CANONS, f"Unknown canon: {canon}"
+        return CANONS[canon.lower()]
+    return canon if isinstance(canon, type) else type(canon)
+
+
+@cache
+def _canon_sortprefixes(canonclass: type[_Canon]) -> Mapping[str, str]:
+    """Return an immutable map from book ID to a sortable rank prefix for a canon.
+
+    Books in the canon rank first, in canon order; other books follow
+    in book ID order.
+    """
+    books = Books()
+    canonids = [books[usfmname].usfmnumber for usfmname in canonclass.bookids]
+    otherids = sorted(book.usfmnumber for book in books.values() if book.usfmnumber not in canonids)
+    return MappingProxyType({book_ID: str(rank).zfill(3) for rank, book_ID in enumerate(canonids + otherids)})
+
+
+def sort_key(canon: CanonSpec = "Protestant") -> Callable[[str], str]:
+    """Return a function mapping an ID string to a sort key for a canon's book order.
+
+    The canon is a name ("NT", "Protestant", or "Catholic"), or a
+    _Canon subclass or instance. Keys replace the book ID with the
+    book's rank in the canon, so IDs sort by canon order and then by
+    chapter, verse, and word. Use it with sorted() or bisect on
+    BCVID, BCVWPID, or mixed ID strings, with or without a Macula
+    canon prefix ("n" or "o"):
+
+        >>> catholic = sort_key("Catholic")
+        >>> sorted(["41004003", "16001001", "68001001", "41004003001"], key=catholic)
+        ['16001001', '68001001', '41004003', '41004003001']
+
+    For reference instances, use a key like `lambda ref: catholic(ref.ID)`.
+    """
+    prefixes = _canon_sortprefixes(_canonclass(canon))
+
+    def key(ID: str) -> str:
+        if ID[0] in "no":
+            ID = ID[1:]
+        return prefixes[ID[:2]] + ID[2:]
+
+    return key
+
+
+@cache
+def book_bits() -> Mapping[str, int]:
+    """Return a read-only map from book ID (like "41") to its bit in canon masks.
+
+    Bits follow the order of books.tsv.
+    """
+    return MappingProxyType({book.usfmnumber: bit for bit, book in enumerate(Books().values())})
+
+
+@cache
+def _canon_mask(canonclass: type[_Canon]) -> int:
+    """Return the membership bitmask for a canon class."""
+    books = Books()
+    bits = book_bits()
+    mask = 0
+    for usfmname in canonclass.bookids:
+        mask |= 1 << bits[books[usfmname].usfmnumber]
+    return mask
+
+
+def canon_mask(canon: CanonSpec = "Protestant") -> int:
+    """Return a bitmask of the books in a canon, with bits from book_bits().
+
+    Masks combine with the usual integer operators:
+
+        >>> nt = canon_mask("NT")
+        >>> canon_mask("Protestant") & nt == nt
+        True
+        >>> bin(canon_mask("Catholic") & ~canon_mask("Protestant")).count("1")
+        8
+
+    """
+    return _canon_mask(_canonclass(canon))
+
+
+def filter_by_canon(
+    ids: Iterable[Union[str, int]], canon: Union[CanonSpec, int] = "Protestant", digits: int = 6
+) -> Iterator[Union[str, int]]:
+    """Yield the IDs from ids whose books are in a canon.
+
+    Works lazily over any iterable, so token streams needn't fit in
+    memory. The canon is a name, a _Canon subclass or instance, or a
+    mask from canon_mask() (so unions and differences of canons work
+    too).
+
+    IDs are strings like BCVID or BCVWPID identifiers, with or
+    without a Macula canon prefix ("n" or "o"), or ints packed from
+    numeric IDs, with digits digits after the book number: 6 for BCV
+    IDs (the default), 9 for BCVW, 10 for BCVWP. IDs for unknown books
+    are dropped.
+
+        >>> list(filter_by_canon(["01001001", "41004003", "68001001"], "NT"))
+        ['41004003']
+        >>> list(filter_by_canon([1001001, 41004003001], "NT", digits=9))
+        [41004003001]
+
+    """
+    mask = canon if isinstance(canon, int) else canon_mask(canon)
+    bits = book_bits()
+    # expand the mask once into lookup tables for strings and ints
+    strmembers = frozenset(book_ID for book_ID, bit in bits.items() if mask >> bit & 1)
+    intmembers = [str(booknum).zfill(2) in strmembers for booknum in range(100)]
+    divisor = 10**digits
+    for ID in ids:
+        if isinstance(ID, int):
+            booknum = ID // divisor
+            if booknum < 100 and intmembers[booknum]:
+                yield ID
+        elif ID[:2] in strmembers or (ID[0] in "no" and ID[1:3] in strmembers):
+            yield ID
@@ -0,0 +1,152 @@
+"""Find localized book names at the start of reference strings.
+
+A BookTrie indexes every book name and abbreviation from books.tsv
+(as language "eng") and each bundled books_<lang>.tsv. Keys are
+normalized: case-folded, with accents, spaces, and periods removed, so
+"Genèse", "genese", and "GENÈSE." all match. Because matching walks
+the trie one character at a time, no tokenizing is needed: this
+handles names with spaces ("1 Corinthiens") and references with no
+space before the chapter ("马可福音4:3").
+
+Where normalization makes two names collide within a language (like
+"Jó" and "Jo" in Portuguese), the accent-preserving spelling decides.
+
+>>> from biblelib.book.booktrie import get_booktrie
+>>> trie = get_booktrie()
+>>> trie.match("Genèse 1.1", lang="fra")
+('GEN', 6)
+>>> trie.match("1 corinthiens 13", lang="fra")
+('1CO', 13)
+>>> trie.match("Mc 4.3")
+('MRK', 2)
+
+"""
+
+from functools import cache
+from typing import Any, Optional
+
+from .book import Books, get_localized_books, localized_languages
+from .fuzzy import _IGNORABLE, _fold, normalize_bookname
+
+# trie node key for the values at a terminal node
+_VALUES = ""
+
+
+def _exactkey(name: str) -> str:
+    """Return a case-folded key for name that keeps accents."""
+    return "".join(char for char in name if char not in _IGNORABLE).casefold()
+
+
+class BookTrie:
+    """A trie of normalized book names, mapping to USFM book names by language.
+
+    Each terminal node holds a dict mapping a language code to a dict
+    of accent-preserving keys to USFM names. The first name added
+    wins when two books share an exact key within a language.
+
+    Attributes:
+        languages: the language codes added to the trie
+
+    """
+
+    def __init__(self) -> None:
+        """Instantiate an empty BookTrie."""
+        self.root: dict[str, Any] = {}
+        self.languages: list[str] = []
+
+    def add(self, name: str, usfmname: str, lang: str) -> None:
+        """Add a book name for a USFM book name in lang."""
+        key = normalize_bookname(name)
+        if not key:
+            return
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        values: dict[str, dict[str, str]] = node.setdefault(_VALUES, {})
+        values.setdefault(lang, {}).setdefault(_exactkey(name), usfmname)
+        if lang not in self.languages:
+            self.languages.append(lang)
+
+    def _select(self, values: dict[str, dict[str, str]], exact: str, lang: Optional[str]) -> Optional[str]:
+        """Return the USFM name from a terminal node for lang, or None."""
+        if lang:
+            # prefer the requested language, then English
+            candidates = values.get(lang) or values.get("eng")
+            if not candidates:
+                return None
+            return candidates.get(exact) or next(iter(candidates.values()))
+        usfmnames = {usfmname for candidates in values.values() for usfmname in candidates.values()}
+        if len(usfmnames) == 1:
+            return usfmnames.pop()
+        # ambiguous across languages: prefer an exact English match
+        english = values.get("eng", {})
+        return english.get(exact)
+
+    def matches(self, text: str, lang: Optional[str] = None) -> list[tuple[str, int]]:
+        """Return (USFM name, end index) for each book name at the start of text, shortest first.
+
+        With lang, only names from that language (or English) match.
+        Without lang, names that mean different books in different
+        languages match only if they are an English name.
+        """
+        node = self.root
+        exact: list[str] = []
+        found: list[tuple[str, int]] = []
+        skipped = False
+        for index, char in enumerate(text):
+            if char in _IGNORABLE:
+                # skip periods and spaces within a name
+                skipped = node is not self.root
+                continue
+            if skipped and char.isdigit():
+                # a number after a space continues a name only if the
+                # name has a space there too, like "Psalm 151"
+                node = node.get(" ")
+                if node is None:
+                    break
+            skipped = False
+            for folded in _fold(char):
+                node = node.get(folded)
+                if node is None:
+                    break
+            if node is None:
+                break
+            exact.append(char.casefold())
+            values = node.get(_VALUES)
+            if values:
+                usfmname = self._select(values, "".join(exact), lang)
+                if usfmname:
+                    found.append((usfmname, index + 1))
+        return found
+
+    def match(self, text: str, lang: Optional[str] = None) -> tuple[str, int]:
+        """Return the USFM name for the longest book name at the start of text, and its end index.
+
+        Raises ValueError if no book name matches.
+        """
+        found = self.matches(text, lang=lang)
+        if not found:
+            raise ValueError(f"No book name found in {text!r}" + (f" for language {lang!r}" if lang else ""))
+        return found[-1]
+
+
+def build_booktrie() -> BookTrie:
+    """Return a BookTrie with English names and every bundled localization."""
+    trie = BookTrie()
+    for book in Books().values():
+        for name in (book.usfmname, book.osisID, book.biblia, book.name, book.altname):
+            if name:
+                trie.add(name, book.usfmname, "eng")
+    for lang in localized_languages():
+        localized = get_localized_books(lang)
+        assert localized is not None, f"Failed to load localization for {lang}"
+        for usfmname, entry in localized._data.items():
+            trie.add(entry["name"], usfmname, lang)
+            trie.add(entry["abbrev"], usfmname, lang)
+    return trie
+
+
+@cache
+def get_booktrie() -> BookTrie:
+    """Return the shared BookTrie, building it on first use."""
+    return build_booktrie()
@@ -0,0 +1,136 @@
+"""Normalized and approximate string matching for book names.
+
+normalize_bookname() returns the case-folded, accent-free key that
+BookTrie and Books.findbook() use to compare book names.
+
+An NgramIndex finds strings within a small Levenshtein edit distance
+of a query, comparing only candidates that share enough bigrams.
+
+>>> from biblelib.book.fuzzy import NgramIndex, levenshtein, normalize_bookname
+>>> normalize_bookname("GENÈSE.")
+'genese'
+>>> levenshtein("genisis", "genesis")
+1
+>>> index = NgramIndex(["genesis", "exodus", "leviticus"])
+>>> index.search("genisis", maxdistance=2)
+[(1, 'genesis')]
+
+"""
+
+from functools import cache
+import unicodedata
+from typing import Iterable
+
+# characters skipped in names, like "1 Cor." for "1Cor"
+_IGNORABLE = frozenset(" \t.")
+
+
+@cache
+def _fold(char: str) -> str:
+    """Return the case-folded, accent-free form of a single character."""
+    return "".join(c for c in unicodedata.normalize("NFKD", char) if not unicodedata.combining(c)).casefold()
+
+
+def normalize_bookname(name: str) -> str:
+    """Return the normalized key for a book name.
+
+    Spaces and periods are dropped, except that a space before a
+    number within a name is kept, so "Psalm 151" and "PS3" stay
+    distinct from a chapter reference like "Ps 3".
+
+    >>> normalize_bookname("1 Corinthiens")
+    '1corinthiens'
+    >>> normalize_bookname("Genèse.")
+    'genese'
+    >>> normalize_bookname("Psalm 151")
+    'psalm 151'
+
+    """
+    key: list[str] = []
+    skipped = False
+    for char in name:
+        if char in _IGNORABLE:
+            skipped = bool(key)
+            continue
+        if skipped and char.isdigit():
+            key.append(" ")
+        skipped = False
+        key.append(_fold(char))
+    return "".join(key)
+
+
+def levenshtein(first: str, second: str) -> int:
+    """Return the edit distance between two strings."""
+    if first == second:
+        return 0
+    if len(first) < len(second):
+        first, second = second, first
+    previous = list(range(len(second) + 1))
+    for i, firstchar in enumerate(first):
+        left = i + 1
+        current = [left]
+        for j, secondchar in enumerate(second):
+            # substitution, then deletion and insertion
+            cost = previous[j] if firstchar == secondchar else previous[j] + 1
+            if previous[j + 1] + 1 < cost:
+                cost = previous[j + 1] + 1
+            if left + 1 < cost:
+                cost = left + 1
+            current.append(cost)
+            left = cost
+        previous = current
+    return previous[-1]
+
+
+def _bigrams(word: str) -> list[str]:
+    """Return the bigrams of word, padded so the first and last characters count."""
+    padded = f"^{word}$"
+    return [padded[i : i + 2] for i in range(len(padded) - 1)]
+
+
+class NgramIndex:
+    """An index of strings by bigram, for bounded edit-distance search.
+
+    Each edit changes at most two bigrams, so a string within edit
+    distance k of a query shares at least (bigrams in the query - 2k)
+    bigrams with it. Only strings passing that filter, and within k
+    in length, are compared with levenshtein().
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        """Instantiate an NgramIndex containing words."""
+        self.words: set[str] = set()
+        self.postings: dict[str, list[str]] = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        """Return the number of words in the index."""
+        return len(self.words)
+
+    def add(self, word: str) -> None:
+        """Add word to the index, if it's not already present."""
+        if word in self.words:
+            return
+        self.words.add(word)
+        for bigram in set(_bigrams(word)):
+            self.postings.setdefault(bigram, []).append(word)
+
+    def search(self, word: str, maxdistance: int = 2) -> list[tuple[int, str]]:
+        """Return (distance, word) pairs within maxdistance of word, closest first.
+
+        Candidates must share at least one bigram with word, so very
+        short words may miss some matches.
+        """
+        bigrams = _bigrams(word)
+        threshold = max(1, len(bigrams) - 2 * maxdistance)
+        counts: dict[str, int] = {}
+        for bigram in set(bigrams):
+            for candidate in self.postings.get(bigram, ()):
+                counts[candidate] = counts.get(candidate, 0) + 1
+        results = [
+            (levenshtein(word, candidate), candidate)
+            for candidate, count in counts.items()
+            if count >= threshold and abs(len(candidate) - len(word)) <= maxdistance
+        ]
+        return sorted(result for result in results if result[0] <= maxdistance)
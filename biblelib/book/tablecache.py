@@ -0,0 +1,113 @@
+"""Cache parsed book tables on disk, so new processes skip parsing TSV files.
+
+Every process that uses Books or LocalizedBooks otherwise parses
+``books.tsv`` or ``books_<lang>.tsv`` with a csv.DictReader. load()
+instead saves what a parse function returns with :mod:`marshal`, and
+later processes read that back. The file name of each cached table is
+a hash of
+
+* the content of the source file,
+* the parse function,
+* the Biblelib version and cache format, and
+* the Python version (the marshal format can change between versions),
+
+so a changed source file or a new release is parsed again rather than
+read from a stale cache. A cached table that can't be read, or that
+doesn't match its key, is parsed again too, and if the cache directory
+isn't writable, tables are simply parsed each time.
+
+Cached tables are kept in a ``tables`` directory of the Biblelib data
+cache (see biblelib.data, and the ``BIBLELIB_DATA_DIR`` environment
+variable). Set the ``BIBLELIB_TABLE_CACHE`` environment variable to
+``0`` to always parse the source files.
+
+"""
+
+from contextlib import suppress
+import hashlib
+import marshal
+import os
+from pathlib import Path
+import sys
+from typing import Any, Callable, TypeVar
+
+from biblelib import __version__, metrics
+
+# bump this when what's cached changes without a new release
+_FORMAT = 1
+_T = TypeVar("_T")
+
+
+def is_enabled() -> bool:
+    """Return True unless caching is turned off with BIBLELIB_TABLE_CACHE."""
+    return os.environ.get("BIBLELIB_TABLE_CACHE", "").lower() not in ("0", "false", "no", "off")
+
+
+def cachedir() -> Path:
+    """Return the directory for cached tables.
+
+    This is the same data cache as biblelib.data, found without
+    importing pooch, which is slow to import.
+    """
+    datadir = os.environ.get("BIBLELIB_DATA_DIR")
+    if datadir:
+        base = Path(datadir)
+    elif sys.platform == "win32":
+        # platformdirs adds the app author, which pooch sets to the app name
+        localappdata = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        base = Path(localappdata) / "biblelib" / "biblelib" / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / "biblelib"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "biblelib"
+    return base / "tables"
+
+
+def cachekey(content: bytes, parse: Callable[[str], Any]) -> str:
+    """Return the cache key for source content parsed with parse."""
+    digest = hashlib.blake2b(content, digest_size=16)
+    # parse may be a callable instance
+    name = getattr(parse, "__qualname__", type(parse).__qualname__)
+    context = f"{parse.__module__}.{name}|{__version__}|{_FORMAT}|{sys.version_info[:2]}"
+    digest.update(context.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load(source: Path, parse: Callable[[str], _T]) -> _T:
+    """Return parse() of the text of source, from the cache if possible.
+
+    parse must depend only on the text, and return data marshal can
+    save (like tuples, lists and dicts of strings and numbers): data it
+    can't save is returned but not cached.
+    """
+    content = source.read_bytes()
+    if not is_enabled():
+        return parse(content.decode("utf-8"))
+    key = cachekey(content, parse)
+    cachepath = cachedir() / f"{source.stem}-{key}.marshal"
+    try:
+        storedkey, parsed = marshal.loads(cachepath.read_bytes())
+        # guard against a truncated or overwritten file that happens to unmarshal
+        if storedkey == key:
+            metrics.cache_hit("book.tablecache")
+            return parsed  # type: ignore[no-any-return]
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    metrics.cache_miss("book.tablecache")
+    parsed = parse(content.decode("utf-8"))
+    _save(cachepath, (key, parsed))
+    return parsed
+
+
+def _save(cachepath: Path, value: Any) -> None:
+    """Write value to cachepath atomically, or do nothing if that fails."""
+    tmppath = cachepath.with_name(f"{cachepath.name}.{os.getpid()}.tmp")
+    try:
+        cachepath.parent.mkdir(parents=True, exist_ok=True)
+        tmppath.write_bytes(marshal.dumps(value))
+        # readers see the whole old file or the whole new one
+        os.replace(tmppath, cachepath)
+    except (OSError, ValueError):
+        # read-only or full disk, or data marshal can't save
+        with suppress(OSError):
+            tmppath.unlink(missing_ok=True)
@@ -26,6 +26,8 @@ from pathlib import Path
 
 import pooch
 
+from biblelib import metrics
+
 # Data-file names (also the keys used in the pooch registry).
 GNT_MAPPINGS = "mappings-GNT-stripped.tsv"
 WLCM_MAPPINGS = "macula_to_marble_map.tsv"
@@ -61,6 +63,7 @@ POOCH_STORE = pooch.create(
 )
 
 
+@metrics.timed("data.fetch")
 def fetch(name: str) -> Path:
     """Return a local path to a data file, downloading and verifying on first use.
 
@@ -69,6 +72,11 @@ def fetch(name: str) -> Path:
     file cannot be obtained (e.g. offline with an empty cache, or a hash
     mismatch).
     """
+    if metrics.is_enabled():
+        if (Path(POOCH_STORE.abspath) / name).exists():
+            metrics.cache_hit("data.fetch")
+        else:
+            metrics.cache_miss("data.fetch")
     try:
         return Path(POOCH_STORE.fetch(name))
     except Exception as err:
@@ -0,0 +1,210 @@
+"""Opt-in counters and timers for Biblelib's hot paths.
+
+Metrics are off by default, and then cost no more than a flag check.
+Enable them by setting the ``BIBLELIB_METRICS`` environment variable
+to ``1`` before importing Biblelib, or by calling :func:`enable`.
+
+When enabled, Biblelib times data fetches, mapping table loads and
+index builds, ``Books()`` construction, localization loads, and
+``VrefReader`` loads, and records cache hits and misses. Call
+:func:`snapshot` for the current values, or add a sink with
+:func:`add_sink` to forward each measurement to your own monitoring.
+
+>>> from biblelib import metrics
+>>> metrics.enable()
+>>> from biblelib.book import Books
+>>> _ = Books()
+>>> metrics.snapshot()["timers"]["book.Books"]["count"] >= 1
+True
+>>> metrics.disable()
+>>> metrics.reset()
+
+"""
+
+import os
+import threading
+import warnings
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Iterator, TypeVar
+
+# a sink is called with the kind of measurement ("count", "time",
+# "hit", or "miss"), its name, and its value (seconds for "time")
+Sink = Callable[[str, str, float], None]
+_FuncT = TypeVar("_FuncT", bound=Callable[..., Any])
+
+_enabled: bool = os.environ.get("BIBLELIB_METRICS", "").lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_counters: dict[str, int] = {}
+# maps a timer name to [count, total seconds, maximum seconds]
+_timers: dict[str, list[float]] = {}
+# maps a cache name to [hits, misses]
+_cachestats: dict[str, list[int]] = {}
+# functools caches, reported from their cache_info()
+_caches: dict[str, Callable[..., Any]] = {}
+_sinks: list[Sink] = []
+
+
+def enable() -> None:
+    """Start recording metrics."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording metrics. Values recorded so far are kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True if metrics are being recorded."""
+    return _enabled
+
+
+def add_sink(sink: Sink) -> None:
+    """Call sink with each measurement as it's recorded.
+
+    Sinks are called synchronously, so they should be fast (like
+    incrementing a client-side counter). An exception in a sink is
+    reported as a warning rather than raised.
+    """
+    with _lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: Sink) -> None:
+    """Stop calling sink."""
+    with _lock:
+        _sinks.remove(sink)
+
+
+def _emit(kind: str, name: str, value: float) -> None:
+    """Pass a measurement to each sink."""
+    for sink in _sinks:
+        try:
+            sink(kind, name, value)
+        except Exception as err:
+            warnings.warn(f"Metrics sink {sink!r} failed: {err!r}", stacklevel=3)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add value to the counter name, if metrics are enabled."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+    _emit("count", name, value)
+
+
+def record_time(name: str, seconds: float) -> None:
+    """Record a duration for the timer name, if metrics are enabled."""
+    if not _enabled:
+        return
+    with _lock:
+        stats = _timers.get(name)
+        if stats is None:
+            _timers[name] = [1, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+    _emit("time", name, seconds)
+
+
+def cache_hit(name: str) -> None:
+    """Record a hit for the cache name, if metrics are enabled."""
+    if not _enabled:
+        return
+    with _lock:
+        _cachestats.setdefault(name, [0, 0])[0] += 1
+    _emit("hit", name, 1)
+
+
+def cache_miss(name: str) -> None:
+    """Record a miss for the cache name, if metrics are enabled."""
+    if not _enabled:
+        return
+    with _lock:
+        _cachestats.setdefault(name, [0, 0])[1] += 1
+    _emit("miss", name, 1)
+
+
+def register_cache(name: str, func: Callable[..., Any]) -> None:
+    """Report the hits and misses of a functools cache as the cache name.
+
+    These come from func.cache_info(), which functools always keeps,
+    so they're included in snapshots even when metrics are disabled.
+    """
+    _caches[name] = func
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Time the body of a with statement as name, if metrics are enabled."""
+    if not _enabled:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        record_time(name, perf_counter() - start)
+
+
+def timed(name: str) -> Callable[[_FuncT], _FuncT]:
+    """Decorate a function to time each call as name, if metrics are enabled."""
+
+    def decorate(func: _FuncT) -> _FuncT:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_time(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def snapshot() -> dict[str, Any]:
+    """Return the current metrics.
+
+    The result has:
+    - enabled: whether metrics are being recorded
+    - counters: maps a name to its count
+    - timers: maps a name to its count, and total, mean, and maximum seconds
+    - caches: maps a name to its hits, misses, and hit rate
+    """
+    with _lock:
+        timers = {
+            name: {"count": int(calls), "total": total, "mean": total / calls, "max": maximum}
+            for name, (calls, total, maximum) in _timers.items()
+        }
+        cachestats = {name: tuple(stats) for name, stats in _cachestats.items()}
+        counters = dict(_counters)
+    for name, func in _caches.items():
+        info = func.cache_info()
+        cachestats[name] = (info.hits, info.misses)
+    caches = {
+        name: {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
+        for name, (hits, misses) in sorted(cachestats.items())
+    }
+    return {"enabled": _enabled, "counters": counters, "timers": timers, "caches": caches}
+
+
+def reset() -> None:
+    """Clear recorded counters, timers, and cache statistics.
+
+    Registered functools caches keep their own statistics: clear those
+    with their cache_clear().
+    """
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+        _cachestats.clear()
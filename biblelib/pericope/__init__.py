@@ -4,9 +4,11 @@ A pericope is a short, conventionalized unit of Bible text. Each verse
 belongs to exactly one pericope within a given edition's pericope set.
 """
 
-from .pericope import Pericope, PericopeDict
+from .pericope import Pericope, PericopeDict, get_pericopedict, pericope_editions
 
 __all__ = [
     "Pericope",
     "PericopeDict",
+    "get_pericopedict",
+    "pericope_editions",
 ]
@@ -31,6 +31,7 @@ from __future__ import annotations
 import csv
 from collections import UserDict
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
@@ -263,3 +264,15 @@ class PericopeDict(UserDict):
     def get_book_pericopes(self, bid: BID) -> list[Pericope]:
         """Return the complete list of pericopes for this book."""
         return [p for p in self.data.values() if p.book == bid]
+
+
+def pericope_editions() -> list[tuple[str, str]]:
+    """Return the (language, version) of each bundled pericope file."""
+    editions = (path.stem[len("pericopes_") :].split("_", 1) for path in _PERICOPE_DIR.glob("pericopes_*.tsv"))
+    return sorted((language, version) for language, version in editions)
+
+
+@cache
+def get_pericopedict(language: str = "eng", version: str = "BSB") -> PericopeDict:
+    """Return the shared PericopeDict for language and version, loading it on first use."""
+    return PericopeDict(language=language, version=version)
@@ -0,0 +1,119 @@
+"""Load and index shared data up front, before forking worker processes.
+
+Biblelib loads its data lazily: the first call that needs book data,
+a localization, a versification table, pericopes, or the MARBLE
+mapping tables reads the file and builds any lookup indexes. In a
+pre-fork server (like gunicorn with ``preload_app``) each worker would
+then load its own copy. Calling :func:`warmup` in the parent process
+instead loads everything once, so workers share it.
+
+Sharing only lasts as long as pages aren't written. CPython writes
+to an object whenever its reference count changes, and the cyclic
+garbage collector writes to every tracked object it scans. Since
+``gc.freeze()`` moves everything loaded so far into a permanent
+generation the collector ignores, :func:`warmup` calls it by default
+after loading (reference counting still touches objects that workers
+use, but not the rest).
+
+>>> from biblelib.preload import warmup
+>>> timings = warmup(["books", "versification"], freeze=False)
+>>> sorted(timings)
+['books', 'versification']
+
+"""
+
+import gc
+from time import perf_counter
+from typing import Callable, Iterable
+
+from biblelib import VERSIFICATIONIDS, metrics
+
+# in the order they're loaded
+COMPONENTS: tuple[str, ...] = ("books", "localizations", "versification", "pericopes", "gnt", "wlcm")
+
+
+def _books() -> None:
+    """Build the indexes of the module-level Books instances, and the book trie."""
+    from biblelib.book.booktrie import get_booktrie
+    from biblelib.unit import reflist, unitrange
+    from biblelib.word import bcvwpid, localref, refrender
+
+    for module in (bcvwpid, localref, refrender, reflist, unitrange):
+        module.BOOKS.build_indexes()
+    get_booktrie()
+
+
+def _localizations() -> None:
+    """Load every bundled localization, and compile its renderers."""
+    from biblelib.book import preload_localized_books
+    from biblelib.word.refrender import preload_refrenderers
+
+    preload_localized_books()
+    preload_refrenderers()
+
+
+def _versification() -> None:
+    """Load the verse table for each versification scheme."""
+    from biblelib.versification import get_versetable
+
+    for scheme in sorted(VERSIFICATIONIDS):
+        get_versetable(scheme)
+
+
+def _pericopes() -> None:
+    """Load each bundled set of pericopes."""
+    from biblelib.pericope import get_pericopedict, pericope_editions
+
+    for language, version in pericope_editions():
+        get_pericopedict(language, version)
+
+
+def _gnt() -> None:
+    """Load the shared GNT mappings and build their indexes."""
+    from biblelib.word.mappings.marble import gnt_mappings
+
+    gnt_mappings().build_indexes()
+
+
+def _wlcm() -> None:
+    """Load the shared WLCM mappings and build their indexes."""
+    from biblelib.word.mappings.marble import wlcm_mappings
+
+    wlcm_mappings().build_indexes()
+
+
+_LOADERS: dict[str, Callable[[], None]] = {
+    "books": _books,
+    "localizations": _localizations,
+    "versification": _versification,
+    "pericopes": _pericopes,
+    "gnt": _gnt,
+    "wlcm": _wlcm,
+}
+
+
+def warmup(components: Iterable[str] = COMPONENTS, freeze: bool = True) -> dict[str, float]:
+    """Load and index components now, and return the seconds each took.
+
+    Components are loaded in the order of COMPONENTS. The gnt and wlcm
+    mapping tables are downloaded on first use if they're not already
+    cached (see biblelib.data). Components that are already loaded
+    take almost no time.
+
+    With freeze (the default), collect garbage and then freeze
+    everything loaded, so the garbage collector in forked workers
+    doesn't write to shared pages. Call this last thing before forking.
+    """
+    requested = set(components)
+    assert requested <= set(COMPONENTS), f"Invalid components: {sorted(requested - set(COMPONENTS))}"
+    timings: dict[str, float] = {}
+    for name in COMPONENTS:
+        if name in requested:
+            start = perf_counter()
+            _LOADERS[name]()
+            timings[name] = perf_counter() - start
+            metrics.record_time(f"preload.{name}", timings[name])
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return timings
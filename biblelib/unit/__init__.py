@@ -11,8 +11,11 @@ books, chapters, and verses, their references, and components.
 # (*not* `from biblelib.unit import Verse`)
 from .book import BookChapters
 from .chapter import Chapters, Chapter
-from .unitrange import ChapterRange, VerseRange
-from .unit import Unit, Versification, pad
+from .partition import partition, word_weights
+from .rangeset import RangeSet
+from .reflist import RefListParser, parse_reflist
+from .unitrange import ChapterRange, VerseRange, WordRange
+from .unit import Unit, UnitCache, Versification, pad
 from .verse import Verse
 
 __all__ = [
@@ -21,11 +24,21 @@ __all__ = [
     # chapter
     "Chapters",
     "Chapter",
+    # partition
+    "partition",
+    "word_weights",
+    # rangeset
+    "RangeSet",
+    # reflist
+    "RefListParser",
+    "parse_reflist",
     # unitrange
     "ChapterRange",
     "VerseRange",
+    "WordRange",
     # unit
     "Unit",
+    "UnitCache",
     "Versification",
     "pad",
     # verse
@@ -21,7 +21,7 @@ TODO:
 >>> mrk.lastchapter
 16
 >>> mrk.data
-[Chapter(identifier='BCID('41001')'), Chapter(identifier='BCID('41002')'), Chapter(identifier='BCID('41003')'), Chapter(identifier='BCID('41004')'), Chapter(identifier='BCID('41005')'), Chapter(identifier='BCID('41006')'), Chapter(identifier='BCID('41007')'), Chapter(identifier='BCID('41008')'), Chapter(identifier='BCID('41009')'), Chapter(identifier='BCID('41010')'), Chapter(identifier='BCID('41011')'), Chapter(identifier='BCID('41012')'), Chapter(identifier='BCID('41013')'), Chapter(identifier='BCID('41014')'), Chapter(identifier='BCID('41015')'), Chapter(identifier='BCID('41016')')]
+(Chapter(identifier='BCID('41001')'), Chapter(identifier='BCID('41002')'), Chapter(identifier='BCID('41003')'), Chapter(identifier='BCID('41004')'), Chapter(identifier='BCID('41005')'), Chapter(identifier='BCID('41006')'), Chapter(identifier='BCID('41007')'), Chapter(identifier='BCID('41008')'), Chapter(identifier='BCID('41009')'), Chapter(identifier='BCID('41010')'), Chapter(identifier='BCID('41011')'), Chapter(identifier='BCID('41012')'), Chapter(identifier='BCID('41013')'), Chapter(identifier='BCID('41014')'), Chapter(identifier='BCID('41015')'), Chapter(identifier='BCID('41016')'))
 >>> mrk.enumerate(4)
 [Chapter(identifier='BCID('41001')'), Chapter(identifier='BCID('41002')'), Chapter(identifier='BCID('41003')'), Chapter(identifier='BCID('41004')')]
 >>> mrk.enumerate(2, 4)
@@ -29,11 +29,12 @@ TODO:
 
 # get a count of the verses for the chapters in a book
 >>> sum([len(chap) for chap in mrk])
+678
 """
 
 from collections import UserDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Hashable, Optional, Union
 
 # from collections import UserDict
 # from csv import DictReader
@@ -41,8 +42,9 @@ from pathlib import Path
 
 from biblelib.word import BID, BCID
 from biblelib import book
-from .unit import Unit, Versification, pad
-from .chapter import Chapter, Chapters
+from biblelib.versification.VerseTable import get_versetable
+from .unit import Unit, UnitCache, Versification, pad
+from .chapter import Chapter
 
 UNITPATH = Path(__file__).parent
 
@@ -105,34 +107,42 @@ class BookChapters:
 class AllBookChapters(UserDict):
     """Manage Book and Chapter data.
 
-    Populate by iterating over chapter data.
+    Populate from the VerseTable for a versification: keys are book
+    IDs, values are lists of Chapter instances.
     """
 
-    chapters = Chapters()
-
-    def __init__(self) -> None:
+    def __init__(self, versification: Versification = Versification.ENG) -> None:
         """Initialize an instance."""
         super().__init__()
-        lastbookid = "00"
-        chaps: list[Chapter] = []
-        for chapter_ID, chapverses in self.chapters.items():
-            if chapverses.book_ID != lastbookid:
-                # a new book: finish the previous one
-                self.data[lastbookid] = chaps
-                # start a new one
-                lastbookid = chapverses.book_ID
-                chaps = [Chapter(inst=BCID(chapter_ID))]
-            else:
-                chaps.append(Chapter(inst=BCID(chapter_ID)))
-        # finish the last one
-        self.data[lastbookid] = chaps
-        # add Book instances
+        self.versetable = get_versetable(versification.value)
+        self.data = {
+            book_ID: [Chapter(inst=BCID(bcid), versification=versification) for bcid in self.versetable.chapters(book_ID)]
+            for book_ID in self.versetable.maxverses
+        }
 
 
 class Book(Unit):
-    """Manage Book units (chapters), identified by a 2-char book ID."""
+    """Manage Book units (chapters), identified by a 2-char book ID.
+
+    Books are interned: Book(BID("41")) returns the same instance each
+    time, as long as it remains in the cache. The Chapter instances in
+    data are only created when first accessed.
+
+    """
 
-    bookchapters: UserDict = AllBookChapters()
+    _cache = UnitCache(maxsize=128)
+
+    @classmethod
+    def _intern_key(
+        cls,
+        inst: Optional[BID] = None,
+        initlist: Optional[list] = None,
+        versification: Versification = Versification.ENG,
+    ) -> Optional[Hashable]:
+        """Return a key for interning, only for a plain BID with no initlist."""
+        if initlist is not None or type(inst) is not BID:
+            return None
+        return (inst.ID, versification)
 
     def __init__(
         self, inst: Optional[BID], initlist: Optional[list] = None, versification: Versification = Versification.ENG
@@ -141,15 +151,31 @@ class Book(Unit):
 
         - inst is a BID instance
         """
+        if getattr(self, "_initialized", False):
+            # an interned instance
+            return
         super().__init__(initlist=initlist, identifier=inst)
         self.inst = inst
         assert isinstance(inst, BID), f"must be a BID instance: {inst}"
         assert versification in Versification, f"Invalid versification: {versification}"
         self.versification = versification
-        self.data = self.bookchapters[self.inst.book_ID]
         # not right for LJE
-        self.lastchapter = len(self.data)
-        # self.data = self.enumerate(self.chapverses.lastverse)
+        self.lastchapter: int = get_versetable(versification.value).lastchapter(self.inst.book_ID)
+        if initlist is None:
+            # populate with chapter instances on first access
+            self._data = None
+        self._initialized = True
+
+    @Unit.data.getter
+    def data(self) -> Union[list[Chapter], tuple[Chapter, ...]]:
+        """Return the Chapter instances for this book, creating them on first access.
+
+        These are a tuple for an interned book, so they can't be changed.
+        """
+        if self._data is None:
+            items = self.enumerate(self.lastchapter)
+            self._data = tuple(items) if self._interned else items
+        return self._data  # type: ignore[no-any-return]
 
     def enumerate(self, arg0: int, arg1: int = 0) -> list[Chapter]:
         """Return a list of chapter instances.
@@ -168,4 +194,7 @@ class Book(Unit):
         else:
             assert arg0 > 0, "0 is not a valid value for arg0"
             chaprange = range(arg0 - 1, arg1)
-        return [Chapter(inst=(BCID(self.inst.ID + pad(index + 1, count=3)))) for index in chaprange]
+        return [
+            Chapter(inst=(BCID(self.inst.ID + pad(index + 1, count=3))), versification=self.versification)
+            for index in chaprange
+        ]
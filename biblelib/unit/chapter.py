@@ -11,11 +11,15 @@ ChapterVerses(chapter_ID="66022", end_ID="66022021")
 # what's the last verse of Rev 22 ("66022")?
 >>> rev_22.lastverse
 21
-# the Chapter class has a collection of books and chapters
+# the Chapter class has a collection of books
 >>> chapter.Chapter._books["REV"]
 <Book: REV>
->>> chapter.Chapter._chapters["66022"]
-ChapterVerses(chapter_ID="66022", end_ID="66022021")
+# verse counts come from the versification scheme: GEN 32 has 32
+# verses in 'eng', but 33 in 'org'
+>>> chapter.Chapter(inst=chapter.BCID("01032")).lastverse
+32
+>>> chapter.Chapter(inst=chapter.BCID("01032"), versification=chapter.Versification.ORG).lastverse
+33
 
 # instantiate a Chapter instance for Jude chapter 1. Note the
 # identifier must be a BCID instance
@@ -42,10 +46,12 @@ from collections import UserDict
 from csv import DictReader
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Hashable
 
 from biblelib.word import BCID, BCVID, BCVWPID, simplify, reftypes
 from biblelib import book
-from .unit import Unit, Versification, pad
+from biblelib.versification.VerseTable import get_versetable
+from .unit import Unit, UnitCache, Versification, pad
 from .verse import Verse
 
 UNITPATH = Path(__file__).parent
@@ -98,7 +104,12 @@ class ChapterVerses:
 
 
 class Chapters(UserDict):
-    """Manage chapter verse data."""
+    """Manage chapter verse data.
+
+    This reads chapterverses.tsv, which only reflects the 'eng'
+    versification. Chapter instances instead use the VerseTable for
+    their versification (see biblelib.versification.get_versetable).
+    """
 
     def __init__(self, chapterversesfile: str = "chapterverses.tsv") -> None:
         """Initialize a collection of chapter verse data.
@@ -114,7 +125,6 @@ class Chapters(UserDict):
             # does not handle LJE correctly: only one chapter, indexed as 6
 
 
-# TODO: cache these
 # parameter names here are confusing: "identifier" is really an
 # instance of BCID, etc., and for the superclass it needs comparison
 # methods
@@ -125,17 +135,33 @@ class Chapter(Unit):
     these identifiers are used for comparison.
 
     A versification attribute indicates how the identifiers should be
-    interpreted: only the default of the 'eng' scheme for now, and not
-    actually used yet.
+    interpreted: the number of verses comes from the VerseTable for
+    that scheme.
+
+    Chapters are interned: Chapter(BCID("41004")) returns the same
+    instance each time, as long as it remains in the cache. The Verse
+    instances in data are only created when first accessed.
 
     """
 
+    _cache = UnitCache(maxsize=2048)
     _books = book.Books()
-    _chapters = Chapters()
     # if defined, the parent instance: e.g. parent_chapter of Mark 4:3 is Mark 4
     # could also be parent sentence, paragraph, pericope ... so dict for extensibility
     # parent: dict[str, Any] = {}  # {"Book": None}
 
+    @classmethod
+    def _intern_key(
+        cls,
+        inst: BCID | BCVID | BCVWPID | None = None,
+        initlist: list | None = None,
+        versification: Versification = Versification.ENG,
+    ) -> Hashable | None:
+        """Return a key for interning: the BC portion of the ID and the versification."""
+        if initlist is not None or not isinstance(inst, BCID):
+            return None
+        return (inst.ID[:5], versification)
+
     def __init__(
         self,
         inst: BCID | BCVID | BCVWPID,
@@ -146,20 +172,43 @@ class Chapter(Unit):
 
         - inst is a BCID instance
         """
+        if getattr(self, "_initialized", False):
+            # an interned instance
+            return
         # not sure how to silence the type complaint hre
         self.inst: reftypes = simplify(inst, BCID)
         super().__init__(initlist=initlist, identifier=self.inst)
         assert versification in Versification, f"Invalid versification: {versification}"
         self.versification = versification
-        # populate with verse instances
         self.book_ID = self.inst.book_ID
         self.parent["Book"] = self._books.fromusfmnumber(self.book_ID)
         self.parentbook = self.parent["Book"]
         self.book_usfmname = self.parentbook.usfmname
         # assumes the first verse of every chapter has index 1: fragile
-        self.chapverses: ChapterVerses = self._chapters[self.inst.ID]
-        self.lastverse = self.chapverses.lastverse
-        self.data = self.enumerate(self.chapverses.lastverse)
+        self.lastverse: int = get_versetable(versification.value).lastverse(self.inst.ID)
+        self.chapverses = ChapterVerses(chapter_ID=self.inst.ID, end_ID=self.inst.ID + pad(self.lastverse, count=3))
+        if initlist is None:
+            # populate with verse instances on first access
+            self._data = None
+        self._initialized = True
+
+    @Unit.data.getter
+    def data(self) -> list[Verse] | tuple[Verse, ...]:
+        """Return the Verse instances for this chapter, creating them on first access.
+
+        These are a tuple for an interned chapter, so they can't be changed.
+        """
+        if self._data is None:
+            items = self._make_verses(range(self.lastverse))
+            self._data = tuple(items) if self._interned else items
+        return self._data  # type: ignore[no-any-return]
+
+    def _make_verses(self, verserange: range) -> list[Verse]:
+        """Return a list of Verse instances for zero-based verserange."""
+        return [
+            Verse(inst=(BCVID(self.inst.ID + str(index + 1).zfill(3))), versification=self.versification)
+            for index in verserange
+        ]
 
     def enumerate(self, arg0: int, arg1: int = 0) -> list[Verse]:
         """Return a list of verse instances.
@@ -174,4 +223,8 @@ class Chapter(Unit):
         else:
             assert arg0 > 0, "0 is not a valid value for arg0"
             verserange = range(arg0 - 1, arg1)
-        return [Verse(inst=(BCVID(self.inst.ID + str(index + 1).zfill(3)))) for index in verserange]
+        if verserange.stop <= self.lastverse:
+            # share the verses already created for this chapter
+            return list(self.data[verserange.start : verserange.stop])
+        else:
+            return self._make_verses(verserange)
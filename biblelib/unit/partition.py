@@ -0,0 +1,137 @@
+"""Split a canon into balanced, contiguous chunks for parallel jobs.
+
+Splitting a whole-Bible job by book is badly unbalanced: Psalms has
+2461 verses and 3 John has 15. partition() instead splits the verses
+of a canon, in canon order, into a given number of contiguous chunks
+with about the same number of verses each, or about the same number
+of words with weights from word_weights(). Boundaries depend only on
+the arguments, so the same call always shards the same way.
+
+Each chunk is a RangeSet (a chunk that crosses a book boundary can't
+be one BCVIDRange): use to_bcvidranges() for BCVIDRange instances.
+RangeSets pickle compactly, so chunks can be passed to process pools
+directly.
+
+>>> from biblelib.unit.partition import partition
+>>> chunks = partition(4, "NT")
+>>> [len(chunk) for chunk in chunks]
+[1990, 1989, 1990, 1990]
+>>> chunks[1]
+RangeSet(['42005028-44007007'])
+>>> chunks[1].to_bcvidranges()[0]
+BCVIDRange(BCVID('42005028'), BCVID('42024053'))
+
+"""
+
+from bisect import bisect_left
+from typing import Iterable, Mapping, Optional
+
+from biblelib.book import Books
+from biblelib.book.book import CanonSpec, _canonclass
+from biblelib.versification.VerseTable import get_versetable
+from .rangeset import RangeSet
+from .unit import Versification
+
+BOUNDARIES: tuple[str, ...] = ("verse", "chapter", "book")
+
+
+def _units(
+    canon: CanonSpec, versification: Versification, boundary: str, weights: Optional[Mapping[str, int]]
+) -> tuple[list[tuple[int, int]], list[int]]:
+    """Return the ordinal intervals of each unit that chunks can't split, in canon order, and their weights."""
+    versetable = get_versetable(versification.value)
+    books = Books()
+    intervals: list[tuple[int, int]] = []
+    unitweights: list[int] = []
+    for usfmname in _canonclass(canon).bookids:
+        book_ID = books[usfmname].usfmnumber
+        # skip books the versification doesn't have
+        if book_ID not in versetable.maxverses:
+            continue
+        if boundary == "book":
+            chapterspans = [versetable.book_span(book_ID)]
+        else:
+            chapterspans = [
+                (versetable.offsets[bcid], versetable.offsets[bcid] + versetable.lastverses[bcid] - 1)
+                for bcid in versetable.chapters(book_ID)
+            ]
+        for start, end in chapterspans:
+            if boundary == "verse":
+                spans = [(ordinal, ordinal) for ordinal in range(start, end + 1)]
+            else:
+                spans = [(start, end)]
+            for span in spans:
+                intervals.append(span)
+                if weights is None:
+                    unitweights.append(span[1] - span[0] + 1)
+                else:
+                    # verses without a weight (like verses with no words) still count for something
+                    unitweights.append(
+                        sum(
+                            weights.get(versetable.from_ordinal(ordinal), 0) or 1
+                            for ordinal in range(span[0], span[1] + 1)
+                        )
+                    )
+    return intervals, unitweights
+
+
+def partition(
+    chunks: int,
+    canon: CanonSpec = "Protestant",
+    versification: Versification = Versification.ENG,
+    weights: Optional[Mapping[str, int]] = None,
+    boundary: str = "verse",
+) -> list[RangeSet]:
+    """Return the verses of canon, in canon order, split into balanced contiguous chunks.
+
+    canon is a name ("NT", "Protestant", or "Catholic"), or a _Canon
+    subclass or instance. Books the versification doesn't have are
+    left out. By default, each verse weighs 1, so chunks have about
+    the same number of verses. Pass weights mapping verse ID strings
+    to a cost, like word counts from word_weights(), to balance by
+    that instead: verses without a weight count as 1.
+
+    boundary is where chunks may start: at any "verse" (the default),
+    only at the start of a "chapter", or only at the start of a
+    "book". Each boundary is placed where the running total of weights
+    is nearest its share, so results are deterministic. There are
+    fewer than chunks chunks only if there are fewer units to split.
+    """
+    assert chunks > 0, f"chunks must be positive: {chunks}"
+    assert boundary in BOUNDARIES, f"boundary must be one of {BOUNDARIES}: {boundary}"
+    intervals, unitweights = _units(canon, versification, boundary, weights)
+    chunks = min(chunks, len(intervals))
+    cumulative: list[int] = []
+    total = 0
+    for weight in unitweights:
+        total += weight
+        cumulative.append(total)
+    # cuts[k] is the index of the first unit in chunk k
+    cuts = [0]
+    for index in range(1, chunks):
+        target = total * index / chunks
+        cut = bisect_left(cumulative, target)
+        # cut after whichever unit brings the running total nearest the target
+        if cut < len(cumulative) and cumulative[cut] - target < target - (cumulative[cut - 1] if cut else 0):
+            cut += 1
+        # every chunk gets at least one unit
+        cuts.append(min(max(cut, cuts[-1] + 1), len(intervals) - (chunks - index)))
+    cuts.append(len(intervals))
+    return [RangeSet(intervals[start:end], versification) for start, end in zip(cuts, cuts[1:])]
+
+
+def word_weights(editions: Iterable[str] = ("WLCM", "SBLGNT")) -> dict[str, int]:
+    """Return the number of words in each verse ID string of editions, for partition().
+
+    The editions' word counts come from the mapping data (see
+    biblelib.word.mappings.wordcounts), which is downloaded on first
+    use. The default editions cover the Hebrew Bible and the New
+    Testament.
+    """
+    # imported here: the mapping data is only needed for word weights
+    from biblelib.word.mappings.wordcounts import get_wordcounts
+
+    weights: dict[str, int] = {}
+    for edition in editions:
+        weights.update(get_wordcounts(edition).wordcounts)
+    return weights
@@ -0,0 +1,274 @@
+"""Manage sets of verses as runs of verse ordinals.
+
+A RangeSet stores a set of verses as sorted, non-overlapping,
+inclusive intervals of verse ordinals (see
+biblelib.versification.VerseTable). Set operations work on the
+intervals, so they never enumerate individual verses: their cost
+depends on the number of runs, not the number of verses.
+
+>>> from biblelib.unit import RangeSet
+>>> from biblelib.word import BCVID, BCVIDRange
+>>> mrk_4 = RangeSet.from_bcvidrange(BCVIDRange(BCVID("41004001"), BCVID("41004041")))
+>>> sower = RangeSet.from_bcvidrange(BCVIDRange(BCVID("41004001"), BCVID("41004009")))
+>>> len(mrk_4 - sower)
+32
+>>> mrk_4 - sower
+RangeSet(['41004010-41004041'])
+>>> BCVID("41004003") in sower
+True
+>>> (sower | RangeSet.from_ids("41004020", "41004025")).to_bcvidranges()
+[BCVIDRange(BCVID('41004001'), BCVID('41004009')), BCVIDRange(BCVID('41004020'), BCVID('41004025'))]
+
+"""
+
+from bisect import bisect_right
+from heapq import merge
+from typing import Any, Iterable, Iterator, Optional
+
+from biblelib.versification.VerseTable import VerseTable, get_versetable
+from biblelib.word import BID, BCID, BCVID, BCVIDRange
+from .unit import Versification
+from .unitrange import VerseRange
+
+
+def _normalize(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return sorted intervals, merging any that overlap or are adjacent."""
+    merged: list[tuple[int, int]] = []
+    for start, end in intervals:
+        assert start <= end, f"Invalid interval: {start}-{end}"
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _pericope_ordinal(versetable: VerseTable, bcvid: BCVID) -> int:
+    """Return the ordinal of a pericope's start or end verse.
+
+    Pericopes may start with a verse the versification doesn't
+    number, like a psalm superscription (verse 0): use the nearest
+    verse in the same chapter.
+    """
+    if bcvid.ID in versetable:
+        return versetable.ordinal(bcvid.ID)
+    chapter = bcvid.ID[:5]
+    first = versetable.offsets[chapter]
+    return first if int(bcvid.verse_ID) < 1 else first + versetable.lastverses[chapter] - 1
+
+
+class RangeSet:
+    """A set of verses, stored as runs of verse ordinals.
+
+    Union (|), intersection (&), and difference (-) are linear in the
+    number of runs; building a RangeSet from unsorted intervals is
+    O(k log k). Membership tests use binary search.
+
+    Attributes:
+        versification: the scheme that defines verse ordinals
+        intervals: sorted, non-overlapping, non-adjacent (start, end)
+            tuples of verse ordinals. Both ends are inclusive.
+
+    """
+
+    def __init__(
+        self, intervals: Iterable[tuple[int, int]] = (), versification: Versification = Versification.ENG
+    ) -> None:
+        """Instantiate a RangeSet from (start, end) ordinal intervals, in any order."""
+        self.versification = versification
+        self.versetable: VerseTable = get_versetable(versification.value)
+        self.intervals: list[tuple[int, int]] = _normalize(sorted(intervals))
+        # interval start ordinals for bisect
+        self._starts: list[int] = [start for start, _ in self.intervals]
+
+    @classmethod
+    def _from_sorted(cls, intervals: list[tuple[int, int]], versification: Versification) -> "RangeSet":
+        """Return a RangeSet from intervals that are already normalized."""
+        rangeset = cls(versification=versification)
+        rangeset.intervals = intervals
+        rangeset._starts = [start for start, _ in intervals]
+        return rangeset
+
+    @classmethod
+    def from_ids(
+        cls, startid: BCVID | str, endid: Optional[BCVID | str] = None, versification: Versification = Versification.ENG
+    ) -> "RangeSet":
+        """Return a RangeSet for the verses from startid through endid.
+
+        With only startid, return a RangeSet for that single verse.
+        Raises ValueError if either verse is not in the versification.
+        """
+        versetable = get_versetable(versification.value)
+        startstr = startid.ID if isinstance(startid, BCVID) else startid
+        endstr = startstr if endid is None else (endid.ID if isinstance(endid, BCVID) else endid)
+        start, end = versetable.ordinal(startstr), versetable.ordinal(endstr)
+        assert start <= end, f"Startid {startstr} must precede endid {endstr}."
+        return cls._from_sorted([(start, end)], versification)
+
+    @classmethod
+    def from_ref(cls, ref: BID | BCID | BCVID, versification: Versification = Versification.ENG) -> "RangeSet":
+        """Return a RangeSet for every verse in a book, chapter, or verse reference."""
+        versetable = get_versetable(versification.value)
+        if isinstance(ref, BCVID):
+            return cls.from_ids(ref, versification=versification)
+        elif isinstance(ref, BCID):
+            start = versetable.offsets[ref.ID]
+            return cls._from_sorted([(start, start + versetable.lastverses[ref.ID] - 1)], versification)
+        else:
+            return cls._from_sorted([versetable.book_span(ref.ID)], versification)
+
+    @classmethod
+    def from_bcvidrange(cls, bcvidrange: BCVIDRange, versification: Versification = Versification.ENG) -> "RangeSet":
+        """Return a RangeSet for a BCVIDRange."""
+        return cls.from_ids(bcvidrange.startid, bcvidrange.endid, versification=versification)
+
+    @classmethod
+    def from_verserange(cls, verserange: VerseRange) -> "RangeSet":
+        """Return a RangeSet for a VerseRange, in its versification."""
+        return cls.from_ids(verserange.startid, verserange.endid, versification=verserange.versification)
+
+    @classmethod
+    def from_pericope(cls, pericope: Any, versification: Versification = Versification.ENG) -> "RangeSet":
+        """Return a RangeSet for the verses of a Pericope."""
+        versetable = get_versetable(versification.value)
+        start, end = _pericope_ordinal(versetable, pericope.startid), _pericope_ordinal(versetable, pericope.endid)
+        return cls._from_sorted([(start, end)], versification)
+
+    def __repr__(self) -> str:
+        """Return a string representation."""
+        return f"{type(self).__name__}({[self._interval_id(start, end) for start, end in self.intervals]})"
+
+    def __reduce__(self) -> tuple[Any, tuple[list[tuple[int, int]], Versification]]:
+        """Pickle only the intervals and versification, not the verse table."""
+        return (type(self)._from_sorted, (self.intervals, self.versification))
+
+    def _interval_id(self, start: int, end: int) -> str:
+        """Return a string identifier for an interval of ordinals."""
+        startid = self.versetable.from_ordinal(start)
+        return startid if start == end else f"{startid}-{self.versetable.from_ordinal(end)}"
+
+    def __len__(self) -> int:
+        """Return the number of verses in the set."""
+        return sum(end - start + 1 for start, end in self.intervals)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if other has the same verses and versification."""
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.versification == other.versification and self.intervals == other.intervals
+
+    def __contains__(self, item: BCVID | str) -> bool:
+        """Return True if a verse (a BCVID or its ID string) is in the set."""
+        if isinstance(item, BCVID):
+            bcvid = item.to_bcvid
+        else:
+            # drop any canon prefix from a Macula-style ID string
+            bcvid = item[1:9] if item[:1] in ("n", "o") else item[:8]
+        if bcvid not in self.versetable:
+            return False
+        ordinal = self.versetable.ordinal(bcvid)
+        index = bisect_right(self._starts, ordinal) - 1
+        return index >= 0 and ordinal <= self.intervals[index][1]
+
+    def __iter__(self) -> Iterator[BCVID]:
+        """Yield a BCVID for each verse in the set, in order."""
+        for start, end in self.intervals:
+            for ordinal in range(start, end + 1):
+                yield BCVID(self.versetable.from_ordinal(ordinal))
+
+    def _check(self, other: "RangeSet") -> None:
+        """Check that other can be combined with self."""
+        assert isinstance(other, RangeSet), f"Not a RangeSet: {other}"
+        assert (
+            self.versification == other.versification
+        ), f"Cannot combine {self.versification} and {other.versification} RangeSets."
+
+    def union(self, other: "RangeSet") -> "RangeSet":
+        """Return a RangeSet with the verses in either self or other."""
+        self._check(other)
+        return self._from_sorted(_normalize(merge(self.intervals, other.intervals)), self.versification)
+
+    def intersection(self, other: "RangeSet") -> "RangeSet":
+        """Return a RangeSet with the verses in both self and other."""
+        self._check(other)
+        result: list[tuple[int, int]] = []
+        i = j = 0
+        while i < len(self.intervals) and j < len(other.intervals):
+            start = max(self.intervals[i][0], other.intervals[j][0])
+            end = min(self.intervals[i][1], other.intervals[j][1])
+            if start <= end:
+                result.append((start, end))
+            # advance whichever interval finishes first
+            if self.intervals[i][1] < other.intervals[j][1]:
+                i += 1
+            else:
+                j += 1
+        return self._from_sorted(result, self.versification)
+
+    def difference(self, other: "RangeSet") -> "RangeSet":
+        """Return a RangeSet with the verses in self that are not in other."""
+        self._check(other)
+        result: list[tuple[int, int]] = []
+        j = 0
+        for start, end in self.intervals:
+            # skip intervals in other that end before this one
+            while j < len(other.intervals) and other.intervals[j][1] < start:
+                j += 1
+            k = j
+            while k < len(other.intervals) and other.intervals[k][0] <= end:
+                if other.intervals[k][0] > start:
+                    result.append((start, other.intervals[k][0] - 1))
+                start = other.intervals[k][1] + 1
+                k += 1
+            if start <= end:
+                result.append((start, end))
+        return self._from_sorted(result, self.versification)
+
+    def issubset(self, other: "RangeSet") -> bool:
+        """Return True if every verse in self is also in other."""
+        return not self.difference(other).intervals
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __le__ = issubset
+
+    def to_bcvidranges(self) -> list[BCVIDRange]:
+        """Return a list of BCVIDRange instances covering the set.
+
+        A BCVIDRange cannot span books, so runs that cross a book
+        boundary are split there.
+        """
+        ranges: list[BCVIDRange] = []
+        for start, end in self.intervals:
+            while start <= end:
+                startid = self.versetable.from_ordinal(start)
+                bookend = min(end, self.versetable.book_span(startid[:2])[1])
+                ranges.append(BCVIDRange(BCVID(startid), BCVID(self.versetable.from_ordinal(bookend))))
+                start = bookend + 1
+        return ranges
+
+    def to_pericopes(self, pericopes: Any) -> list[Any]:
+        """Return the pericopes in a PericopeDict that include any verse in the set, in order.
+
+        Pericopes come from an edition's fixed list rather than
+        arbitrary ranges, so this selects the ones that overlap the set
+        instead of creating new ones.
+        """
+        result = []
+        for pericope in pericopes.values():
+            start = _pericope_ordinal(self.versetable, pericope.startid)
+            end = _pericope_ordinal(self.versetable, pericope.endid)
+            # the last run starting by the end of the pericope overlaps it if it ends after its start
+            index = bisect_right(self._starts, end) - 1
+            if index >= 0 and self.intervals[index][1] >= start:
+                result.append(pericope)
+        return result
+
+    def to_verseranges(self) -> list[VerseRange]:
+        """Return a list of VerseRange instances covering the set, split at book boundaries."""
+        return [
+            VerseRange(startid=bcvidrange.startid, endid=bcvidrange.endid, versification=self.versification)
+            for bcvidrange in self.to_bcvidranges()
+        ]
@@ -0,0 +1,202 @@
+"""Parse compound reference lists into RangeSets.
+
+Dictionaries and commentaries cite Scripture with compact reference
+lists like "Ezra 5:1,14-15" or "Gen 1:1-3; 2:4; Exod 3". These are
+parsed directly into the ordinal intervals of a RangeSet, so a
+reference to a whole book or chapter range costs the same as a
+single verse: verses are never enumerated.
+
+Book and chapter context carry forward from one item to the next.
+After a comma, a bare number is a verse in the current chapter if the
+previous item named a verse, and otherwise a chapter. After a
+semicolon, a bare number is a chapter. In single-chapter books like
+Jude, a bare number is always a verse.
+
+>>> from biblelib.unit.reflist import parse_reflist
+>>> parse_reflist("Hag 2:1,10,18-20")
+RangeSet(['37002001', '37002010', '37002018-37002020'])
+>>> parse_reflist("Gen 1:1-3; 2:4; Exod 3")
+RangeSet(['01001001-01001003', '01002004', '02003001-02003022'])
+>>> len(parse_reflist("Mark 2-4"))
+104
+
+Parsing millions of references in bulk is fast because book names
+are resolved once and parsed lists are cached:
+
+>>> from biblelib.unit.reflist import RefListParser
+>>> parser = RefListParser()
+>>> [len(rangeset) for rangeset in parser.parse_many(["Jude 3-5", "Ps 23"])]
+[3, 6]
+
+"""
+
+import re
+from functools import cache
+from typing import Iterable, Iterator, Optional
+
+from biblelib.book import Books
+from biblelib.versification.VerseTable import VerseTable, get_versetable
+from .rangeset import RangeSet
+from .unit import UnitCache, Versification
+
+BOOKS = Books()
+
+# an item is an optional book name followed by an optional
+# chapter/verse body. Book names may start with a digit, like "1 Cor".
+_ITEMRE = re.compile(r"^\s*(?:(?P<book>(?:[1-4]\s*)?[^\W\d_][^\d]*?)\.?\s*)?(?P<body>\d.*?)?\s*$")
+
+
+class RefListParser:
+    """Parse compound reference lists for a versification scheme.
+
+    Book names are resolved with Books.findbook(), which ignores case
+    and spacing and accepts unique prefixes. Provide aliases for other
+    abbreviations in bookmap.
+
+    Attributes:
+        versification: the scheme for chapter and verse numbers
+        cvsep: the separator between chapter and verse numbers
+        bookmap: maps other book abbreviations to names that
+            Books.findbook() recognizes, like {"Hagg": "HAG"}
+        strict: if True, raise ValueError for an invalid item; if
+            False, skip it.
+
+    """
+
+    def __init__(
+        self,
+        versification: Versification = Versification.ENG,
+        cvsep: str = ":",
+        bookmap: Optional[dict[str, str]] = None,
+        strict: bool = True,
+        cachesize: int = 65536,
+    ) -> None:
+        """Instantiate a parser."""
+        self.versification = versification
+        self.versetable: VerseTable = get_versetable(versification.value)
+        self.cvsep = cvsep
+        self.bookmap: dict[str, str] = dict(bookmap) if bookmap else {}
+        self.strict = strict
+        # resolved book IDs by name
+        self._bookids: dict[str, str] = {}
+        # parsed intervals for whole reference lists
+        self._cache = UnitCache(maxsize=cachesize)
+        num = r"(\d+)[a-z]?"
+        sep = re.escape(cvsep)
+        self._bodyre = re.compile(rf"^{num}(?:{sep}{num})?(?:\s*[-–]\s*{num}(?:{sep}{num})?)?$")
+
+    def __repr__(self) -> str:
+        """Return a string representation."""
+        return f"{type(self).__name__}({self.versification}, cvsep={self.cvsep!r})"
+
+    def resolve_book(self, name: str) -> str:
+        """Return the book ID (like "37") for a book name or abbreviation.
+
+        Raises ValueError if the name can't be resolved.
+        """
+        book_ID = self._bookids.get(name)
+        if book_ID is None:
+            book_ID = BOOKS.findbook(self.bookmap.get(name, name)).usfmnumber
+            self._bookids[name] = book_ID
+        return book_ID
+
+    def _ordinal(self, book_ID: str, chapter: int, verse: int) -> int:
+        """Return the ordinal for a verse, or raise ValueError."""
+        bcid = book_ID + str(chapter).zfill(3)
+        lastverse = self.versetable.lastverses.get(bcid)
+        if lastverse is None or not 0 < verse <= lastverse:
+            raise ValueError(
+                f"{bcid}{str(verse).zfill(3)} is not a verse in the {self.versification.value} versification"
+            )
+        return self.versetable.offsets[bcid] + verse - 1
+
+    def _parse(self, text: str) -> tuple[tuple[int, int], ...]:
+        """Return (start, end) ordinal intervals for a reference list."""
+        intervals: list[tuple[int, int]] = []
+        book_ID = ""
+        chapter = 0
+        versemode = False
+        for group in text.split(";"):
+            for index, item in enumerate(group.split(",")):
+                if not item.strip():
+                    # stray separator, like "Zech 1:7,"
+                    continue
+                try:
+                    itemmatch = _ITEMRE.match(item)
+                    if not itemmatch:
+                        raise ValueError(f"Invalid reference: {item}")
+                    bookname, body = itemmatch.group("book", "body")
+                    if bookname:
+                        book_ID = self.resolve_book(bookname.strip())
+                        versemode = False
+                    elif not book_ID:
+                        raise ValueError(f"No book for reference: {item}")
+                    if not body:
+                        if not bookname:
+                            raise ValueError(f"Invalid reference: {item}")
+                        intervals.append(self.versetable.book_span(book_ID))
+                        continue
+                    bodymatch = self._bodyre.match(body)
+                    if not bodymatch:
+                        raise ValueError(f"Invalid reference: {item}")
+                    n1, n2, n3, n4 = (int(n) if n else 0 for n in bodymatch.groups())
+                    afterverse, versemode = versemode, True
+                    if n2:
+                        # chapter:verse, then -verse or -chapter:verse
+                        startchapter, startverse = n1, n2
+                        endchapter, endverse = (n3, n4) if n4 else (n1, n3 or n2)
+                    elif self.versetable.lastchapter(book_ID) == 1:
+                        # single-chapter book: numbers are verses
+                        startchapter, startverse = 1, n1
+                        endchapter, endverse = (n3, n4) if n4 else (1, n3 or n1)
+                    elif afterverse and index and not bookname:
+                        # verse in the current chapter
+                        startchapter, startverse = chapter, n1
+                        endchapter, endverse = (n3, n4) if n4 else (chapter, n3 or n1)
+                    else:
+                        # chapter or chapter range, possibly ending at a verse
+                        startchapter, startverse = n1, 1
+                        endchapter = n3 or n1
+                        endverse = n4 or self.versetable.lastverses.get(book_ID + str(endchapter).zfill(3), 0)
+                        versemode = bool(n4)
+                    chapter = endchapter
+                    intervals.append(self._interval(book_ID, startchapter, startverse, endchapter, endverse))
+                except (KeyError, ValueError) as e:
+                    if self.strict:
+                        raise ValueError(f"Can't parse {item!r} in {text!r}: {e}") from e
+        return tuple(intervals)
+
+    def _interval(
+        self, book_ID: str, startchapter: int, startverse: int, endchapter: int, endverse: int
+    ) -> tuple[int, int]:
+        """Return the ordinal interval for a verse range, or raise ValueError."""
+        start = self._ordinal(book_ID, startchapter, startverse)
+        end = self._ordinal(book_ID, endchapter, endverse)
+        if start > end:
+            raise ValueError(f"Range end precedes start: {book_ID} {startchapter}:{startverse}-{endchapter}:{endverse}")
+        return start, end
+
+    def parse(self, text: str) -> RangeSet:
+        """Return a RangeSet for a reference list like "Ezra 5:1,14-15"."""
+        intervals = self._cache.get(text, lambda: self._parse(text))
+        return RangeSet(intervals, versification=self.versification)
+
+    def parse_many(self, texts: Iterable[str]) -> Iterator[RangeSet]:
+        """Yield a RangeSet for each reference list in texts."""
+        for text in texts:
+            yield self.parse(text)
+
+
+@cache
+def get_reflistparser(versification: Versification = Versification.ENG, cvsep: str = ":") -> RefListParser:
+    """Return a shared RefListParser for versification and cvsep."""
+    return RefListParser(versification=versification, cvsep=cvsep)
+
+
+def parse_reflist(text: str, versification: Versification = Versification.ENG, cvsep: str = ":") -> RangeSet:
+    """Return a RangeSet for a reference list like "Gen 1:1-3; 2:4".
+
+    Uses a shared parser: see RefListParser for bookmap and strict
+    options.
+    """
+    return get_reflistparser(versification, cvsep).parse(text)
@@ -1,8 +1,67 @@
 """Define Unit class."""
 
-from collections import UserList
+from collections import OrderedDict, UserList
 from enum import Enum
-from typing import Any, Optional
+from functools import wraps
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+
+class UnitCache:
+    """A bounded cache of interned unit instances.
+
+    Keys are typically an (identifier string, Versification) tuple.
+    When the cache is full, the least recently used entry is evicted:
+    the evicted instance remains valid for anyone still holding it, but
+    a later request for the same key creates a new instance. Safe to
+    use from several threads: factory runs with the cache locked, so
+    each key has one instance.
+
+    >>> cache = UnitCache(maxsize=2)
+    >>> cache.get(("41004", "eng"), list) is cache.get(("41004", "eng"), list)
+    True
+
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Instantiate a UnitCache holding at most maxsize instances."""
+        self.maxsize = maxsize
+        self.data: OrderedDict[Hashable, Any] = OrderedDict()
+        # reentrant, in case a factory creates other instances in this cache
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of cached instances."""
+        return len(self.data)
+
+    def get(self, key: Hashable, factory: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Return the instance for key, calling factory(*args, **kwargs) to create it if needed."""
+        with self._lock:
+            try:
+                inst = self.data[key]
+                self.data.move_to_end(key)
+            except KeyError:
+                inst = self.data[key] = factory(*args, **kwargs)
+                if len(self.data) > self.maxsize:
+                    self.data.popitem(last=False)
+            return inst
+
+    def clear(self) -> None:
+        """Drop all cached instances."""
+        with self._lock:
+            self.data.clear()
+
+
+def _unshared(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a UserList method that changes the list, so it fails for interned units."""
+
+    @wraps(method)
+    def wrapper(self: "Unit", *args: Any, **kwargs: Any) -> Any:
+        if self._interned:
+            raise TypeError(f"{self!r} is shared (interned), so it can't be changed: build a new list instead")
+        return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Unit(UserList):
@@ -11,8 +70,51 @@ class Unit(UserList):
     Put things here that are common to all units, whether populated or
     not.
 
+    Subclasses that are fully determined by their identifier and
+    versification can set _cache to a UnitCache and define
+    _intern_key(): constructing such a unit then returns the canonical
+    instance for that key, initialized before any other thread can get
+    it. Their __init__ must return early for an instance that is
+    already initialized.
+
+    Interned units are shared by everyone who constructs them, so they
+    must not be modified: their data is a tuple, and list methods that
+    change them (append(), sort(), item assignment, and so on) or
+    setting data raise a TypeError. Don't change their other
+    attributes either.
+
     """
 
+    # if set, interns instances of this class: see __new__
+    _cache: Optional[UnitCache] = None
+    # True for instances from _cache
+    _interned: bool = False
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "Unit":
+        """Return a new instance, or the canonical one for an interned class."""
+        key = cls._intern_key(*args, **kwargs) if cls._cache is not None else None
+        if key is None:
+            return super().__new__(cls)
+        inst: Unit = cls._cache.get(key, cls._make_interned, *args, **kwargs)
+        return inst
+
+    @classmethod
+    def _make_interned(cls, *args: Any, **kwargs: Any) -> "Unit":
+        """Return a new, initialized instance for the cache."""
+        # initialized while the cache is locked, so no other thread sees
+        # a partly initialized instance
+        inst: Unit = super().__new__(cls)
+        inst.__init__(*args, **kwargs)  # type: ignore[misc]
+        if isinstance(inst._data, list):
+            inst._data = tuple(inst._data)
+        inst._interned = True
+        return inst
+
+    @classmethod
+    def _intern_key(cls, *args: Any, **kwargs: Any) -> Optional[Hashable]:
+        """Return a key identifying an interned instance, or None to skip interning."""
+        return None
+
     def __init__(self, initlist: Optional[list] = None, identifier: Any = "(MISSING)") -> None:
         """Instantiate a Unit."""
         super().__init__(initlist)
@@ -32,6 +134,32 @@ class Unit(UserList):
         """Return a string representation."""
         return f"{type(self).__name__}(identifier={self.identifier})"
 
+    @property
+    def data(self) -> Any:
+        """Return the items in this unit: a tuple for an interned unit."""
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        """Set the items in this unit, unless it's interned."""
+        if self._interned:
+            raise TypeError(f"{self!r} is shared (interned), so its data can't be replaced")
+        self._data = value
+
+    # these change the list in place
+    __setitem__ = _unshared(UserList.__setitem__)
+    __delitem__ = _unshared(UserList.__delitem__)
+    __iadd__ = _unshared(UserList.__iadd__)
+    __imul__ = _unshared(UserList.__imul__)
+    append = _unshared(UserList.append)
+    insert = _unshared(UserList.insert)
+    pop = _unshared(UserList.pop)
+    remove = _unshared(UserList.remove)
+    clear = _unshared(UserList.clear)
+    reverse = _unshared(UserList.reverse)
+    sort = _unshared(UserList.sort)
+    extend = _unshared(UserList.extend)
+
     def __lt__(self, other: Any) -> bool:
         """Return true if self < other."""
         return bool(self.identifier < other.identifier)
@@ -1,4 +1,4 @@
-"""Manage verse range references.
+"""Manage chapter, verse, and word range references.
 
 >>> from biblelib.unit import ChapterRange, VerseRange
 >>> mrk_2_5 = ChapterRange(start=BCID("41002"), end=BCID("41005"))
@@ -7,17 +7,28 @@
 >>> onechap = VerseRange(startid=BCVID("41001040"), endid=BCVID("41002002"))
 >>> onechap.enumerate()
 [Verse(identifier='BCVID('41001040')'), Verse(identifier='BCVID('41001041')'), ... Verse(identifier='BCVID('41002002')')]
+>>> words = WordRange(startid=BCVWPID("41004003001"), endid=BCVWPID("41004005003"))
+>>> "n41004004007" in words
+True
+>>> list(words.iter_ids({"41004003": 2, "41004004": 1, "41004005": 9}.get))
+['410040030011', '410040030021', '410040040011', '410040050011', '410040050021', '410040050031']
 
 
 """
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Union
 
 from biblelib.book import Books
-from biblelib.word import BID, BCID, BCVID, simplify
+from biblelib.versification.VerseTable import get_versetable
+from biblelib.word import BID, BCID, BCVID, BCVWPID, fastid, simplify
 from .chapter import Chapter
 from .verse import Verse
-from .unit import pad
+from .unit import Versification, pad
+
+if TYPE_CHECKING:
+    from biblelib.versification.VerseTable import VerseTable
+    from .rangeset import RangeSet
 
 BOOKS = Books()
 
@@ -31,6 +42,7 @@ class ChapterRange:
 
     startid: BCID
     endid: BCID
+    versification: Versification = Versification.ENG
 
     def __post_init__(self) -> None:
         """Check initialization values."""
@@ -46,7 +58,7 @@ class ChapterRange:
         """
         if self.startid == self.endid:
             # vacuous range
-            return [Chapter(self.startid)]
+            return [Chapter(self.startid, versification=self.versification)]
         else:
             bookid = self.startid.book_ID
             # this assumes chapters are numbered sequentially
@@ -54,7 +66,7 @@ class ChapterRange:
             startid_chap = int(self.startid.chapter_ID)
             endid_chap = int(self.endid.chapter_ID)
             chapters = list(range(startid_chap, endid_chap + 1))
-            return [Chapter(BCID(bookid + pad(i, 3))) for i in chapters]
+            return [Chapter(BCID(bookid + pad(i, 3)), versification=self.versification) for i in chapters]
 
 
 @dataclass
@@ -63,6 +75,8 @@ class VerseRange:
 
     startid: BCVID
     endid: BCVID
+    # determines the number of verses in each chapter
+    versification: Versification = Versification.ENG
     # these are computed from startid and endid
     ID: str = field(init=False)
     book: BID = field(init=False)
@@ -102,61 +116,180 @@ class VerseRange:
 
         Enumerations include the ending Verse value (unlike range).
         """
-
-        def get_verses(bcid: BCID, startindex: int, endindex: int) -> list[Verse]:
-            """Return a list of verses."""
-            return Chapter(inst=bcid).enumerate(startindex, endindex)
-
         if self.startid == self.endid:
             # vacuous range
-            return [Verse(self.startid)]
+            return [Verse(self.startid, versification=self.versification)]
         else:
-            # this assumes chapters are numbered sequentially
-            # this may be violated outside the Protestant canon
-            startid_chap_index = int(self.startid.chapter_ID)
             startid_verse_index = int(self.startid.verse_ID)
-            endid_chap_index = int(self.endid.chapter_ID)
             endid_verse_index = int(self.endid.verse_ID)
-            if startid_chap_index == endid_chap_index:
-                chap = Chapter(inst=simplify(self.startid, BCID))
-                return chap.enumerate(startid_verse_index, endid_verse_index)
+            chapenum = ChapterRange(
+                startid=simplify(self.startid, BCID),
+                endid=simplify(self.endid, BCID),
+                versification=self.versification,
+            ).enumerate()
+            if len(chapenum) == 1:
+                return chapenum[0].enumerate(startid_verse_index, endid_verse_index)
             else:
-                # bookid = self.startid.book_ID
-                chaprange = ChapterRange(startid=simplify(self.startid, BCID), endid=simplify(self.endid, BCID))
-                chapenum = chaprange.enumerate()
-                firstbcid = chapenum[0].identifier
-                firstchap = Chapter(inst=firstbcid)
-                firstverses = get_verses(firstbcid, startid_verse_index, firstchap.lastverse)
-                # may be empty
-                midbcids: list[Chapter] = chapenum[1:-1]
-                # get all verses for any middle chapters
-                # WRONG use of get_verses here now that this is a list of Chapters
-                midverses = [v for chap in midbcids for v in chap.enumerate(1, chap.lastverse)]
-                lastbcid = chapenum[-1].identifier
-                # lastchap = Chapter(inst=lastbcid)
-                lastverses = get_verses(lastbcid, 1, endid_verse_index)
-                return [v for v in (firstverses + midverses + lastverses)]
+                firstchap = chapenum[0]
+                firstverses = firstchap.enumerate(startid_verse_index, firstchap.lastverse)
+                # may be empty: all verses for any middle chapters
+                midverses = [v for chap in chapenum[1:-1] for v in chap]
+                lastverses = chapenum[-1].enumerate(1, endid_verse_index)
+                return firstverses + midverses + lastverses
 
     def enumerate_ids(self) -> list[BCVID | None]:
         """Return a list of BCVID instances for the range."""
         return [v.inst for v in self.enumerate()]
 
 
-# I also need WordRange for a sequence of word IDs
-def detect_name_range(ref: str) -> str:
-    """Return a range instance for a reference.
+# bits for each word ID in WordRange.encode()
+_WORDIDBITS = 40
+
+
+@dataclass
+class WordRange:
+    """Manage a range of words, possibly spanning verses.
+
+    Containment only compares IDs, so it's O(1) and needs no word
+    data. Enumerating the words requires the number of words in each
+    verse, from a callable like `{"41004003": 12, ...}.get`, which
+    returns 0 or None for verses that aren't in the data.
+
+    Enumeration is by word: for Hebrew, where a word may have several
+    parts, only part 1 of each word is produced (besides the start and
+    end IDs).
+
+    Attributes:
+        startid: the first word in the range
+        endid: the last word in the range
+        versification: determines the order of verses
+        ID: the normalized start and end IDs, separated by "-"
+
+    """
+
+    startid: BCVWPID
+    endid: BCVWPID
+    # determines the sequence of verses for enumeration
+    versification: Versification = Versification.ENG
+    # computed from startid and endid
+    ID: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Check initialization values."""
+        # accept ID strings too
+        if isinstance(self.startid, str):
+            self.startid = BCVWPID(self.startid)
+        if isinstance(self.endid, str):
+            self.endid = BCVWPID(self.endid)
+        assert self.startid.ID <= self.endid.ID, f"Startid {self.startid} must precede endid {self.endid}."
+        self.ID = self.startid.ID + "-" + self.endid.ID
+
+    def __repr__(self) -> str:
+        """Return a printed representation."""
+        return f"<WordRange: {self.ID}>"
+
+    def __contains__(self, item: Union[str, BCVWPID]) -> bool:
+        """Return True if item, a word ID string or BCVWPID, is in the range."""
+        ID = item.ID if isinstance(item, BCVWPID) else fastid.normalize(item)
+        return self.startid.ID <= ID <= self.endid.ID
+
+    @property
+    def cross_verse(self) -> bool:
+        """True if the range starts and ends in different verses."""
+        return self.startid.to_bcvid != self.endid.to_bcvid
+
+    def iter_ids(self, wordcounts: Callable[[str], Optional[int]]) -> Iterator[str]:
+        """Yield the normalized word ID strings in the range, in order.
+
+        wordcounts returns the number of words in a verse ID string.
+        """
+        versetable = get_versetable(self.versification.value)
+        startverse, endverse = self.startid.to_bcvid, self.endid.to_bcvid
+        for ordinal in range(versetable.ordinal(startverse), versetable.ordinal(endverse) + 1):
+            verseid = versetable.from_ordinal(ordinal)
+            first = int(self.startid.word_ID) if verseid == startverse else 1
+            last = int(self.endid.word_ID) if verseid == endverse else (wordcounts(verseid) or 0)
+            if verseid == startverse:
+                # keep the starting part
+                yield self.startid.ID
+                first += 1
+            for word in range(first, last + 1):
+                yield f"{verseid}{word:03d}1"
+        if self.endid.part_ID != "1" and self.endid != self.startid:
+            yield self.endid.ID
+
+    def count(self, wordcounts: Callable[[str], Optional[int]]) -> int:
+        """Return the number of words in the range: see iter_ids()."""
+        return sum(1 for _ in self.iter_ids(wordcounts))
 
-    Assumes it's called on a reference with a hyphen. Heuristic.
+    def encode(self) -> int:
+        """Return the range packed into a single int: see decode()."""
+        return int(self.startid.ID) << _WORDIDBITS | int(self.endid.ID)
+
+    @classmethod
+    def decode(cls, code: int, versification: Versification = Versification.ENG) -> "WordRange":
+        """Return a WordRange from an int from encode()."""
+        startid = str(code >> _WORDIDBITS).zfill(12)
+        endid = str(code & ((1 << _WORDIDBITS) - 1)).zfill(12)
+        return cls(BCVWPID(startid), BCVWPID(endid), versification=versification)
+
+    @classmethod
+    def from_ids(
+        cls,
+        ids: Iterable[Union[str, BCVWPID]],
+        wordcounts: Optional[Callable[[str], Optional[int]]] = None,
+        versification: Versification = Versification.ENG,
+    ) -> list["WordRange"]:
+        """Return the fewest WordRanges covering a sorted sequence of word IDs.
+
+        IDs are contiguous if they're successive parts or words in a
+        verse. With wordcounts, the last word of a verse and the first
+        word of the next verse are also contiguous, so ranges can span
+        verses.
+        """
+        versetable = get_versetable(versification.value)
+        ranges: list[WordRange] = []
+        startid = previd = ""
+        for item in ids:
+            ID = item.ID if isinstance(item, BCVWPID) else fastid.normalize(item)
+            if previd and not cls._adjacent(previd, ID, wordcounts, versetable):
+                ranges.append(cls(BCVWPID(startid), BCVWPID(previd), versification=versification))
+                startid = ""
+            startid = startid or ID
+            previd = ID
+        if previd:
+            ranges.append(cls(BCVWPID(startid), BCVWPID(previd), versification=versification))
+        return ranges
+
+    @staticmethod
+    def _adjacent(
+        previd: str, ID: str, wordcounts: Optional[Callable[[str], Optional[int]]], versetable: "VerseTable"
+    ) -> bool:
+        """Return True if normalized ID immediately follows previd."""
+        assert previd < ID, f"IDs must be sorted and unique: {previd}, {ID}"
+        if previd[:8] == ID[:8]:
+            prevword, word = int(previd[8:11]), int(ID[8:11])
+            # the next part of the same word, or the next word
+            return (word == prevword and int(ID[11]) == int(previd[11]) + 1) or (
+                word == prevword + 1 and ID[11] == "1"
+            )
+        if wordcounts is None or ID[8:] != "0011" or int(previd[8:11]) != wordcounts(previd[:8]):
+            return False
+        try:
+            return versetable.ordinal(ID[:8]) == versetable.ordinal(previd[:8]) + 1
+        except ValueError:
+            return False
+
+
+def detect_name_range(ref: str, versification: Versification = Versification.ENG) -> "RangeSet":
+    """Return a RangeSet for a name-based range reference.
+
+    Handles verse ranges like "Mark 4:3-9", cross-chapter ranges like
+    "Mark 4:35-5:20", and chapter ranges like "Mark 2-4", as well as
+    compound references: see biblelib.unit.reflist.
 
     """
-    ref1, ref2 = ref.split("-")
-    assert not ("," in ref1 or "," in ref2), f"Can't handle complex range: {ref}"
-    namematch = BOOKS.nameregexp.match(ref1)
-    assert namematch, f"Invalid name reference: {ref1}"
-    bookname, _ = ref1[: namematch.end()], ref1[(namematch.end() + 1) :]
-    usfmbook = BOOKS.fromname(bookname).usfmnumber
-    if ":" in ref1:
-        return f"{usfmbook}, verserange"
-    else:
-        # match digits
-        return f"{usfmbook}, chapterrange"
+    # imported here: reflist imports this module via rangeset
+    from .reflist import get_reflistparser
+
+    return get_reflistparser(versification).parse(ref)
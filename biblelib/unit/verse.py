@@ -10,10 +10,10 @@ Verse(identifier='BCVID('41004003')')
 
 """
 
-from typing import Any, Optional
+from typing import Any, Hashable, Optional
 
 from biblelib.word import BCVID
-from .unit import Unit, Versification
+from .unit import Unit, UnitCache, Versification
 
 
 class Verse(Unit):
@@ -29,18 +29,38 @@ class Verse(Unit):
     interpreted: only the default of the 'eng' scheme for now, and not
     actually used yet.
 
+    Verses are interned: Verse(BCVID("41004003")) returns the same
+    instance each time, as long as it remains in the cache.
+
     """
 
+    _cache = UnitCache(maxsize=8192)
     # if defined, the parent instance: e.g. parent_chapter of Mark 4:3 is Mark 4
     # could also be parent sentence, paragraph, pericope ... so dict for extensibility
     parent: dict[str, Any] = {"Chapter": None}
 
+    @classmethod
+    def _intern_key(
+        cls,
+        inst: Optional[BCVID] = None,
+        initlist: Optional[list] = None,
+        versification: Versification = Versification.ENG,
+    ) -> Optional[Hashable]:
+        """Return a key for interning, only for a plain BCVID with no initlist."""
+        if initlist is not None or type(inst) is not BCVID:
+            return None
+        return (inst.ID, versification)
+
     def __init__(
         self, inst: Optional[BCVID], initlist: Optional[list] = None, versification: Versification = Versification.ENG
     ) -> None:
         """Instantiate a Verse."""
+        if getattr(self, "_initialized", False):
+            # an interned instance
+            return
         super().__init__(initlist=initlist, identifier=inst)
         self.inst = inst
         assert isinstance(inst, BCVID), f"Inst must be a BCVID instance: {inst}"
         assert versification in Versification, f"Invalid versification: {versification}"
         self.versification = versification
+        self._initialized = True
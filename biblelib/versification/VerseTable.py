@@ -0,0 +1,152 @@
+"""Compiled verse counts for a versification scheme.
+
+A VerseTable is built once per scheme from the `maxVerses` data in the
+bundled scheme JSON, and shared: use get_versetable() rather than
+instantiating it directly. Chapter and verse lookups are then simple
+dict accesses.
+
+Books and chapters are keyed by their BCV identifier strings (like
+"41" and "41004"). Each verse in the scheme also has an ordinal: its
+zero-based position in BCVID order across the whole scheme. Ordinals
+make it cheap to represent runs of verses as integer intervals.
+
+>>> from biblelib.versification import get_versetable
+>>> eng = get_versetable("eng")
+>>> eng.lastverse("41004")
+41
+>>> eng.lastchapter("41")
+16
+>>> eng.ordinal("01001001")
+0
+>>> eng.from_ordinal(eng.ordinal("41004003"))
+'41004003'
+>>> get_versetable("org").lastverse("01032")
+33
+
+"""
+
+import json
+from bisect import bisect_right
+from functools import cache
+from pathlib import Path
+from warnings import warn
+
+from biblelib import VERSIFICATIONIDS, metrics
+from biblelib.book import Books
+
+# This directory: where the bundled scheme JSON files live.
+VERSIFICATIONPATH = Path(__file__).parent
+# Versification members without bundled scheme data yet: units use eng
+# verse counts for these
+FALLBACKSCHEMES: tuple[str, ...] = ("lxx", "rsc", "vul")
+
+
+class VerseTable:
+    """Verse counts and verse ordinals for a versification scheme.
+
+    Books in the scheme JSON that have no USFM number in books.tsv are
+    skipped.
+
+    Attributes:
+        scheme: the versification scheme, like "eng"
+        maxverses: maps a book ID to a tuple of verse counts for each
+            chapter, in BCVID order of book IDs
+        lastverses: maps a chapter (BCID) string to its last verse number
+        offsets: maps a chapter (BCID) string to the ordinal of its first verse
+        total: the number of verses in the scheme
+
+    """
+
+    def __init__(self, scheme: str) -> None:
+        """Compile the verse table for scheme from the bundled JSON."""
+        assert scheme in VERSIFICATIONIDS, f"Unsupported scheme: {scheme}"
+        self.scheme = scheme
+        with (VERSIFICATIONPATH / f"{scheme}.json").open(encoding="utf-8") as f:
+            schemejson = json.load(f)
+        books = Books()
+        maxverses: dict[str, tuple[int, ...]] = {
+            books[usfmname].usfmnumber: tuple(int(count) for count in counts)
+            for usfmname, counts in schemejson["maxVerses"].items()
+            if usfmname in books
+        }
+        # sort by book ID so ordinals follow BCVID string order
+        self.maxverses: dict[str, tuple[int, ...]] = dict(sorted(maxverses.items()))
+        self.lastverses: dict[str, int] = {}
+        self.offsets: dict[str, int] = {}
+        ordinal = 0
+        for book_ID, counts in self.maxverses.items():
+            for chapterindex, count in enumerate(counts, 1):
+                bcid = book_ID + str(chapterindex).zfill(3)
+                self.lastverses[bcid] = count
+                self.offsets[bcid] = ordinal
+                ordinal += count
+        self.total: int = ordinal
+        # parallel sorted lists for mapping an ordinal back to its chapter
+        self._chapterids: list[str] = list(self.offsets)
+        self._starts: list[int] = list(self.offsets.values())
+
+    def __repr__(self) -> str:
+        """Return a string representation."""
+        return f"VerseTable({self.scheme!r})"
+
+    def __contains__(self, bcvid: str) -> bool:
+        """Return True if bcvid is a verse in this scheme."""
+        lastverse = self.lastverses.get(bcvid[:5])
+        return lastverse is not None and 0 < int(bcvid[5:8]) <= lastverse
+
+    def lastverse(self, bcid: str) -> int:
+        """Return the last verse number for a chapter ID like "41004".
+
+        Raises KeyError if the chapter is not in this scheme.
+        """
+        return self.lastverses[bcid[:5]]
+
+    def lastchapter(self, book_ID: str) -> int:
+        """Return the last chapter number for a book ID like "41".
+
+        Raises KeyError if the book is not in this scheme.
+        """
+        return len(self.maxverses[book_ID[:2]])
+
+    def chapters(self, book_ID: str) -> list[str]:
+        """Return the chapter (BCID) strings for a book ID like "41"."""
+        return [book_ID + str(index).zfill(3) for index in range(1, self.lastchapter(book_ID) + 1)]
+
+    def ordinal(self, bcvid: str) -> int:
+        """Return the zero-based ordinal for a verse ID like "41004003".
+
+        Raises ValueError if the verse is not in this scheme.
+        """
+        offset = self.offsets.get(bcvid[:5])
+        verse = int(bcvid[5:8])
+        if offset is None or not 0 < verse <= self.lastverses[bcvid[:5]]:
+            raise ValueError(f"{bcvid} is not a verse in the {self.scheme} versification")
+        return offset + verse - 1
+
+    def from_ordinal(self, ordinal: int) -> str:
+        """Return the verse ID string for a zero-based ordinal."""
+        if not 0 <= ordinal < self.total:
+            raise ValueError(f"Ordinal {ordinal} out of range for the {self.scheme} versification")
+        index = bisect_right(self._starts, ordinal) - 1
+        return self._chapterids[index] + str(ordinal - self._starts[index] + 1).zfill(3)
+
+    def book_span(self, book_ID: str) -> tuple[int, int]:
+        """Return the first and last verse ordinals for a book ID like "41"."""
+        chapters = self.chapters(book_ID)
+        return self.offsets[chapters[0]], self.offsets[chapters[-1]] + self.lastverses[chapters[-1]] - 1
+
+
+@cache
+def get_versetable(scheme: str) -> VerseTable:
+    """Return the shared VerseTable for scheme, compiling it on first use.
+
+    Schemes in FALLBACKSCHEMES have no bundled data yet: for these,
+    warn (once) and return the eng table.
+    """
+    if scheme in FALLBACKSCHEMES:
+        warn(f"No verse counts for the {scheme} versification yet: using eng counts", stacklevel=2)
+        return get_versetable("eng")
+    return VerseTable(scheme)
+
+
+metrics.register_cache("versification.versetable", get_versetable)
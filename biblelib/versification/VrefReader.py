@@ -16,7 +16,7 @@
 from collections import UserList
 from pathlib import Path
 
-from biblelib import CANONIDS, VERSIFICATIONIDS
+from biblelib import CANONIDS, VERSIFICATIONIDS, metrics
 from biblelib.word import bcvwpid
 
 # This directory: where the bundled *-vref.txt files live.
@@ -40,6 +40,7 @@ class VrefReader(UserList):
     # tests/versification/test_vref_derivation.py.
     remote_vrefbase: str = "https://raw.githubusercontent.com/Clear-Bible/Biblelib/master/biblelib/versification/"
 
+    @metrics.timed("versification.VrefReader.load")
     def __init__(self, scheme: str, canon: str, asbcv: bool = True, sourcefile: str = "") -> None:
         """Read a .vref file.
 
@@ -7,12 +7,16 @@ for more details.
 """
 
 from .Mapper import Mapper
+from .VerseTable import VerseTable, get_versetable
 from .VrefReader import VrefReader
 
 
 __all__ = [
     # Mapper
     "Mapper",
+    # VerseTable
+    "VerseTable",
+    "get_versetable",
     # VrefReader
     "VrefReader",
 ]
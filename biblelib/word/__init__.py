@@ -12,6 +12,10 @@ The Hebrew and Greek source files are available from
 
 """
 
+from typing import TYPE_CHECKING
+
+from biblelib._lazy import attach
+
 from .bcvwpid import (
     BID,
     BCID,
@@ -29,11 +33,38 @@ from .bcvwpid import (
     to_bcv,
     make_id,
     is_bcvwpid,
+    invalid_ids,
+    validate_ids,
+    IDPool,
+    enable_interning,
+    disable_interning,
+    get_idpool,
+)
+
+if TYPE_CHECKING:
+    from . import fastid
+    from .localref import LocalizedRefParser, parse_localized
+    from .refrender import RefRenderer, get_refrenderer, preload_refrenderers
+    from .ubs import fromubs
+    from .urlmanager import URLManager
+
+# Other names are imported on first access (PEP 562), so importing
+# biblelib.word doesn't load localizations, or the mapping code and
+# its download dependencies. Maps a name to its module.
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "fastid": "fastid",
+        "LocalizedRefParser": "localref",
+        "parse_localized": "localref",
+        "RefRenderer": "refrender",
+        "get_refrenderer": "refrender",
+        "preload_refrenderers": "refrender",
+        "URLManager": "urlmanager",
+        "fromubs": "ubs",
+    },
 )
-from .urlmanager import URLManager
 
-# see logic below about when this is really exported
-from .ubs import fromubs
 
 _exportlist = [
     # bcvwpid
@@ -53,6 +84,21 @@ _exportlist = [
     "to_bcv",
     "make_id",
     "is_bcvwpid",
+    "invalid_ids",
+    "validate_ids",
+    "IDPool",
+    "enable_interning",
+    "disable_interning",
+    "get_idpool",
+    # fastid
+    "fastid",
+    # localref
+    "LocalizedRefParser",
+    "parse_localized",
+    # refrender
+    "RefRenderer",
+    "get_refrenderer",
+    "preload_refrenderers",
     # urlmanager
     "URLManager",
     # ubs
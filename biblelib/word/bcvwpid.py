@@ -55,43 +55,94 @@ ToDo:
 
 """
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import MISSING, dataclass, field, fields
+from functools import cache
 import re
-from typing import Any, Union, get_args
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Optional, TypeVar, Union, get_args
+from weakref import WeakValueDictionary
 
-from biblelib.book import Books, get_localized_books
+from biblelib.book import Books
 
-BOOKS = Books()
+if TYPE_CHECKING:
+    from biblelib.unit.rangeset import RangeSet
+    from biblelib.unit.reflist import RefListParser
+    from .refrender import RefRenderer
 
+_BaseT = TypeVar("_BaseT", bound="_Base")
 
-def _cv_sep(lang: str) -> str:
-    """Return the chapter-verse separator character for *lang*.
+# leading characters of valid book IDs for BCVID
+_BOOKSTARTS = frozenset("012345678ABC")
+_BCVWPID_RE = re.compile(r"^[no]?\d{11,12}$")
 
-    English uses ``":"`` (hardcoded); other languages read the value
-    from the ``# cv_sep:`` metadata line in their ``books_<lang>.tsv``
-    file (defaulting to ``":"`` if absent).
 
-    >>> _cv_sep("eng")
-    ':'
-    >>> _cv_sep("fra")
-    '.'
+@cache
+def _books() -> Books:
+    """Return the shared Books instance, created on first use."""
+    return Books()
+
+
+def __getattr__(name: str) -> Any:
+    """Return BOOKS, the shared Books instance, on first access."""
+    if name == "BOOKS":
+        return _books()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    """
-    if lang == "eng":
-        return ":"
-    localized = get_localized_books(lang)
-    return localized.cv_sep if localized is not None else ":"
 
+def _get_refrenderer(lang: str, style: str) -> "RefRenderer":
+    """Return the shared RefRenderer for lang and style."""
+    # imported on first use: refrender needs book data
+    from .refrender import get_refrenderer
 
-@dataclass(order=True)
+    return get_refrenderer(lang, style)
+
+
+def _get_canon_prefix(book_ID: str) -> str:
+    """Return a single character prefix for canon."""
+    if book_ID < "40":
+        return "o"
+    elif book_ID < "67":
+        return "n"
+    else:
+        # not sure what's required here
+        return "x"
+
+
+@cache
+def _init_defaults(cls: type) -> dict[str, Any]:
+    """Return the default values that __init__() sets for a dataclass."""
+    return {fld.name: fld.default for fld in fields(cls) if fld.init and fld.default is not MISSING}
+
+
+@dataclass(eq=False)
 class _Base:
-    """Base class for units."""
+    """Base class for units.
+
+    Equality, hashing, and ordering depend only on ID, which
+    determines all the other attributes. Instances are equal only to
+    instances of the same class with the same ID. Instances of
+    different classes are ordered by ID, so a book or chapter sorts
+    before the chapters, verses, and words it includes.
+    """
 
     # book mapping data
     ID: str
     book_ID: str = field(init=False)
     # the longth of the book portion of an ID
     _idlen: int = 0
+    # set on instances shared through an IDPool, which are already initialized
+    _interned: ClassVar[bool] = False
+
+    def __new__(cls, ID: Optional[str] = None, *args: Any, **kwargs: Any) -> Any:
+        """Return the shared instance for ID if interning cls, else a new instance.
+
+        See enable_interning().
+        """
+        pool = _IDPOOL
+        if pool is not None and ID is not None and not (args or kwargs) and cls in pool.types:
+            return pool.get(cls, ID)
+        return object.__new__(cls)
 
     def __post_init__(self) -> None:
         """Compute other values on initialization."""
@@ -99,50 +150,75 @@ class _Base:
             len(self.ID) == self._idlen
         ), f"length should be {self._idlen} characters: {self.ID}"
 
+    def _split(self) -> None:
+        """Set the component IDs from self.ID."""
+
+    @classmethod
+    def from_trusted(cls: type["_BaseT"], ID: str) -> "_BaseT":
+        """Return an instance for an ID that is known to be valid, skipping validation.
+
+        Use this when loading large amounts of pre-validated data
+        (check it first with invalid_ids() if needed): an invalid ID
+        here produces an invalid instance rather than an error.
+        """
+        inst = cls.__new__(cls)
+        inst.ID = ID
+        for name, value in _init_defaults(cls).items():
+            setattr(inst, name, value)
+        inst._split()
+        return inst
+
     def __repr__(self) -> str:
         """Return a string representation."""
         return f"{type(self).__name__}('{self.ID}')"
 
     # class is mutable because of post_init, but otherwise logically immutable
-    # note that, for subclasses, hash(self) != hash(self.ID). I do not
-    # know why, but dataclass hash functions are special.
     def __hash__(self) -> int:
         """Return a hash value."""
         return hash(self.ID)
 
-    def _get_bookname(self, style: str, lang: str = "eng") -> str:
-        """Return the book name in the requested style, optionally localized.
-
-        For non-English languages, *style* may be ``"name"`` (full name)
-        or ``"abbrev"`` (localized abbreviation). For ``lang="eng"``,
-        the standard English styles ``"usfmname"``, ``"name"``,
-        ``"osisID"``, and ``"biblia"`` are supported.
-
-        If *lang* is unsupported, falls back to English (a warning will
-        have been issued by :func:`get_localized_books`).
-        """
-        if lang != "eng":
-            localized = get_localized_books(lang)
-            if localized is not None:
-                usfmname: str = BOOKS.fromusfmnumber(self.book_ID).usfmname
-                if style == "abbrev":
-                    return localized.get_abbrev(usfmname)
-                return localized.get_name(usfmname)
-            # Unsupported language: fall back to English.
-            # "abbrev" has no English equivalent style; use "biblia".
-            if style == "abbrev":
-                style = "biblia"
-        assert style in (
-            "usfmname",
-            "name",
-            "osisID",
-            "biblia",
-        ), f"Unknown style {style} for book name."
-        bookname: str = BOOKS.get_bookname(usfmnumber=self.book_ID, style=style)
-        return bookname
-
-
-@dataclass(repr=False, unsafe_hash=True)
+    def __eq__(self, other: object) -> bool:
+        """Return True if other is the same class, with the same ID."""
+        if type(other) is type(self):
+            return self.ID == other.ID  # type: ignore[attr-defined]
+        if isinstance(other, _Base):
+            return False
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        """Return True if other is a different class, or has a different ID."""
+        if type(other) is type(self):
+            return self.ID != other.ID  # type: ignore[attr-defined]
+        if isinstance(other, _Base):
+            return True
+        return NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        """Return True if self's ID sorts before other's."""
+        if isinstance(other, _Base):
+            return self.ID < other.ID
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        """Return True if self's ID sorts before or equals other's."""
+        if isinstance(other, _Base):
+            return self.ID <= other.ID
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        """Return True if self's ID sorts after other's."""
+        if isinstance(other, _Base):
+            return self.ID > other.ID
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        """Return True if self's ID sorts after or equals other's."""
+        if isinstance(other, _Base):
+            return self.ID >= other.ID
+        return NotImplemented
+
+
+@dataclass(repr=False, eq=False)
 class BID(_Base):
     """Identifies a book identifier.
 
@@ -154,13 +230,19 @@ class BID(_Base):
 
     def __post_init__(self) -> None:
         """Compute other values on initialization."""
+        if self._interned:
+            return
         super().__post_init__()
-        self.book_ID = self.ID[0:2]
+        self._split()
         # also test that they're all digits, in the right etc, range.
         # this covers the protestant canon and deuterocanon, but not perfectly
         # this breaks code in book.py
         # assert re.match("^[0-8][0-9]", self.book_ID), f"Invalid book number {self.book_ID}"
 
+    def _split(self) -> None:
+        """Set the component IDs from self.ID."""
+        self.book_ID = self.ID[0:2]
+
     @property
     def to_bid(self) -> str:
         """Return the book ID."""
@@ -193,11 +275,11 @@ class BID(_Base):
 
     def to_usfm(self) -> str:
         """Return a USFM representation."""
-        usfmbook = BOOKS.fromusfmnumber(self.book_ID).usfmname
+        usfmbook = _books().fromusfmnumber(self.book_ID).usfmname
         return f"{usfmbook}"
 
 
-@dataclass(repr=False, unsafe_hash=True)
+@dataclass(repr=False, eq=False)
 class BCID(BID):
     """Identifies book and chapter from Bible texts.
 
@@ -223,9 +305,9 @@ class BCID(BID):
     # the longth of the book+chapter portion of an ID
     _idlen: int = 5
 
-    def __post_init__(self) -> None:
-        """Compute other values on initialization."""
-        super().__post_init__()
+    def _split(self) -> None:
+        """Set the component IDs from self.ID."""
+        super()._split()
         self.chapter_ID = self.ID[2:5]
         # also test that they're all digits, in the right range, etc.
 
@@ -257,7 +339,7 @@ class BCID(BID):
 
     def to_usfm(self) -> str:
         """Return a USFM representation."""
-        usfmbook = BOOKS.fromusfmnumber(self.book_ID).usfmname
+        usfmbook = _books().fromusfmnumber(self.book_ID).usfmname
         return f"{usfmbook} {int(self.chapter_ID)}"
 
 
@@ -268,7 +350,7 @@ class BCID(BID):
 # persnickity.
 
 
-@dataclass(repr=False, unsafe_hash=True)
+@dataclass(repr=False, eq=False)
 class BCVID(BCID):
     """Identifies book, chapter, verse from Bible texts.
 
@@ -304,13 +386,19 @@ class BCVID(BCID):
 
     def __post_init__(self) -> None:
         """Compute other values on initialization."""
+        if self._interned:
+            return
         super().__post_init__()
-        self.verse_ID = self.ID[5:8]
         # simple tests, but not sufficient for validation
         assert self.ID[1:].isdigit(), f"Invalid non-digits in BCVID: {self.ID}"
-        assert re.match("^[0-8A-C]", self.ID), f"Invalid book identifier: {self.ID}"
+        assert self.ID[0] in _BOOKSTARTS, f"Invalid book identifier: {self.ID}"
         assert int(self.ID[2:5]) < 151, f"Invalid chapter identifier: {self.ID}"
 
+    def _split(self) -> None:
+        """Set the component IDs from self.ID."""
+        super()._split()
+        self.verse_ID = self.ID[5:8]
+
     @property
     def to_bcvid(self) -> str:
         """Return string for the book, chapter, and verse ID."""
@@ -350,7 +438,7 @@ class BCVID(BCID):
 
     def to_usfm(self) -> str:
         """Return a USFM representation."""
-        usfmbook = BOOKS.fromusfmnumber(self.book_ID).usfmname
+        usfmbook = _books().fromusfmnumber(self.book_ID).usfmname
         return f"{usfmbook} {int(self.chapter_ID)}:{int(self.verse_ID)}"
 
     def to_nameref(self, lang: str = "eng") -> str:
@@ -366,9 +454,7 @@ class BCVID(BCID):
             'Marc 4.3'
 
         """
-        bookname = self._get_bookname("name", lang=lang)
-        sep = _cv_sep(lang)
-        return f"{bookname} {int(self.chapter_ID)}{sep}{int(self.verse_ID)}"
+        return _get_refrenderer(lang, "name").render_id(self.ID)
 
     def to_abbrevref(self, lang: str = "eng") -> str:
         """Return a reference string using an abbreviated book name.
@@ -383,19 +469,16 @@ class BCVID(BCID):
             'Mc 4.3'
 
         """
-        style = "biblia" if lang == "eng" else "abbrev"
-        bookname = self._get_bookname(style, lang=lang)
-        sep = _cv_sep(lang)
-        return f"{bookname} {int(self.chapter_ID)}{sep}{int(self.verse_ID)}"
+        return _get_refrenderer(lang, "abbrev").render_id(self.ID)
 
     def to_osisID(self) -> str:
         """Return a USFM representation."""
-        bookname = BOOKS.fromusfmnumber(self.book_ID).osisID
+        bookname = _books().fromusfmnumber(self.book_ID).osisID
         return f"{bookname} {int(self.chapter_ID)}:{int(self.verse_ID)}"
 
     def to_biblia(self) -> str:
         """Return a USFM representation."""
-        bookname = BOOKS.fromusfmnumber(self.book_ID).biblia
+        bookname = _books().fromusfmnumber(self.book_ID).biblia
         return f"{bookname} {int(self.chapter_ID)}:{int(self.verse_ID)}"
 
 
@@ -493,39 +576,11 @@ class BCVIDRange:
                 for n in range(int(self.startid.verse_ID), int(self.endid.verse_ID) + 1)
             ]
 
-    def _get_bookname(self, style: str, lang: str = "eng") -> str:
-        """Return the book name in the requested style, optionally localized.
-
-        If *lang* is unsupported, falls back to English (a warning will
-        have been issued by :func:`get_localized_books`).
-        """
-        if lang != "eng":
-            localized = get_localized_books(lang)
-            if localized is not None:
-                usfmname: str = BOOKS.fromusfmnumber(self.startid.book_ID).usfmname
-                if style == "abbrev":
-                    return localized.get_abbrev(usfmname)
-                return localized.get_name(usfmname)
-            if style == "abbrev":
-                style = "biblia"
-        assert style in (
-            "usfmname",
-            "name",
-            "osisID",
-            "biblia",
-        ), f"Unknown style {style} for book name."
-        bookname: str = BOOKS.get_bookname(usfmnumber=self.startid.book_ID, style=style)
-        return bookname
-
     def to_format(self, style: str, lang: str = "eng") -> str:
         """Return a string representation of the range in the requested style.
 
         No attempt to be smart about abbreviatory conventions."""
-        bookname = self._get_bookname(style, lang=lang)
-        sep = _cv_sep(lang)
-        startbc = f"{int(self.startid.chapter_ID)}{sep}{int(self.startid.verse_ID)}"
-        endbc = f"{int(self.endid.chapter_ID)}{sep}{int(self.endid.verse_ID)}"
-        return f"{bookname} {startbc}-{endbc}"
+        return _get_refrenderer(lang, style).render_id(self.ID)
 
     # for backwards compatibility, but should be deprecated
     def to_usfm(self) -> str:
@@ -564,7 +619,7 @@ class BCVIDRange:
         return self.to_format("biblia")
 
 
-@dataclass(repr=False, unsafe_hash=True)
+@dataclass(repr=False, eq=False)
 class BCVWPID(BCVID):
     """Identifies words from Bible texts by book, chapter, verse, word, and word part.
 
@@ -621,21 +676,18 @@ class BCVWPID(BCVID):
         so ID comparison is well-defined.
 
         """
-
-        def _get_canon_prefix(book_ID: str) -> str:
-            """Return a single character prefix for canon."""
-            if book_ID < "40":
-                return "o"
-            elif book_ID < "67":
-                return "n"
-            else:
-                # not sure what's required here
-                return "x"
-
         # cannot call super because allows either 11 or 12 length
         # super()__post_init__()
         assert is_bcvwpid(self.ID), f"Invalid identifier: {self.ID}"
         # assert 13 >= len(self.ID) >= 11, f"Invalid length: {self.ID}"
+        self._split()
+        # TODO: add tests, presumably a closed set of values
+        assert self.canon_prefix == _get_canon_prefix(
+            self.book_ID
+        ), f"Canon prefix must match book ID: {self.ID}"
+
+    def _split(self) -> None:
+        """Set the component IDs from self.ID, removing any canon prefix."""
         if self.ID.startswith("o") or self.ID.startswith("n"):
             self.canon_prefix = self.ID[0]
             restid = self.ID = self.ID[1:]
@@ -647,10 +699,6 @@ class BCVWPID(BCVID):
             # output time with get_id().
             # self.ID = self.canon_prefix + self.ID
         self.book_ID = restid[0:2]
-        # TODO: add tests, presumably a closed set of values
-        assert self.canon_prefix == _get_canon_prefix(
-            self.book_ID
-        ), f"Canon prefix must match book ID: {self.ID}"
         self.chapter_ID = restid[2:5]
         self.verse_ID = restid[5:8]
         self.word_ID = restid[8:11]
@@ -660,6 +708,33 @@ class BCVWPID(BCVID):
             self.part_ID = "1"
             self.ID += self.part_ID
 
+    @classmethod
+    def from_trusted(cls, ID: str) -> "BCVWPID":
+        """Return an instance for an ID that is known to be valid, skipping validation.
+
+        Equivalent to the generic version, but with the attributes set
+        inline, since this is the hot path for loading Macula data.
+        """
+        if ID[0] in "no":
+            canon_prefix = ID[0]
+            ID = ID[1:]
+        else:
+            canon_prefix = _get_canon_prefix(ID[0:2])
+        if len(ID) == 11:
+            ID += "1"
+        # set attributes in the same order as __init__(), so instances
+        # share the same key layout
+        inst = cls.__new__(cls)
+        inst.ID = ID
+        inst._idlen = _init_defaults(cls)["_idlen"]
+        inst.part_ID = ID[11]
+        inst.canon_prefix = canon_prefix
+        inst.book_ID = ID[0:2]
+        inst.chapter_ID = ID[2:5]
+        inst.verse_ID = ID[5:8]
+        inst.word_ID = ID[8:11]
+        return inst
+
     def get_id(self, prefix: bool = False, part_index: bool = True) -> str:
         """Return a string identifier for the instance.
 
@@ -700,7 +775,7 @@ class BCVWPID(BCVID):
 
         If with_word is True, include the word ID.
         """
-        usfmbook = BOOKS.fromusfmnumber(self.book_ID).usfmname
+        usfmbook = _books().fromusfmnumber(self.book_ID).usfmname
         verseref = f"{usfmbook} {int(self.chapter_ID)}:{int(self.verse_ID)}"
         if with_word:
             return f"{verseref}!{int(self.word_ID)}"
@@ -734,6 +809,131 @@ class BCVWPID(BCVID):
 reftypes = Union[BID, BCID, BCVID, BCVWPID]
 
 
+class IDPool:
+    """A bounded, weakly referenced intern table of reference instances.
+
+    Instances are keyed by class and ID string. An instance stays in
+    the table while anything references it; the most recently created
+    maxsize instances are also held strongly, so frequently repeated
+    references survive between uses even if the caller drops them.
+
+    Interned instances are shared, so they must not be modified. The
+    pool is locked, so threads can share it.
+
+    Attributes:
+        maxsize: the number of recent instances held strongly
+        types: the classes whose instances are interned
+        hits: the number of lookups that returned a shared instance
+        misses: the number of lookups that created a new instance
+
+    """
+
+    def __init__(self, maxsize: int = 65536, types: Iterable[type] = (BID, BCID, BCVID)) -> None:
+        """Instantiate an empty IDPool."""
+        self.maxsize = maxsize
+        self.types = frozenset(types)
+        self.refs: WeakValueDictionary[tuple[type, str], _Base] = WeakValueDictionary()
+        self.recent: deque[_Base] = deque(maxlen=maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of live interned instances."""
+        return len(self.refs)
+
+    def lookup(self, cls: type, ID: str) -> Optional[_Base]:
+        """Return the interned instance of cls for ID, or None, counting hits and misses."""
+        with self._lock:
+            inst = self.refs.get((cls, ID))
+            if inst is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return inst
+
+    def add(self, cls: type, ID: str, inst: _Base) -> None:
+        """Intern inst as the instance of cls for ID."""
+        with self._lock:
+            self.refs[(cls, ID)] = inst
+            self.recent.append(inst)
+
+    def get(self, cls: type, ID: str) -> _Base:
+        """Return the interned instance of cls for ID, creating and interning it if needed.
+
+        An invalid ID raises as usual, and nothing is interned.
+        """
+        with self._lock:
+            inst = self.lookup(cls, ID)
+            if inst is None:
+                inst = object.__new__(cls)
+                inst.__init__(ID)  # type: ignore[misc]
+                # cls() calls __init__() again on the returned instance:
+                # __post_init__() skips interned instances
+                inst._interned = True  # type: ignore[misc]
+                self.add(cls, ID, inst)
+            return inst
+
+    def stats(self) -> dict[str, Union[int, float]]:
+        """Return counters for tuning maxsize."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitrate": self.hits / lookups if lookups else 0.0,
+                "size": len(self.refs),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop all interned instances and reset the counters."""
+        with self._lock:
+            self.refs.clear()
+            self.recent.clear()
+            self.hits = self.misses = 0
+
+
+# the active pool, which _Base.__new__() checks
+_IDPOOL: Optional[IDPool] = None
+
+
+def enable_interning(maxsize: int = 65536, types: Iterable[type] = (BID, BCID, BCVID)) -> IDPool:
+    """Intern instances of types, so repeated IDs return shared instances, and return the pool.
+
+    This is opt-in: while enabled, `BCVID("41004003")` (and
+    simplify(), which constructs through the same classes) returns the
+    same instance for the same ID as long as one is alive or recent.
+    The pool's hits and misses show how well maxsize fits a workload.
+    Disabling restores normal construction.
+
+    >>> pool = enable_interning()
+    >>> BCVID("41004003") is BCVID("41004003")
+    True
+    >>> pool.hits
+    1
+    >>> disable_interning()
+
+    """
+    global _IDPOOL
+    types = tuple(types)
+    for cls in types:
+        assert cls in get_args(reftypes) and cls is not BCVWPID, f"Can't intern {cls}"
+    _IDPOOL = IDPool(maxsize=maxsize, types=types)
+    return _IDPOOL
+
+
+def disable_interning() -> None:
+    """Stop interning instances, restoring normal construction."""
+    global _IDPOOL
+    _IDPOOL = None
+
+
+def get_idpool() -> Optional[IDPool]:
+    """Return the active IDPool, or None if interning is disabled."""
+    return _IDPOOL
+
+
 def simplify(refinst: reftypes, newclass: reftypes) -> reftypes:
     """Return a 'simpler' new instance for refinst.
 
@@ -809,11 +1009,11 @@ def fromlogos(ref: str) -> BID | BCID | BCVID:
     if "." not in baseref:
         # only a book reference
         # bookref = f"{baseref:0>3}"
-        return BID(BOOKS.fromlogos(int(baseref)).usfmnumber)
+        return BID(_books().fromlogos(int(baseref)).usfmnumber)
     else:
         # book.rest
         bookref, baseref = baseref.split(".", 1)
-        usfmbook = BOOKS.fromlogos(int(bookref)).usfmnumber
+        usfmbook = _books().fromlogos(int(bookref)).usfmnumber
         if "." not in baseref:
             # book and chapter
             return BCID(f"{usfmbook}{pad3(baseref)}")
@@ -836,11 +1036,11 @@ def fromosis(ref: str) -> BID | BCID | BCVID:
     """
     if "." not in ref:
         # book only
-        usfmbook = BOOKS.fromosis(ref).usfmnumber
+        usfmbook = _books().fromosis(ref).usfmnumber
         return BID(usfmbook)
     else:
         bookabbrev, rest = ref.split(".", 1)
-        usfmbook = BOOKS.fromosis(bookabbrev).usfmnumber
+        usfmbook = _books().fromosis(bookabbrev).usfmnumber
         if "." not in rest:
             # book and chapter
             return BCID(f"{usfmbook}{pad3(rest)}")
@@ -863,16 +1063,16 @@ def fromname(ref: str) -> BID | BCID | BCVID:
     # complex check because book names can contain spaces and other numbers
     # must match a regexp of all the book names, and be the same length
     # type complaint here: 'str' has no attribute 'match'. Not quite right.
-    namematch = BOOKS.nameregexp.match(ref)
+    namematch = _books().nameregexp.match(ref)
     assert namematch, f"Invalid name reference: {ref}"
     if len(ref) == (namematch.end() - namematch.start()):
         # book only
-        usfmbook = BOOKS.fromname(ref).usfmnumber
+        usfmbook = _books().fromname(ref).usfmnumber
         return BID(usfmbook)
     else:
         # split namematch at the end of the match
         bookname, rest = ref[: namematch.end()], ref[(namematch.end() + 1) :]
-        usfmbook = BOOKS.fromname(bookname).usfmnumber
+        usfmbook = _books().fromname(bookname).usfmnumber
         if ":" not in rest:
             # book and chapter
             return BCID(f"{usfmbook}{pad3(rest)}")
@@ -897,22 +1097,39 @@ def from_usfm(ref: str) -> BID | BCID | BCVID | BCVWPID | BCVIDRange:
     - book chapter:verse
     - book chapter:verse!word
     - book chapter:verse-chapter:verse (range)
+    - book chapter-chapter (chapter range, as a verse range from the
+      first verse to the last verse of the end chapter in the English
+      versification)
 
-    Does not handle non-numeric verses like 'title'. Does not check
-    the validity of chapter and verse numbers for the book.
+    Does not handle non-numeric verses like 'title'. Except for
+    chapter ranges, does not check the validity of chapter and verse
+    numbers for the book.
 
     """
     if " " not in ref:
         # book only
-        usfmbook = BOOKS[ref.upper()].usfmnumber
+        usfmbook = _books()[ref.upper()].usfmnumber
         return BID(usfmbook)
     else:
         bookabbrev, rest = ref.split(" ", 1)
-        usfmbook = BOOKS[bookabbrev.upper()].usfmnumber
+        usfmbook = _books()[bookabbrev.upper()].usfmnumber
         if "-" in rest:
             # verse range: must be same book, end portion must be
             # otherwise fully specified
             startref, endref = rest.split("-", 1)
+            if ":" not in startref and ":" not in endref:
+                # chapter range: find the last verse of the end chapter
+                from biblelib.versification.VerseTable import get_versetable
+
+                lastverses = get_versetable("eng").lastverses
+                startbcid, endbcid = f"{usfmbook}{pad3(startref)}", f"{usfmbook}{pad3(endref)}"
+                if startbcid not in lastverses or endbcid not in lastverses:
+                    raise ValueError(f"Invalid chapter range for {bookabbrev}: {ref}")
+                endverse = lastverses[endbcid]
+                return BCVIDRange(
+                    BCVID(f"{usfmbook}{pad3(startref)}001"),
+                    BCVID(f"{usfmbook}{pad3(endref)}{pad3(str(endverse))}"),
+                )
             assert ":" in endref, f"Range end must include chapter and verse: {ref}"
             return BCVIDRange(
                 from_usfm(f"{bookabbrev} {startref}"),
@@ -952,11 +1169,11 @@ def from_biblia(ref: str) -> BID | BCID | BCVID:
     rangere = re.compile(r"[-–]")
     if " " not in ref:
         # book only
-        bibliabook = BOOKS.frombiblia(ref).usfmnumber
+        bibliabook = _books().frombiblia(ref).usfmnumber
         return BID(bibliabook)
     else:
         bookabbrev, rest = ref.split(" ", 1)
-        bibliabook = BOOKS.frombiblia(bookabbrev).usfmnumber
+        bibliabook = _books().frombiblia(bookabbrev).usfmnumber
         if ":" not in rest:
             # book and chapter
             return BCID(f"{bibliabook}{pad3(rest)}")
@@ -986,52 +1203,68 @@ def from_biblia(ref: str) -> BID | BCID | BCVID:
 frombiblia = from_biblia
 
 
-# INCOMPLETE: TynBD has
-# - cross-chapter references like bref^Num_13_30-14 and bref^Zech_1_7-6_8
+# TynBD has
+# - cross-chapter references like bref^Zech_1_7-6_8
 # - conjoined references like bref^Ezra_5_1,14-15
+# INCOMPLETE: TynBD also has
+# - cross-chapter references like bref^Num_13_30-14
 # - chapter range references like bref^Tb_1_2
 
+# fix a few idiosyncratic TynBD abbreviations
+TBD_FIXMAP: dict[str, str] = {
+    "1Thes": "1TH",
+    "2Thes": "2TH",
+    "AddEsth": "ESG",
+    "Ecclus": "SIR",
+    "Hagg": "HAG",
+    "Tb": "TOB",
+    "Wisd": "WIS",
+}
 
-def from_tbd(ref: str) -> BCVID | BCVIDRange:
+
+@cache
+def _tbd_parser() -> "RefListParser":
+    """Return a shared reference-list parser for TynBD references."""
+    # imported here: biblelib.unit imports from this module
+    from biblelib.unit.reflist import RefListParser
+
+    return RefListParser(cvsep="_", bookmap=TBD_FIXMAP)
+
+
+def from_tbd(ref: str) -> "BCVID | BCVIDRange | RangeSet":
     """Return a BCV instance for a Tyndale Bible Dictionary reference.
 
     The TynBD markup has references like "bref^Isa_16_8-9" and
     "bref^Jer_48_32". This converts these references to BCVID or
-    BCVIDRange instances.
+    BCVIDRange instances. Conjoined references like
+    "bref^Hagg_2_1,10,18-20" return a biblelib.unit.RangeSet.
 
-    Assumes all references are BCV (no BCID or BID). Does not check
-    the validity of chapter and verse numbers for the book.
+    Assumes all references are BCV (no BCID or BID). Except for
+    conjoined references, does not check the validity of chapter and
+    verse numbers for the book.
 
     """
     assert ref.startswith("bref^"), f"TynBD reference must start with 'bref^': {ref}"
-    ref = ref[5:]  # remove 'bref^'
-    # fix a few idiosyncratic abbreviations
-    fixmap: dict[str, str] = {
-        "1Thes": "1TH",
-        "2Thes": "2TH",
-        "AddEsth": "ESG",
-        "Ecclus": "SIR",
-        "Hagg": "HAG",
-        "Tb": "TOB",
-        "Wisd": "WIS",
-    }
-    # MORE NEEDED HERE
-    # if "," in ref:
-    #     # bref^Hagg_2_1,10,18-20 or bref^Amos_7_1,4,7 or bref^Hagg_1_1,15
-    #     # sometimes a stray final comma like like "bref^Zech_1_7,"
-    #     splits = ref.split(",")
-
-    if "-" in ref:
-        # cross-chapter range
+    # remove 'bref^', and sometimes a stray final comma like "bref^Zech_1_7,"
+    ref = ref[5:].rstrip(",")
+    if "," in ref:
+        # bref^Hagg_2_1,10,18-20 or bref^Amos_7_1,4,7 or bref^Hagg_1_1,15
+        book, rest = ref.split("_", 1)
+        return _tbd_parser().parse(f"{book} {rest}")
+    elif "-" in ref:
+        # verse range, possibly cross-chapter like Zech_1_7-6_8
         book, chapter, verserange = ref.split("_", 2)
         startverse, endverse = verserange.split("-", 1)
-        bookrecord = BOOKS.findbook(fixmap.get(book, book))
+        endchapter = chapter
+        if "_" in endverse:
+            endchapter, endverse = endverse.split("_", 1)
+        bookrecord = _books().findbook(TBD_FIXMAP.get(book, book))
         bcvstart = BCVID(f"{bookrecord.usfmnumber}{pad3(chapter)}{pad3(startverse)}")
-        bcvend = BCVID(f"{bookrecord.usfmnumber}{pad3(chapter)}{pad3(endverse)}")
+        bcvend = BCVID(f"{bookrecord.usfmnumber}{pad3(endchapter)}{pad3(endverse)}")
         return BCVIDRange(bcvstart, bcvend)
     else:
         book, chapter, verse = ref.split("_", 2)
-        bookrecord = BOOKS.findbook(fixmap.get(book, book))
+        bookrecord = _books().findbook(TBD_FIXMAP.get(book, book))
         return BCVID(f"{bookrecord.usfmnumber}{pad3(chapter)}{pad3(verse)}")
 
 
@@ -1089,5 +1322,39 @@ def is_bcvwpid(identifier: str) -> bool:
     best. To really test, use the identifier to create an instance.
 
     """
-    idpat = re.compile(r"^[no]?\d{11,12}$")
-    return bool(idpat.match(identifier))
+    return bool(_BCVWPID_RE.match(identifier))
+
+
+# patterns for IDs that each class accepts on initialization
+_VALID_RES: dict[type, re.Pattern] = {
+    BID: re.compile(r"(?s).{2}"),
+    BCID: re.compile(r"(?s).{5}"),
+    # chapters 000-150
+    BCVID: re.compile(r"[0-8A-C]\d(?:0\d\d|1[0-4]\d|150)\d{3}"),
+    # an explicit canon prefix must match the book
+    BCVWPID: re.compile(r"(?:o[0-3]\d|n(?:[45]\d|6[0-6])|\d\d)\d{9,10}"),
+}
+
+
+def invalid_ids(ids: Iterable[Any], idtype: type = BCVWPID) -> list[tuple[int, Any]]:
+    """Return (row index, ID) for every ID in ids that idtype would reject.
+
+    Checks a whole column with one compiled pattern, rather than
+    constructing instances, so IDs that pass can be loaded with
+    idtype.from_trusted(). Non-string values are always invalid.
+
+    >>> invalid_ids(["41004003001", "4100400300", "o41004003001"])
+    [(1, '4100400300'), (2, 'o41004003001')]
+
+    """
+    assert idtype in _VALID_RES, f"No validator for {idtype}"
+    fullmatch = _VALID_RES[idtype].fullmatch
+    return [(index, ID) for index, ID in enumerate(ids) if not (isinstance(ID, str) and fullmatch(ID))]
+
+
+def validate_ids(ids: Iterable[Any], idtype: type = BCVWPID) -> None:
+    """Raise ValueError listing every ID in ids that idtype would reject."""
+    invalid = invalid_ids(ids, idtype)
+    if invalid:
+        rows = ", ".join(f"{index}: {ID!r}" for index, ID in invalid)
+        raise ValueError(f"{len(invalid)} invalid {idtype.__name__} identifiers: {rows}")
@@ -0,0 +1,140 @@
+"""String-level helpers for BCV identifiers, without instantiating classes.
+
+These give the same results as the BID, BCID, BCVID, and BCVWPID
+methods and simplify() for valid identifiers, but work directly on ID
+strings, so they're much cheaper for bulk processing. They do not
+validate: check untrusted data first with invalid_ids().
+
+As with BCVWPID, word IDs may have a Macula canon prefix ("n" or "o")
+and may omit the part index, which defaults to "1".
+
+>>> from biblelib.word import fastid
+>>> fastid.to_bcvid("n41004003001")
+'41004003'
+>>> fastid.normalize("n41004003001")
+'410040030011'
+>>> fastid.canon_prefix("41004003001")
+'n'
+>>> fastid.includes("41004", "n41004003001")
+True
+>>> fastid.compare("41004003", "41004002")
+1
+
+"""
+
+from .bcvwpid import _get_canon_prefix
+
+# ID kinds by length, as for make_id()
+KINDS: dict[int, str] = {2: "BID", 5: "BCID", 8: "BCVID", 11: "BCVWPID", 12: "BCVWPID", 13: "BCVWPID"}
+# lengths of the normalized ID for each kind
+LENGTHS: dict[str, int] = {"BID": 2, "BCID": 5, "BCVID": 8, "BCVWPID": 12}
+
+
+def kind(ID: str) -> str:
+    """Return the name of the class for an ID string, based on its length.
+
+    Raises ValueError for an unexpected length, like make_id().
+    """
+    idkind = KINDS.get(len(ID))
+    if not idkind:
+        raise ValueError(f"Can't select appropriate class for {len(ID)}-character reference {ID}")
+    return idkind
+
+
+def strip_prefix(ID: str) -> str:
+    """Return ID without any canon prefix."""
+    return ID[1:] if ID[:1] in ("n", "o") else ID
+
+
+def normalize(ID: str) -> str:
+    """Return the ID attribute a class instance would have for ID.
+
+    Word IDs lose any canon prefix and gain a default part index:
+    other IDs are unchanged.
+    """
+    if ID[:1] in ("n", "o"):
+        ID = ID[1:]
+    return ID + "1" if len(ID) == 11 else ID
+
+
+def canon_prefix(ID: str) -> str:
+    """Return the canon prefix for ID: "o" for OT, "n" for NT, and "x" otherwise."""
+    if ID[:1] in ("n", "o"):
+        return ID[0]
+    return _get_canon_prefix(ID[:2])
+
+
+def book_ID(ID: str) -> str:
+    """Return the 2-character book ID."""
+    return strip_prefix(ID)[0:2]
+
+
+def chapter_ID(ID: str) -> str:
+    """Return the 3-character chapter ID."""
+    return strip_prefix(ID)[2:5]
+
+
+def verse_ID(ID: str) -> str:
+    """Return the 3-character verse ID."""
+    return strip_prefix(ID)[5:8]
+
+
+def word_ID(ID: str) -> str:
+    """Return the 3-character word ID of a word ID."""
+    return strip_prefix(ID)[8:11]
+
+
+def part_ID(ID: str) -> str:
+    """Return the part ID of a word ID, defaulting to "1"."""
+    return strip_prefix(ID)[11:12] or "1"
+
+
+def to_bid(ID: str) -> str:
+    """Return the book ID string, like BID.to_bid."""
+    return strip_prefix(ID)[:2]
+
+
+def to_bcid(ID: str) -> str:
+    """Return the book and chapter ID string, like BCID.to_bcid."""
+    return strip_prefix(ID)[:5]
+
+
+def to_bcvid(ID: str) -> str:
+    """Return the book, chapter, and verse ID string, like BCVID.to_bcvid and to_bcv()."""
+    return strip_prefix(ID)[:8]
+
+
+def simplify(ID: str, newkind: str) -> str:
+    """Return the ID string for the same or a less specified kind ("BID", "BCID", or "BCVID").
+
+    Raises ValueError if ID is a book ID, or newkind is more specified
+    than ID or is "BCVWPID", like simplify().
+    """
+    length = LENGTHS.get(newkind, 0)
+    ID = strip_prefix(ID)
+    if not length or len(ID) < max(length, LENGTHS["BCID"]) or newkind == "BCVWPID":
+        raise ValueError(f"Cannot simplify {ID} to {newkind}")
+    return ID[:length]
+
+
+def includes(outer: str, inner: str) -> bool:
+    """Return True if inner is included in the scope of outer, like outer's includes().
+
+    Any ID includes itself. Word IDs only include themselves.
+    """
+    outer = normalize(outer)
+    inner = normalize(inner)
+    assert len(outer) <= len(inner), f"Invalid type with includes(): {inner}"
+    if len(outer) == 12:
+        return outer == inner
+    return inner.startswith(outer)
+
+
+def compare(first: str, second: str) -> int:
+    """Return -1, 0, or 1 as first sorts before, equal to, or after second.
+
+    IDs of the same kind compare as their instances do.
+    """
+    first = normalize(first)
+    second = normalize(second)
+    return (first > second) - (first < second)
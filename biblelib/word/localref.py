@@ -0,0 +1,126 @@
+"""Parse localized reference strings back into BCV identifiers.
+
+This is the reverse of `to_nameref(lang=...)` and
+`to_abbrevref(lang=...)`: book names and abbreviations in any bundled
+language are found with a normalized trie (see
+biblelib.book.booktrie), and chapter and verse numbers are split on
+the language's chapter-verse separator.
+
+>>> from biblelib.word.localref import parse_localized
+>>> parse_localized("Genèse 1.1", lang="fra")
+BCVID('01001001')
+>>> parse_localized("Mc 4.3-4.8", lang="fra")
+BCVIDRange(BCVID('41004003'), BCVID('41004008'))
+>>> parse_localized("marc 4", lang="fra")
+BCID('41004')
+
+Without a language, names must be unambiguous across languages, and
+either ":" or "." separates chapter and verse.
+
+>>> parse_localized("马可福音4:3")
+BCVID('41004003')
+
+"""
+
+from functools import cache
+import re
+from typing import Iterable, Optional, Union
+
+from biblelib.book import Books, get_localized_books
+from biblelib.book.booktrie import BookTrie, get_booktrie
+from .bcvwpid import BID, BCID, BCVID, BCVIDRange, pad3
+
+BOOKS = Books()
+
+LocalizedRef = Union[BID, BCID, BCVID, BCVIDRange]
+
+
+class LocalizedRefParser:
+    """Parse references with book names in a language.
+
+    Handles book, book chapter, book chapter<sep>verse, verse ranges
+    (book c<sep>v-v or c<sep>v-c<sep>v), and chapter ranges (book
+    c-c, as a verse range in the English versification). Does not
+    check the validity of chapter and verse numbers, except for
+    chapter ranges.
+
+    Attributes:
+        lang: ISO 639-3 language code, or None for any language
+        cv_sep: the chapter-verse separator, or None to accept ":" or "."
+
+    """
+
+    def __init__(self, lang: Optional[str] = None) -> None:
+        """Instantiate a parser for lang."""
+        self.lang = lang
+        self.trie: BookTrie = get_booktrie()
+        if lang is None:
+            self.cv_sep: Optional[str] = None
+            sep = "[:.]"
+        else:
+            localized = get_localized_books(lang) if lang != "eng" else None
+            self.cv_sep = localized.cv_sep if localized is not None else ":"
+            sep = re.escape(self.cv_sep)
+        self._bodyre = re.compile(rf"^(\d+)(?:{sep}(\d+))?(?:\s*[-–]\s*(\d+)(?:{sep}(\d+))?)?$")
+
+    def __repr__(self) -> str:
+        """Return a string representation."""
+        return f"{type(self).__name__}({self.lang!r})"
+
+    def parse(self, ref: str) -> LocalizedRef:
+        """Return a BCV instance for a localized reference.
+
+        Raises ValueError if ref can't be parsed.
+        """
+        found = self.trie.matches(ref, lang=self.lang)
+        if not found:
+            raise ValueError(f"No book name found in {ref!r}")
+        # prefer the longest book name that leaves a valid chapter
+        # and verse: "Baruk 4:1" is Baruch, not "Baruk 4" (4 Baruch)
+        for usfmname, end in reversed(found):
+            body = ref[end:].strip(" .\t")
+            bodymatch = self._bodyre.match(body)
+            if not body or bodymatch:
+                break
+        else:
+            raise ValueError(f"Invalid chapter and verse in {ref!r}")
+        book_ID: str = BOOKS[usfmname].usfmnumber
+        if not bodymatch:
+            return BID(book_ID)
+        chapter, verse, endnum, endverse = bodymatch.groups()
+        if not verse:
+            if not endnum:
+                return BCID(f"{book_ID}{pad3(chapter)}")
+            # chapter range
+            from biblelib.versification.VerseTable import get_versetable
+
+            endchapter = endnum
+            if not endverse:
+                lastverses = get_versetable("eng").lastverses
+                if f"{book_ID}{pad3(chapter)}" not in lastverses or f"{book_ID}{pad3(endchapter)}" not in lastverses:
+                    raise ValueError(f"Invalid chapter range in {ref!r}")
+                endverse = str(lastverses[f"{book_ID}{pad3(endchapter)}"])
+            return BCVIDRange(
+                BCVID(f"{book_ID}{pad3(chapter)}001"), BCVID(f"{book_ID}{pad3(endchapter)}{pad3(endverse)}")
+            )
+        startid = BCVID(f"{book_ID}{pad3(chapter)}{pad3(verse)}")
+        if not endnum:
+            return startid
+        endchapter, endverse = (endnum, endverse) if endverse else (chapter, endnum)
+        return BCVIDRange(startid, BCVID(f"{book_ID}{pad3(endchapter)}{pad3(endverse)}"))
+
+    def parse_many(self, refs: Iterable[str]) -> list[LocalizedRef]:
+        """Return a BCV instance for each localized reference in refs."""
+        parse = self.parse
+        return [parse(ref) for ref in refs]
+
+
+@cache
+def get_localizedrefparser(lang: Optional[str] = None) -> LocalizedRefParser:
+    """Return the shared LocalizedRefParser for lang."""
+    return LocalizedRefParser(lang)
+
+
+def parse_localized(ref: str, lang: Optional[str] = None) -> LocalizedRef:
+    """Return a BCV instance for a reference like "Genèse 1.1" in lang."""
+    return get_localizedrefparser(lang).parse(ref)
@@ -1,8 +1,35 @@
 """Code for mapping between word-level identifiers for various editions."""
 
-from .gnt import GNTMapping, GNTMappings
-from .wlcm import WLCMMapping, WLCMMappings
-from .marble import Mapper
+from typing import TYPE_CHECKING
+
+from biblelib._lazy import attach
+
+if TYPE_CHECKING:
+    from .gnt import GNTMapping, GNTMappings
+    from .wlcm import WLCMMapping, WLCMMappings
+    from .marble import Mapper
+    from .shared import SharedMappingExecutor, SharedMarbleTable, worker_table
+    from .wordcounts import WordCountTable, get_wordcounts, load_wordcounts
+
+# Names are imported on first access (PEP 562), so the download
+# dependencies (see biblelib.data) and multiprocessing are only loaded
+# when they're needed. Maps a name to its module.
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "GNTMapping": "gnt",
+        "GNTMappings": "gnt",
+        "WLCMMapping": "wlcm",
+        "WLCMMappings": "wlcm",
+        "Mapper": "marble",
+        "SharedMappingExecutor": "shared",
+        "SharedMarbleTable": "shared",
+        "worker_table": "shared",
+        "WordCountTable": "wordcounts",
+        "get_wordcounts": "wordcounts",
+        "load_wordcounts": "wordcounts",
+    },
+)
 
 
 __all__ = [
@@ -14,4 +41,12 @@ __all__ = [
     "WLCMMappings",
     # mappgins.marble
     "Mapper",
+    # mappings.shared
+    "SharedMappingExecutor",
+    "SharedMarbleTable",
+    "worker_table",
+    # mappings.wordcounts
+    "WordCountTable",
+    "get_wordcounts",
+    "load_wordcounts",
 ]
@@ -27,13 +27,16 @@ Examples:
 """
 
 from collections import UserList
-from csv import DictReader
-from dataclasses import dataclass
+from csv import reader
+from dataclasses import dataclass, fields
+from operator import itemgetter
 from pathlib import Path
+import threading
+from typing import Any, Callable
 from unicodedata import normalize
 from warnings import warn
 
-from biblelib import data
+from biblelib import data, metrics
 
 
 @dataclass
@@ -75,16 +78,19 @@ class GNTMapping:
 
     def __post_init__(self) -> None:
         """Compute data after initialization."""
-        # add corpus prefixes
-        if self.NA1904_ID and not self.NA1904_ID.startswith("n"):
-            self.NA1904_ID = f"n{self.NA1904_ID}"
-        if self.SBLGNT_ID and not self.SBLGNT_ID.startswith("n"):
-            self.SBLGNT_ID = f"n{self.SBLGNT_ID}"
+        self._add_prefixes()
         # ensure both text forms are normalized to aid in testing
         # equality: this means they may differ from original source.
         self.NA1904_Text = normalize("NFC", self.NA1904_Text)
         self.SBLGNT_Text = normalize("NFC", self.SBLGNT_Text)
 
+    def _add_prefixes(self) -> None:
+        """Add corpus prefixes to IDs that lack them."""
+        if self.NA1904_ID and not self.NA1904_ID.startswith("n"):
+            self.NA1904_ID = f"n{self.NA1904_ID}"
+        if self.SBLGNT_ID and not self.SBLGNT_ID.startswith("n"):
+            self.SBLGNT_ID = f"n{self.SBLGNT_ID}"
+
     def __repr__(self) -> str:
         """Return a string representation."""
         return f"<GNTMapping: {self.SBLGNT_ID}>"
@@ -95,29 +101,160 @@ class GNTMapping:
         return self.MARBLE_ID
 
 
+class _LazyTextGNTMapping(GNTMapping):
+    """A GNTMapping whose text forms are normalized on first access.
+
+    This behaves like GNTMapping, but avoids normalizing text for
+    callers that only use IDs. Raw text is kept under private names
+    until first read.
+    """
+
+    def __init__(
+        self,
+        NA1904_ID: str,
+        NA1904_Text: str,
+        NA27_ID: str,
+        NA28_ID: str,
+        SBLGNT_ID: str,
+        SBLGNT_Text: str,
+        MARBLE_ID: str,
+    ) -> None:
+        """Initialize without normalizing text."""
+        self.NA1904_ID = NA1904_ID
+        self._raw_NA1904_Text = NA1904_Text
+        self.NA27_ID = NA27_ID
+        self.NA28_ID = NA28_ID
+        self.SBLGNT_ID = SBLGNT_ID
+        self._raw_SBLGNT_Text = SBLGNT_Text
+        self.MARBLE_ID = MARBLE_ID
+        self._add_prefixes()
+
+    def __getattr__(self, name: str) -> str:
+        """Normalize and store a text form when it's first read."""
+        attrs = self.__dict__
+        raw = attrs.get(f"_raw_{name}") if name in _TEXTFIELDS else None
+        if raw is None:
+            # another thread may have stored the text since this lookup started
+            if name in attrs:
+                return attrs[name]  # type: ignore[no-any-return]
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        text = normalize("NFC", raw)
+        # store the text before dropping the raw form, so other threads find one or the other
+        attrs[name] = text
+        attrs.pop(f"_raw_{name}", None)
+        return text
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if other has the same field values, whether lazy or not."""
+        if not isinstance(other, GNTMapping):
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in fields(GNTMapping))
+
+
+# TSV columns that hold text
+_TEXTFIELDS = ("NA1904_Text", "SBLGNT_Text")
+# load modes for GNTMappings text columns
+TEXTMODES = ("full", "lazy", "none")
+# held while building lookup indexes
+_lock = threading.Lock()
+
+
+def _row_factory(header: list[str], text: str) -> Callable[[list[str]], GNTMapping]:
+    """Return a function to make a GNTMapping from a TSV row with header.
+
+    Rows are read by column position, which is much faster than
+    building a dict for each row.
+    """
+    names = [field.name for field in fields(GNTMapping)]
+    if text == "none":
+        getids = itemgetter(*[header.index(name) for name in names if name not in _TEXTFIELDS])
+
+        def make_idmapping(row: list[str]) -> GNTMapping:
+            na1904_id, na27_id, na28_id, sblgnt_id, marble_id = getids(row)
+            return _LazyTextGNTMapping(na1904_id, "", na27_id, na28_id, sblgnt_id, "", marble_id)
+
+        return make_idmapping
+    cls = GNTMapping if text == "full" else _LazyTextGNTMapping
+    getvalues = itemgetter(*[header.index(name) for name in names])
+    return lambda row: cls(*getvalues(row))
+
+
 class GNTMappings(UserList):
     """Manage a sequence of GNTMapping instances."""
 
     # Retained for provenance only: the upstream source of the mapping data.
     gitmappings = "https://raw.githubusercontent.com/Clear-Bible/macula-greek/main/sources/Clear/mappings/mappings-GNT-stripped.tsv"
 
-    def __init__(self, sourcefile: str = "") -> None:
+    @metrics.timed("mappings.GNTMappings.load")
+    def __init__(self, sourcefile: str = "", text: str = "full") -> None:
         """Initialize GNTMappings.
 
         By default the mapping data is downloaded on first use and read
         from the local cache (see biblelib.data). Pass sourcefile to
         read a different local TSV instead.
+
+        Normalizing the text columns is a large part of the load
+        time, so text selects how they're handled:
+        - "full" (the default): normalize all text on loading
+        - "lazy": normalize the text of each mapping on first access
+        - "none": don't load text (text attributes are empty), for
+          callers that only need ID mappings
         """
+        assert text in TEXTMODES, f"text must be one of {TEXTMODES}: {text}"
         super().__init__()
+        self.text = text
         path = Path(sourcefile) if sourcefile else data.fetch(data.GNT_MAPPINGS)
-        with path.open(encoding="utf-8") as f:
-            reader: DictReader = DictReader(f, dialect="excel-tab")
-            self.data: list = [GNTMapping(**r) for r in reader]
+        with path.open(encoding="utf-8", newline="") as f:
+            rows = reader(f, dialect="excel-tab")
+            make_mapping = _row_factory(next(rows), text)
+            self.data: list = [make_mapping(row) for row in rows if row]
+        metrics.count("mappings.GNTMappings.rows", len(self.data))
         # map MARBLE IDs to a GNTMapping instance
         self.marble_ids: dict[str, GNTMapping] = {}
         # map NA28 IDs to a GNTMapping instance
         self.na28_ids: dict[str, GNTMapping] = {}
 
+    def _index(self, attrname: str, label: str) -> dict[str, GNTMapping]:
+        """Return a new index of the mappings by the ID in attrname."""
+        index: dict[str, GNTMapping] = {}
+        for mapping in self.data:
+            thisid = getattr(mapping, attrname)
+            if thisid:
+                # only store if there's actually an ID
+                if thisid in index:
+                    warn(f"Duplicate {label} ID {thisid} in {mapping}")
+                index[thisid] = mapping
+        return index
+
+    def _ensure_marble_ids(self) -> dict[str, GNTMapping]:
+        """Generate the MARBLE ID index if needed.
+
+        The index is published only when it's complete, so other
+        threads never see part of it.
+        """
+        # lazy initialization of the dictionary: check again with the
+        # lock held, in case another thread built it meanwhile
+        if not self.marble_ids:
+            with _lock:
+                if not self.marble_ids:
+                    with metrics.timer("mappings.GNTMappings.marble_index"):
+                        self.marble_ids = self._index("MARBLE_ID", "MARBLE")
+        return self.marble_ids
+
+    def _ensure_na28_ids(self) -> dict[str, GNTMapping]:
+        """Generate the NA28 ID index if needed, like _ensure_marble_ids()."""
+        if not self.na28_ids:
+            with _lock:
+                if not self.na28_ids:
+                    with metrics.timer("mappings.GNTMappings.na28_index"):
+                        self.na28_ids = self._index("NA28_ID", "NA28")
+        return self.na28_ids
+
+    def build_indexes(self) -> None:
+        """Build the lookup indexes now, rather than on first use."""
+        self._ensure_marble_ids()
+        self._ensure_na28_ids()
+
     def marble2sblgnt(self, marbleid: str) -> str:
         """Return an SBLGNT ID for a MARBLE ID.
 
@@ -125,16 +262,7 @@ class GNTMappings(UserList):
         mapping, or if there isn't an SBLGNT ID that corresponds.
 
         """
-        # lazy initialization of the dictionary
-        if not self.marble_ids:
-            for mapping in self.data:
-                thismarbleid = mapping.MARBLE_ID
-                if thismarbleid:
-                    # only store if there's actually an ID
-                    if thismarbleid in self.marble_ids:
-                        warn(f"Duplicate MARBLE ID {thismarbleid} in {mapping}")
-                    self.marble_ids[thismarbleid] = mapping
-        mapping = self.marble_ids.get(marbleid)
+        mapping = self._ensure_marble_ids().get(marbleid)
         mappedstr: str = mapping.SBLGNT_ID if mapping else ""
         return mappedstr
 
@@ -145,15 +273,6 @@ class GNTMappings(UserList):
         or if there isn't an SBLGNT ID that corresponds.
 
         """
-        # lazy initialization of the dictionary
-        if not self.na28_ids:
-            for mapping in self.data:
-                thisna28id = mapping.NA28_ID
-                if thisna28id:
-                    # only store if there's actually an ID
-                    if thisna28id in self.na28_ids:
-                        warn(f"Duplicate NA28 ID {thisna28id} in {mapping}")
-                    self.na28_ids[thisna28id] = mapping
-        mapping = self.na28_ids.get(na28id)
+        mapping = self._ensure_na28_ids().get(na28id)
         mappedstr: str = mapping.SBLGNT_ID if mapping else ""
         return mappedstr
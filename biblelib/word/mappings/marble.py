@@ -4,6 +4,8 @@ import re
 from functools import cache
 from warnings import warn
 
+from biblelib import metrics
+
 from .gnt import GNTMappings
 from .wlcm import WLCMMappings
 
@@ -14,8 +16,9 @@ def gnt_mappings() -> GNTMappings:
 
     The underlying data is downloaded and cached on first access, not
     at import time, so importing this module has no network cost.
+    Text is normalized on first access, since mapping only uses IDs.
     """
-    return GNTMappings()
+    return GNTMappings(text="lazy")
 
 
 @cache
@@ -24,6 +27,19 @@ def wlcm_mappings() -> WLCMMappings:
     return WLCMMappings()
 
 
+metrics.register_cache("mappings.gnt_mappings", gnt_mappings)
+metrics.register_cache("mappings.wlcm_mappings", wlcm_mappings)
+
+
+def trim_marbleid(marbleid: str) -> str:
+    """Return a word-level MARBLE ID without any UBS suffix."""
+    # some UBS DGNT references have this as a suffix: fragile
+    if re.search(r"\({N:00\d}\)$", marbleid) or re.search(r"{N:00\d}$", marbleid):
+        marbleid = marbleid[:14]
+    assert len(marbleid) == 14, f"{len(marbleid)} characters, not a UBS reference: {marbleid}"
+    return marbleid
+
+
 class Mapper:
     """Map MARBLE references to WLCM and SBLGNT references."""
 
@@ -45,11 +61,7 @@ class Mapper:
         references.
 
         """
-        # some UBS DGNT references have this as a suffix: fragile
-        if re.search(r"\({N:00\d}\)$", marbleid) or re.search(r"{N:00\d}$", marbleid):
-            marbleid = marbleid[:14]
-        assert len(marbleid) == 14, f"{len(marbleid)} characters, not a UBS reference: {marbleid}"
-
+        marbleid = trim_marbleid(marbleid)
         bookid = marbleid[:3]
         if "000" < bookid < "040":
             return self.wlcm.marble2macula(marbleid)
@@ -0,0 +1,249 @@
+"""Share the MARBLE mapping indexes between processes without copying them.
+
+Converting a large UBS dataset with a process pool means either each
+worker parses the GNT and WLCM mapping tables itself, or receives them
+pickled. Instead, SharedMarbleTable.publish() writes the MARBLE ID
+indexes of both tables once into a block of
+:mod:`multiprocessing.shared_memory`, and workers attach to it by name:
+lookups read the shared block directly.
+
+The block holds the MARBLE IDs, sorted and of fixed width, followed by
+the offsets and UTF-8 text of the mapped IDs (space-separated MACULA
+IDs for the Hebrew Bible, the SBLGNT ID for the New Testament). A
+lookup is a binary search, so it's slower than a dictionary lookup,
+but costs each process almost no memory. Instances pickle as the name
+of their block, so they can be passed to workers like any argument.
+
+SharedMappingExecutor is a ProcessPoolExecutor that publishes the table
+when it starts, attaches each worker to it, and unlinks it on shutdown:
+
+>>> from biblelib.word.mappings.shared import SharedMappingExecutor
+>>> with SharedMappingExecutor(max_workers=4) as executor:
+...     converted = list(executor.fromubs(["02306000600008", "04100100100002"]))
+>>> converted[0]
+[BCVWPID('230600060041')]
+
+"""
+
+import struct
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+from warnings import warn
+
+from .gnt import GNTMappings
+from .marble import gnt_mappings, trim_marbleid, wlcm_mappings
+from .wlcm import WLCMMappings
+
+if TYPE_CHECKING:
+    from ..bcvwpid import BCVID, BCVWPID
+
+# magic, format version, number of keys, key width
+_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"BLMT"
+_VERSION = 1
+# keep every nth key in each process, to narrow the binary search
+_FENCESTEP = 256
+
+
+class SharedMarbleTable:
+    """A read-only map of MARBLE IDs to mapped IDs, in shared memory.
+
+    Use publish() to create one, and attach() (or unpickling) to use
+    it from another process. Call close() in every process when done,
+    and unlink() once, in the publishing process.
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool = False) -> None:
+        """Initialize a table from a shared memory block it's published in."""
+        self.shm = shm
+        self.owner = owner
+        self._buf = shm.buf
+        magic, version, self._count, self._width = _HEADER.unpack_from(self._buf)
+        assert magic == _MAGIC, f"Not a shared MARBLE table: {shm.name}"
+        assert version == _VERSION, f"Unsupported shared MARBLE table version {version}: {shm.name}"
+        keysize = self._count * self._width
+        offsetstart = _HEADER.size + _padded(keysize)
+        valuestart = offsetstart + 4 * (self._count + 1)
+        self._keys = self._buf[_HEADER.size : _HEADER.size + keysize]
+        self._offsets = self._buf[offsetstart:valuestart].cast("I")
+        self._values = self._buf[valuestart:]
+        width = self._width
+        self._fences = [
+            self._keys[index * width : (index + 1) * width].tobytes() for index in range(0, self._count, _FENCESTEP)
+        ]
+
+    @classmethod
+    def publish(
+        cls, gnt: Optional[GNTMappings] = None, wlcm: Optional[WLCMMappings] = None, name: Optional[str] = None
+    ) -> "SharedMarbleTable":
+        """Write the MARBLE indexes of gnt and wlcm to a new shared memory block, and return it.
+
+        gnt and wlcm default to the shared mappings (see
+        marble.gnt_mappings() and marble.wlcm_mappings()), which are
+        loaded if needed. name defaults to a random name.
+        """
+        gnt = gnt if gnt is not None else gnt_mappings()
+        wlcm = wlcm if wlcm is not None else wlcm_mappings()
+        # the book ranges don't overlap, so one table serves both
+        items = sorted(
+            [(marbleid, mapping.MACULA_IDs) for marbleid, mapping in wlcm._ensure_marble_ids().items()]
+            + [(marbleid, mapping.SBLGNT_ID) for marbleid, mapping in gnt._ensure_marble_ids().items()]
+        )
+        keys = b"".join(key.encode("ascii") for key, _ in items)
+        width = len(items[0][0]) if items else 0
+        assert len(keys) == width * len(items), "MARBLE IDs must all be the same length"
+        values = [value.encode("utf-8") for _, value in items]
+        offsets = [0]
+        for value in values:
+            offsets.append(offsets[-1] + len(value))
+        offsetstart = _HEADER.size + _padded(len(keys))
+        valuestart = offsetstart + 4 * len(offsets)
+        # a block can't be empty
+        shm = SharedMemory(name=name, create=True, size=max(1, valuestart + offsets[-1]))
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _VERSION, len(items), width)
+        shm.buf[_HEADER.size : _HEADER.size + len(keys)] = keys
+        struct.pack_into(f"<{len(offsets)}I", shm.buf, offsetstart, *offsets)
+        shm.buf[valuestart : valuestart + offsets[-1]] = b"".join(values)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMarbleTable":
+        """Return the table published with name, without copying it."""
+        return cls(SharedMemory(name=name))
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self.shm.name
+
+    def __len__(self) -> int:
+        """Return the number of MARBLE IDs."""
+        return self._count
+
+    def __repr__(self) -> str:
+        """Return a printed representation."""
+        return f"{type(self).__name__}(name={self.name!r}, len={self._count})"
+
+    def __reduce__(self) -> tuple[Any, tuple[str]]:
+        """Pickle as the block name, so unpickling attaches without copying."""
+        return (type(self).attach, (self.name,))
+
+    def __enter__(self) -> "SharedMarbleTable":
+        """Return self."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the table, and unlink it if this process published it."""
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def get(self, marbleid: str, default: str = "") -> str:
+        """Return the mapped IDs for a MARBLE ID, or default if it isn't in the table."""
+        target = marbleid.encode("ascii", errors="replace")
+        width = self._width
+        if len(target) != width or not self._fences:
+            return default
+        keys = self._keys
+        low = (bisect_right(self._fences, target) - 1) * _FENCESTEP
+        if low < 0:
+            return default
+        high = min(low + _FENCESTEP, self._count)
+        while low < high:
+            middle = (low + high) // 2
+            probe = keys[middle * width : (middle + 1) * width].tobytes()
+            if probe < target:
+                low = middle + 1
+            elif probe > target:
+                high = middle
+            else:
+                return str(self._values[self._offsets[middle] : self._offsets[middle + 1]], "utf-8")
+        return default
+
+    def to_macula(self, marbleid: str) -> list[str]:
+        """Map a MARBLE reference to a list of WLCM or SBLGNT references.
+
+        Like Mapper.to_macula(), but reading the shared table.
+        """
+        marbleid = trim_marbleid(marbleid)
+        if not "000" < marbleid[:3] < "067":
+            warn(f"Invalid book ID for MARBLE ID: {marbleid}")
+            return []
+        mapped = self.get(marbleid)
+        return mapped.split(" ") if mapped else []
+
+    def close(self) -> None:
+        """Stop using the table in this process."""
+        for view in (self._keys, self._offsets, self._values):
+            view.release()
+        self._fences = []
+        self._count = 0
+        self.shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory block, once every process is done with it."""
+        self.shm.unlink()
+
+
+def _padded(size: int) -> int:
+    """Return size rounded up to a multiple of 4, to align the offsets."""
+    return (size + 3) // 4 * 4
+
+
+# the table a worker process attached to
+_worker_table: Optional[SharedMarbleTable] = None
+
+
+def _attach_worker(table: SharedMarbleTable) -> None:
+    """Keep the table a worker was given (attached when it was unpickled)."""
+    global _worker_table
+    _worker_table = table
+
+
+def worker_table() -> SharedMarbleTable:
+    """Return the shared table in a SharedMappingExecutor worker."""
+    assert _worker_table is not None, "Not in a SharedMappingExecutor worker process"
+    return _worker_table
+
+
+def _fromubs(ref: str) -> list["BCVID | BCVWPID"]:
+    """Convert a UBS reference with the worker's shared table."""
+    from ..ubs import fromubs
+
+    return fromubs(ref, mapper=worker_table())
+
+
+class SharedMappingExecutor(ProcessPoolExecutor):
+    """A process pool whose workers share one copy of the MARBLE mappings.
+
+    On creation, publishes table (by default, a new SharedMarbleTable
+    from the shared mappings), and attaches each worker to it: use
+    worker_table() in functions you submit. A table the executor
+    publishes is unlinked on shutdown, so with shutdown(wait=False),
+    workers that haven't started yet may fail.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, table: Optional[SharedMarbleTable] = None, **kwargs: Any):
+        """Initialize the executor, publishing the table unless one is given.
+
+        Other arguments are passed to ProcessPoolExecutor, except
+        initializer and initargs, which attach the workers.
+        """
+        assert "initializer" not in kwargs, "SharedMappingExecutor uses its own initializer"
+        self.table = table if table is not None else SharedMarbleTable.publish()
+        self._ownstable = table is None
+        super().__init__(max_workers, initializer=_attach_worker, initargs=(self.table,), **kwargs)
+
+    def fromubs(self, refs: Iterable[str], chunksize: int = 1000) -> Iterator[list["BCVID | BCVWPID"]]:
+        """Convert UBS references with fromubs(), in parallel and in order."""
+        return self.map(_fromubs, refs, chunksize=chunksize)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shut down the workers, then free the table if the executor published it."""
+        super().shutdown(wait, cancel_futures=cancel_futures)
+        if self._ownstable:
+            self._ownstable = False
+            self.table.close()
+            self.table.unlink()
@@ -27,9 +27,13 @@ from collections import UserList
 from csv import DictReader
 from dataclasses import dataclass
 from pathlib import Path
+import threading
 from warnings import warn
 
-from biblelib import data
+from biblelib import data, metrics
+
+# held while building lookup indexes
+_lock = threading.Lock()
 
 
 @dataclass
@@ -73,6 +77,7 @@ class WLCMMappings(UserList):
     # Retained for provenance only: the upstream source of the mapping data.
     gitmappings = "https://raw.githubusercontent.com/Clear-Bible/macula-hebrew/main/mappings/tsv/macula_to_marble_map.tsv"
 
+    @metrics.timed("mappings.WLCMMappings.load")
     def __init__(self, sourcefile: str = "") -> None:
         """Initialize WLCMMappings.
 
@@ -85,9 +90,37 @@ class WLCMMappings(UserList):
         with path.open(encoding="utf-8") as f:
             reader: DictReader = DictReader(f, dialect="excel-tab")
             self.data: list = [WLCMMapping(**r) for r in reader]
+        metrics.count("mappings.WLCMMappings.rows", len(self.data))
         # map MARBLE IDs to a WLCMMapping instance
         self.marble_ids: dict[str, WLCMMapping] = {}
 
+    def _ensure_marble_ids(self) -> dict[str, WLCMMapping]:
+        """Generate the MARBLE ID index if needed.
+
+        The index is published only when it's complete, so other
+        threads never see part of it.
+        """
+        # lazy initialization of the dictionary: check again with the
+        # lock held, in case another thread built it meanwhile
+        if not self.marble_ids:
+            with _lock:
+                if not self.marble_ids:
+                    with metrics.timer("mappings.WLCMMappings.marble_index"):
+                        marble_ids: dict[str, WLCMMapping] = {}
+                        for mapping in self.data:
+                            thismarbleid = mapping.MARBLE_IDs
+                            if thismarbleid:
+                                # only store if there's actually an ID
+                                if thismarbleid in marble_ids:
+                                    warn(f"Duplicate MARBLE ID {thismarbleid} in {mapping}")
+                                marble_ids[thismarbleid] = mapping
+                        self.marble_ids = marble_ids
+        return self.marble_ids
+
+    def build_indexes(self) -> None:
+        """Build the lookup indexes now, rather than on first use."""
+        self._ensure_marble_ids()
+
     def marble2macula(self, marbleid: str) -> list[str]:
         """Return one or more MACULA IDs for a MARBLE ID.
 
@@ -99,15 +132,6 @@ class WLCMMappings(UserList):
         assert (
             "000" < marbleid[:3] < "040"
         ), f"Invalid book range for MARBLE ID: {marbleid}"
-        # lazy initialization of the dictionary
-        if not self.marble_ids:
-            for mapping in self.data:
-                thismarbleid = mapping.MARBLE_IDs
-                if thismarbleid:
-                    # only store if there's actually an ID
-                    if thismarbleid in self.marble_ids:
-                        warn(f"Duplicate MARBLE ID {thismarbleid} in {mapping}")
-                    self.marble_ids[thismarbleid] = mapping
-        mapping = self.marble_ids.get(marbleid)
+        mapping = self._ensure_marble_ids().get(marbleid)
         mappedstr: list[str] = mapping.MACULA_IDs.split(" ") if mapping else []
         return mappedstr
@@ -0,0 +1,218 @@
+"""Provide per-verse word counts and token offsets for Macula editions.
+
+A WordCountTable records how many words (and, for Hebrew, word parts)
+each verse has in an edition, and the offset of each verse's first
+token in the edition. It's derived once from the ID columns of the
+mapping TSVs (see biblelib.data), without instantiating mappings, and
+saved as JSON in the data cache, so later loads are fast.
+
+Examples:
+
+>>> from biblelib.word.mappings.wordcounts import get_wordcounts
+>>> sblgnt = get_wordcounts("SBLGNT")
+>>> sblgnt.wordcount("43001001")
+17
+>>> sblgnt.word_range("43001001")
+<WordRange: 430010010011-430010010171>
+
+"""
+
+from contextlib import suppress
+from csv import DictReader
+from functools import cache
+from itertools import accumulate
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from biblelib import data, metrics
+from biblelib.word import fastid
+
+if TYPE_CHECKING:
+    from biblelib.unit.unitrange import WordRange
+
+# maps an edition name to its mapping file and ID column
+EDITIONS: dict[str, tuple[str, str]] = {
+    "SBLGNT": (data.GNT_MAPPINGS, "SBLGNT_ID"),
+    "NA27": (data.GNT_MAPPINGS, "NA27_ID"),
+    "NA28": (data.GNT_MAPPINGS, "NA28_ID"),
+    "NA1904": (data.GNT_MAPPINGS, "NA1904_ID"),
+    "WLCM": (data.WLCM_MAPPINGS, "MACULA_IDs"),
+}
+
+
+class WordCountTable:
+    """Word counts and token offsets for each verse in an edition.
+
+    Word IDs are numbered from 1 within each verse. Where words have
+    more than one part (Hebrew), parts records the number of parts of
+    each word as a string of digits, like "1121"; otherwise it's
+    empty.
+
+    Attributes:
+        edition: the edition name, like "SBLGNT"
+        wordcounts: maps a verse ID string to its number of words
+        parts: maps a verse ID string to part counts for each word, if
+            any word has more than one part
+        offsets: maps a verse ID string to the index of its first
+            token in the edition
+        total: the number of tokens in the edition
+
+    """
+
+    def __init__(self, edition: str, wordcounts: dict[str, int], parts: Optional[dict[str, str]] = None) -> None:
+        """Instantiate a table from word counts and part counts by verse."""
+        self.edition = edition
+        self.wordcounts = dict(sorted(wordcounts.items()))
+        self.parts = parts or {}
+        tokencounts = [self.tokencount(verse) for verse in self.wordcounts]
+        self.offsets: dict[str, int] = dict(zip(self.wordcounts, accumulate(tokencounts, initial=0)))
+        self.total: int = sum(tokencounts)
+
+    def __repr__(self) -> str:
+        """Return a string representation."""
+        return f"<WordCountTable: {self.edition}, {len(self)} verses>"
+
+    def __len__(self) -> int:
+        """Return the number of verses."""
+        return len(self.wordcounts)
+
+    def __contains__(self, verse: str) -> bool:
+        """Return True if the verse ID string has words in this edition."""
+        return verse in self.wordcounts
+
+    @classmethod
+    def from_ids(cls, edition: str, ids: Iterable[str]) -> "WordCountTable":
+        """Return a table for the word IDs of an edition, in any order.
+
+        IDs may have canon prefixes, and a part index.
+        """
+        maxparts: dict[str, dict[int, int]] = {}
+        for ID in ids:
+            ID = fastid.normalize(ID)
+            words = maxparts.setdefault(ID[:8], {})
+            word, part = int(ID[8:11]), int(ID[11])
+            if part > words.get(word, 0):
+                words[word] = part
+        wordcounts = {verse: max(words) for verse, words in maxparts.items()}
+        parts = {
+            verse: "".join(str(words.get(word, 1)) for word in range(1, wordcounts[verse] + 1))
+            for verse, words in maxparts.items()
+            if any(part > 1 for part in words.values())
+        }
+        return cls(edition, wordcounts, parts)
+
+    @classmethod
+    def from_tsv(cls, edition: str, path: Path) -> "WordCountTable":
+        """Return a table from the ID column of a mapping TSV."""
+        assert edition in EDITIONS, f"Unknown edition: {edition}"
+        column = EDITIONS[edition][1]
+        with path.open(encoding="utf-8") as f:
+            reader: DictReader = DictReader(f, dialect="excel-tab")
+            return cls.from_ids(edition, (ID for row in reader for ID in row[column].split() if ID))
+
+    def to_json(self, path: Path) -> None:
+        """Save the table as JSON."""
+        # unique to this process, so processes saving the same table don't collide
+        tmppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with tmppath.open("w", encoding="utf-8") as f:
+                json.dump({"edition": self.edition, "wordcounts": self.wordcounts, "parts": self.parts}, f)
+            # replace atomically, in case another process is reading
+            os.replace(tmppath, path)
+        except OSError:
+            with suppress(OSError):
+                tmppath.unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def from_json(cls, path: Path) -> "WordCountTable":
+        """Return a table saved with to_json()."""
+        with path.open(encoding="utf-8") as f:
+            tabledata = json.load(f)
+        return cls(tabledata["edition"], tabledata["wordcounts"], tabledata["parts"])
+
+    def wordcount(self, verse: str) -> int:
+        """Return the number of words in a verse ID string, or 0 if it's not in the edition.
+
+        This is suitable as the wordcounts argument for WordRange.
+        """
+        return self.wordcounts.get(verse, 0)
+
+    def tokencount(self, verse: str) -> int:
+        """Return the number of tokens (word parts) in a verse ID string."""
+        partcounts = self.parts.get(verse)
+        if partcounts:
+            return sum(map(int, partcounts))
+        return self.wordcounts.get(verse, 0)
+
+    def offset(self, verse: str) -> int:
+        """Return the index of the first token of a verse ID string in the edition."""
+        return self.offsets[verse]
+
+    def token_ids(self, verse: str) -> Iterator[str]:
+        """Yield the normalized token ID strings for a verse ID string, in order."""
+        partcounts = self.parts.get(verse)
+        for word in range(1, self.wordcounts.get(verse, 0) + 1):
+            for part in range(1, (int(partcounts[word - 1]) if partcounts else 1) + 1):
+                yield f"{verse}{word:03d}{part}"
+
+    def token_range(self, verse: str) -> tuple[str, str]:
+        """Return the first and last normalized token IDs for a verse ID string."""
+        words = self.wordcounts[verse]
+        partcounts = self.parts.get(verse)
+        lastpart = partcounts[-1] if partcounts else "1"
+        return f"{verse}0011", f"{verse}{words:03d}{lastpart}"
+
+    def word_range(self, verse: str) -> "WordRange":
+        """Return a WordRange for the tokens of a verse ID string."""
+        # imported here: biblelib.unit imports biblelib.word
+        from biblelib.unit.unitrange import WordRange
+
+        return WordRange(*self.token_range(verse))
+
+
+def _cachepath(edition: str) -> Path:
+    """Return the data cache path for an edition's table, keyed by the source file hash."""
+    filename, _ = EDITIONS[edition]
+    sourcehash = data.REGISTRY[filename].split(":")[-1][:16]
+    return Path(data.POOCH_STORE.abspath) / f"wordcounts-{edition}-{sourcehash}.json"
+
+
+def load_wordcounts(edition: str, sourcefile: str = "", cachefile: str = "") -> WordCountTable:
+    """Return the WordCountTable for an edition, building and caching it if needed.
+
+    By default, the table is read from the data cache, or derived from
+    the downloaded mapping file (see biblelib.data) and saved there.
+    Pass sourcefile to read a different local TSV, and cachefile to
+    save the table somewhere else (a table derived from sourcefile is
+    only cached with cachefile).
+    """
+    assert edition in EDITIONS, f"Unknown edition: {edition}"
+    if cachefile or not sourcefile:
+        cachepath = Path(cachefile) if cachefile else _cachepath(edition)
+        try:
+            return WordCountTable.from_json(cachepath)
+        except (OSError, ValueError, KeyError, TypeError):
+            # missing, or truncated or corrupt: derive it again, and replace it
+            pass
+    path = Path(sourcefile) if sourcefile else data.fetch(EDITIONS[edition][0])
+    table = WordCountTable.from_tsv(edition, path)
+    if cachefile or not sourcefile:
+        try:
+            cachepath.parent.mkdir(parents=True, exist_ok=True)
+            table.to_json(cachepath)
+        except OSError:
+            # read-only or full disk: derive the table each time
+            pass
+    return table
+
+
+@cache
+def get_wordcounts(edition: str) -> WordCountTable:
+    """Return the shared WordCountTable for an edition."""
+    return load_wordcounts(edition)
+
+
+metrics.register_cache("mappings.wordcounts", get_wordcounts)
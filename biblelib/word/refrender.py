@@ -0,0 +1,117 @@
+"""Render reference strings from BCV identifiers, optionally localized.
+
+A RefRenderer compiles one flat table from book ID to book-name
+prefix for a language and style, so rendering a reference is a single
+string format. Renderers are shared: use get_refrenderer() rather
+than instantiating them directly.
+
+>>> from biblelib.word.refrender import get_refrenderer
+>>> get_refrenderer("fra", "name").render_id("41004003")
+'Marc 4.3'
+>>> get_refrenderer("fra", "abbrev").render_id("41004003-41004008")
+'Mc 4.3-4.8'
+>>> get_refrenderer("eng", "abbrev").render_id("01001001")
+'Ge 1:1'
+
+For multilingual serving, compile renderers for every bundled
+language at startup:
+
+>>> from biblelib.word.refrender import preload_refrenderers
+>>> len(preload_refrenderers())
+40
+
+"""
+
+from functools import cache
+from typing import Any
+
+from biblelib import metrics
+from biblelib.book import Books, get_localized_books, localized_languages
+
+BOOKS = Books()
+
+# book name styles for English references
+ENGLISH_STYLES: tuple[str, ...] = ("usfmname", "name", "osisID", "biblia")
+# unpadded numbers for zero-padded chapter and verse IDs, like "004" -> "4"
+_NUMBERS: dict[str, str] = {str(n).zfill(3): str(n) for n in range(1000)}
+
+
+class RefRenderer:
+    """Render references for a language and book name style.
+
+    For English, style may be "usfmname", "name", "osisID", or
+    "biblia", or "abbrev" (an alias for "biblia"). For other
+    languages, style "abbrev" uses the localized abbreviation, and
+    any other style the full localized name. Unsupported languages
+    fall back to English (a warning will have been issued by
+    get_localized_books()).
+
+    Attributes:
+        lang: ISO 639-3 language code
+        style: book name style
+        cv_sep: the chapter/verse separator
+        prefixes: maps a book ID like "41" to a book name and trailing
+            space, like "Marc "
+
+    """
+
+    def __init__(self, lang: str = "eng", style: str = "name") -> None:
+        """Compile the book prefix table for lang and style."""
+        self.lang = lang
+        self.style = style
+        localized = get_localized_books(lang) if lang != "eng" else None
+        if localized is not None:
+            self.cv_sep: str = localized.cv_sep
+            attrname = "abbrev" if style == "abbrev" else "name"
+            self.prefixes: dict[str, str] = {
+                BOOKS[usfmname].usfmnumber: f"{entry[attrname]} "
+                for usfmname, entry in localized._data.items()
+                if usfmname in BOOKS
+            }
+        else:
+            # English, or an unsupported language
+            self.cv_sep = ":"
+            attrname = "biblia" if style == "abbrev" else style
+            assert attrname in ENGLISH_STYLES, f"Unknown style {style} for book name."
+            self.prefixes = {book.usfmnumber: f"{getattr(book, attrname)} " for book in BOOKS.values()}
+
+    def __repr__(self) -> str:
+        """Return a string representation."""
+        return f"{type(self).__name__}({self.lang!r}, {self.style!r})"
+
+    def render_id(self, ID: str) -> str:
+        """Return a reference string for a verse ID like "41004003", or a range ID.
+
+        Longer verse IDs, like BCVWP IDs, are rendered as their verse.
+        """
+        prefix = self.prefixes.get(ID[:2])
+        assert prefix is not None, f"No {self.style} for book '{ID[:2]}' in language '{self.lang}'"
+        sep = self.cv_sep
+        if "-" in ID:
+            endid = ID.split("-", 1)[1]
+            startref = f"{prefix}{_NUMBERS[ID[2:5]]}{sep}{_NUMBERS[ID[5:8]]}"
+            return f"{startref}-{_NUMBERS[endid[2:5]]}{sep}{_NUMBERS[endid[5:8]]}"
+        return f"{prefix}{_NUMBERS[ID[2:5]]}{sep}{_NUMBERS[ID[5:8]]}"
+
+    def render(self, ref: Any) -> str:
+        """Return a reference string for a BCVID, BCVWPID, or BCVIDRange."""
+        return self.render_id(ref.ID)
+
+    def render_many(self, IDs: list[str]) -> list[str]:
+        """Return reference strings for a list of verse or range IDs."""
+        render_id = self.render_id
+        return [render_id(ID) for ID in IDs]
+
+
+@cache
+def get_refrenderer(lang: str = "eng", style: str = "name") -> RefRenderer:
+    """Return the shared RefRenderer for lang and style, compiling it on first use."""
+    return RefRenderer(lang=lang, style=style)
+
+
+metrics.register_cache("word.refrenderer", get_refrenderer)
+
+
+def preload_refrenderers(styles: tuple[str, ...] = ("name", "abbrev")) -> list[RefRenderer]:
+    """Compile renderers for English and every bundled language, in each style."""
+    return [get_refrenderer(lang, style) for lang in ["eng", *localized_languages()] for style in styles]
@@ -6,11 +6,16 @@
 
 """
 
+from typing import TYPE_CHECKING, Optional
+
 from .mappings import Mapper
 from .bcvwpid import BCVID, BCVWPID
 
+if TYPE_CHECKING:
+    from .mappings.shared import SharedMarbleTable
+
 
-def fromubs(ref: str) -> list[BCVID | BCVWPID]:
+def fromubs(ref: str, mapper: Optional["Mapper | SharedMarbleTable"] = None) -> list[BCVID | BCVWPID]:
     """Return a list of BCV(WP) instances for a single UBS reference.
 
     Hebrew Bible references sometimes map to two Macula tokens because
@@ -20,8 +25,11 @@ def fromubs(ref: str) -> list[BCVID | BCVWPID]:
 
     This does not yet handle range references.
 
+    Pass a SharedMarbleTable as mapper to read the mappings from
+    shared memory (see mappings.shared), rather than loading them.
+
     """
-    mpr = Mapper()
+    mpr = mapper if mapper is not None else Mapper()
     macularefs = mpr.to_macula(ref)
     reflist: list[BCVID | BCVWPID] = []
     if macularefs:
@@ -1,10 +1,14 @@
 """Pytest tests for biblelib.book."""
 
+from dataclasses import FrozenInstanceError
+import gc
+import weakref
+
 import pytest
 
 
 from biblelib import book
-from biblelib.book import LocalizedBooks, get_localized_books
+from biblelib.book import LocalizedBooks, get_localized_books, localized_languages, preload_localized_books
 
 
 class TestBook(object):
@@ -182,6 +186,54 @@ class TestMark(object):
         with pytest.raises(ValueError):
             assert self.allbooks.findbook("Not a book").usfmname == "NAB"
 
+    def test_findbook_normalized(self) -> None:
+        """Test findbook() ignoring case, accents, spaces, and periods."""
+        assert self.allbooks.findbook("gen").usfmname == "GEN"
+        assert self.allbooks.findbook("GENESIS").usfmname == "GEN"
+        assert self.allbooks.findbook("1 sam.").usfmname == "1SA"
+        # all schemes are searched on the first call
+        assert book.Books().findbook("Matt").usfmname == "MAT"
+
+    def test_findbook_prefix(self) -> None:
+        """Test findbook() with prefixes that identify one book."""
+        assert self.allbooks.findbook("matth").usfmname == "MAT"
+        assert self.allbooks.findbook("Hagg").usfmname == "HAG"
+        with pytest.raises(ValueError):
+            # Joshua, Joel, John, Jonah, ...
+            self.allbooks.findbook("jo")
+
+    def test_findbook_fuzzy(self) -> None:
+        """Test findbook() with misspelled names."""
+        with pytest.raises(ValueError):
+            self.allbooks.findbook("Mathew")
+        assert self.allbooks.findbook("Mathew", fuzzy=True).usfmname == "MAT"
+        assert self.allbooks.findbook("Genisis", fuzzy=True).usfmname == "GEN"
+        with pytest.raises(ValueError):
+            self.allbooks.findbook("Not a book", fuzzy=True)
+
+    def test_suggestbooks(self) -> None:
+        """Test suggestbooks()."""
+        suggestions = self.allbooks.suggestbooks("Revelations")
+        assert [(book.usfmname, distance) for book, distance in suggestions] == [("REV", 1)]
+        assert len(self.allbooks.suggestbooks("gen", limit=2)) == 2
+        assert self.allbooks.suggestbooks("zzzzzzzz") == []
+
+    def test_findindex_shared(self) -> None:
+        """Test that instances share name indexes, and are freed without the cyclic GC."""
+        first = book.Books()
+        assert first.findbook("matth", fuzzy=True) is self.allbooks.findbook("matth")
+        assert first._findindex is self.allbooks._findindex
+        # a canon's index finds its own books
+        assert book.NTCanon().findbook("matth").ordinal == 0
+        assert book.NTCanon().suggestbooks("Genisis") == []
+        freed = weakref.ref(first)
+        gc.disable()
+        try:
+            del first
+            assert freed() is None
+        finally:
+            gc.enable()
+
 
 class TestLocalizedBooks:
     """Test LocalizedBooks class and get_localized_books() factory."""
@@ -256,3 +308,120 @@ class TestLocalizedBooks:
         fra1 = get_localized_books("fra")
         fra2 = get_localized_books("fra")
         assert fra1 is fra2
+
+    def test_preload_localized_books(self) -> None:
+        """Test loading every bundled localization."""
+        langs = localized_languages()
+        assert len(langs) == 19
+        assert "fra" in langs and "zhs" in langs
+        loaded = preload_localized_books()
+        assert list(loaded) == langs
+        assert loaded["fra"] is get_localized_books("fra")
+
+
+class TestCanonOrder:
+    """Test canon ordinals and sort keys."""
+
+    def test_ordinals_independent(self) -> None:
+        """Test that building one canon doesn't change another's ordinals."""
+        catholic = book.CatholicCanon()
+        protestant = book.ProtestantCanon()
+        assert catholic["MAT"].ordinal == 46
+        assert protestant["MAT"].ordinal == 39
+        assert book.CatholicCanon()["MAT"].ordinal == 46
+        assert book.Books()["MAT"].ordinal == 0
+
+    def test_sort_key(self) -> None:
+        """Test sorting ID strings in canon order."""
+        ids = ["41004003001", "68001001", "16001001", "41004003", "01001001"]
+        # Tobit (68) isn't in the Protestant canon, so sorts last
+        assert sorted(ids, key=book.sort_key("Protestant")) == [
+            "01001001",
+            "16001001",
+            "41004003",
+            "41004003001",
+            "68001001",
+        ]
+        # Tobit (68) follows Nehemiah (16) in the Catholic canon, before Mark
+        assert sorted(ids, key=book.sort_key("catholic")) == [
+            "01001001",
+            "16001001",
+            "68001001",
+            "41004003",
+            "41004003001",
+        ]
+        # books outside the canon sort last
+        assert sorted(ids, key=book.sort_key(book.NTCanon))[:3] == ["41004003", "41004003001", "01001001"]
+
+    def test_sort_key_prefix(self) -> None:
+        """Test that Macula canon prefixes are ignored."""
+        key = book.sort_key(book.ProtestantCanon())
+        assert key("n41004003001") == key("41004003001")
+
+    def test_sort_key_bisect(self) -> None:
+        """Test using sort keys with bisect."""
+        from bisect import bisect_left
+
+        key = book.ProtestantCanon().sort_key()
+        ids = sorted(["40001001", "01001001", "66022021"], key=key)
+        assert bisect_left(ids, key("41004003"), key=key) == 2
+
+    def test_sort_key_unknown(self) -> None:
+        """Test an unknown canon name."""
+        with pytest.raises(AssertionError):
+            book.sort_key("Orthodox")
+
+
+class TestCanonFilter:
+    """Test canon masks and filter_by_canon()."""
+
+    def test_shared_books(self) -> None:
+        """Test that Books instances share one book table."""
+        assert book.Books()["MRK"] is book.Books()["MRK"]
+        # canons copy books to set ordinals
+        assert book.NTCanon()["MRK"] is not book.Books()["MRK"]
+
+    def test_no_aliasing(self) -> None:
+        """Test that changes through one Books instance don't show in another."""
+        first, second = book.Books(), book.Books()
+        with pytest.raises(FrozenInstanceError):
+            first["MRK"].name = "Mk"  # type: ignore[misc]
+        assert second["MRK"].name == "Mark"
+        del first["MRK"]
+        first["XXX"] = second["GEN"]
+        assert "MRK" in second and "XXX" not in second
+        assert "MRK" in book.Books()
+
+    def test_canon_mask(self) -> None:
+        """Test canon membership masks."""
+        bits = book.book_bits()
+        ntmask = book.canon_mask("NT")
+        assert bin(ntmask).count("1") == 27
+        assert ntmask >> bits["41"] & 1
+        assert not ntmask >> bits["01"] & 1
+        assert book.canon_mask(book.ProtestantCanon()) == book.ProtestantCanon().mask()
+        assert bin(book.canon_mask("Catholic")).count("1") == 73
+
+    def test_filter_strings(self) -> None:
+        """Test filtering ID strings, including canon prefixes."""
+        ids = ["01001001", "41004003", "68001001", "n41004003001", "o01001001001", "A4001001"]
+        assert list(book.filter_by_canon(ids, "NT")) == ["41004003", "n41004003001"]
+        protestant = ["01001001", "41004003", "n41004003001", "o01001001001"]
+        assert list(book.filter_by_canon(ids, book.ProtestantCanon)) == protestant
+        assert list(book.filter_by_canon(ids, "Catholic")) == ids[:-1]
+
+    def test_filter_mask(self) -> None:
+        """Test filtering with a combined mask."""
+        deuterocanon = book.canon_mask("Catholic") & ~book.canon_mask("Protestant")
+        ids = ["01001001", "68001001", "70001001"]
+        assert list(book.filter_by_canon(ids, deuterocanon)) == ["68001001", "70001001"]
+
+    def test_filter_ints(self) -> None:
+        """Test filtering packed int IDs."""
+        assert list(book.filter_by_canon([1001001, 41004003, 68001001], "NT")) == [41004003]
+        assert list(book.filter_by_canon([1001001001, 41004003001], "NT", digits=9)) == [41004003001]
+
+    def test_filter_lazy(self) -> None:
+        """Test that filtering consumes its input lazily."""
+        filtered = book.filter_by_canon(iter(["41004003", "01001001", "42001001"]), "NT")
+        assert next(filtered) == "41004003"
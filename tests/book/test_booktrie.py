@@ -0,0 +1,55 @@
+"""Pytest tests for biblelib.book.booktrie."""
+
+import pytest
+
+from biblelib.book import BookTrie, get_booktrie
+
+
+class TestBookTrie:
+    """Test basic functionality for BookTrie."""
+
+    trie = get_booktrie()
+
+    def test_add(self) -> None:
+        """Test adding names to an empty trie."""
+        trie = BookTrie()
+        trie.add("Marc", "MRK", "fra")
+        trie.add("Mc", "MRK", "fra")
+        assert trie.languages == ["fra"]
+        assert trie.match("marc 4.3") == ("MRK", 4)
+        assert trie.match("MC4.3") == ("MRK", 2)
+        with pytest.raises(ValueError):
+            trie.match("Mark 4:3")
+
+    def test_match_localized(self) -> None:
+        """Test matching localized names in any case or accent."""
+        assert self.trie.match("Genèse 1.1", lang="fra") == ("GEN", 6)
+        assert self.trie.match("genese 1.1", lang="fra") == ("GEN", 6)
+        assert self.trie.match("1 Corinthiens 13", lang="fra") == ("1CO", 13)
+        assert self.trie.match("От Марка 4:3", lang="rus") == ("MRK", 8)
+        assert self.trie.match("马可福音4:3", lang="zhs") == ("MRK", 4)
+
+    def test_match_english(self) -> None:
+        """Test matching English names, with or without a language."""
+        assert self.trie.match("Mark 4:3") == ("MRK", 4)
+        assert self.trie.match("Mark 4:3", lang="fra") == ("MRK", 4)
+        assert self.trie.match("1Cor 2") == ("1CO", 4)
+
+    def test_collisions(self) -> None:
+        """Test names that collide after normalization."""
+        # accents decide within a language
+        assert self.trie.match("Jó 3", lang="por") == ("JOB", 2)
+        assert self.trie.match("Jo 3", lang="por") == ("JHN", 2)
+        # a chapter number is not part of a name without a space
+        assert self.trie.match("Ps 3") == ("PSA", 2)
+        assert self.trie.match("PS3 1") == ("PS3", 3)
+        assert self.trie.match("Psaume 151 1.2", lang="fra") == ("PS2", 10)
+
+    def test_ambiguous(self) -> None:
+        """Test names for different books in different languages."""
+        # Gn is Genesis in French, but Jonah elsewhere
+        with pytest.raises(ValueError):
+            self.trie.match("Gn 1")
+        assert self.trie.match("Gn 1", lang="fra") == ("GEN", 2)
+        # an exact English match wins
+        assert self.trie.match("Mk 4") == ("MRK", 2)
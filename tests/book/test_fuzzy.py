@@ -0,0 +1,47 @@
+"""Pytest tests for biblelib.book.fuzzy."""
+
+from biblelib.book.fuzzy import NgramIndex, levenshtein, normalize_bookname
+
+
+def test_normalize_bookname() -> None:
+    """Test normalizing book names."""
+    assert normalize_bookname("Genèse") == "genese"
+    assert normalize_bookname("GENÈSE.") == "genese"
+    assert normalize_bookname("1 Cor.") == "1cor"
+    assert normalize_bookname("Psalm 151") == "psalm 151"
+
+
+def test_levenshtein() -> None:
+    """Test edit distances."""
+    assert levenshtein("genesis", "genesis") == 0
+    assert levenshtein("genisis", "genesis") == 1
+    assert levenshtein("mathew", "matthew") == 1
+    assert levenshtein("", "gen") == levenshtein("gen", "") == 3
+    assert levenshtein("kitten", "sitting") == 3
+
+
+class TestNgramIndex:
+    """Test basic functionality for NgramIndex."""
+
+    index = NgramIndex(["genesis", "exodus", "leviticus", "numbers", "matthew", "mark"])
+
+    def test_add(self) -> None:
+        """Test adding words."""
+        index = NgramIndex(["mark"])
+        index.add("mark")
+        assert len(index) == 1
+
+    def test_search(self) -> None:
+        """Test searching within an edit distance."""
+        assert self.index.search("genisis") == [(1, "genesis")]
+        assert self.index.search("mathew") == [(1, "matthew")]
+        assert self.index.search("marks", maxdistance=1) == [(1, "mark")]
+        assert self.index.search("revelation") == []
+
+    def test_search_exhaustive(self) -> None:
+        """Test that the bigram filter finds everything a full scan finds."""
+        for query in ["genesys", "exdus", "levitcus", "nmbers", "matthews"]:
+            expected = sorted(
+                (levenshtein(query, word), word) for word in self.index.words if levenshtein(query, word) <= 2
+            )
+            assert self.index.search(query) == expected
@@ -0,0 +1,157 @@
+"""Test biblelib.book.tablecache"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+import biblelib
+from biblelib.book import book, tablecache
+
+ROOT = Path(__file__).parents[2]
+
+
+@pytest.fixture
+def datadir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Cache tables in a temporary directory."""
+    monkeypatch.setenv("BIBLELIB_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.delenv("BIBLELIB_TABLE_CACHE", raising=False)
+    return tmp_path / "data"
+
+
+class Parser:
+    """Split text into lines, counting calls."""
+
+    def __init__(self) -> None:
+        """Initialize the count."""
+        self.calls = 0
+
+    def __call__(self, text: str) -> list[str]:
+        """Return the lines of text."""
+        self.calls += 1
+        return text.splitlines()
+
+
+def _source(tmp_path: Path, text: str) -> Path:
+    """Write text to a source file, and return its path."""
+    source = tmp_path / "table.tsv"
+    source.write_text(text, encoding="utf-8")
+    return source
+
+
+class TestCachedir:
+    """Test finding the cache directory."""
+
+    def test_datadir(self, datadir: Path) -> None:
+        """Test that BIBLELIB_DATA_DIR overrides the platform directory."""
+        assert tablecache.cachedir() == datadir / "tables"
+
+    @pytest.mark.parametrize(
+        "platform,envvar,expected",
+        [
+            ("win32", "LOCALAPPDATA", Path("biblelib", "biblelib", "Cache", "tables")),
+            ("linux", "XDG_CACHE_HOME", Path("biblelib", "tables")),
+        ],
+    )
+    def test_platform(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, platform: str, envvar: str, expected: Path
+    ) -> None:
+        """Test that the directory matches pooch's os_cache() for each platform."""
+        monkeypatch.delenv("BIBLELIB_DATA_DIR", raising=False)
+        monkeypatch.setattr(sys, "platform", platform)
+        monkeypatch.setenv(envvar, str(tmp_path))
+        assert tablecache.cachedir() == tmp_path / expected
+        # an empty variable is ignored
+        monkeypatch.setenv(envvar, "")
+        assert tablecache.cachedir().is_absolute()
+
+
+class TestLoad:
+    """Test loading through the cache."""
+
+    def test_hit(self, datadir: Path, tmp_path: Path) -> None:
+        """Test that a source is parsed only once."""
+        source = _source(tmp_path, "a\tb\nc\td\n")
+        parse = Parser()
+        assert tablecache.load(source, parse) == ["a\tb", "c\td"]
+        assert tablecache.load(source, parse) == ["a\tb", "c\td"]
+        assert parse.calls == 1
+        assert len(list((datadir / "tables").glob("table-*.marshal"))) == 1
+
+    def test_changed(self, datadir: Path, tmp_path: Path) -> None:
+        """Test that a changed source is parsed again."""
+        parse = Parser()
+        tablecache.load(_source(tmp_path, "a\n"), parse)
+        assert tablecache.load(_source(tmp_path, "b\n"), parse) == ["b"]
+        assert parse.calls == 2
+
+    def test_version(self, datadir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a new library version parses again."""
+        source = _source(tmp_path, "a\n")
+        parse = Parser()
+        tablecache.load(source, parse)
+        monkeypatch.setattr(tablecache, "__version__", "99.0")
+        tablecache.load(source, parse)
+        assert parse.calls == 2
+
+    @pytest.mark.parametrize("cached", [b"", b"garbage", b"\xe9", tablecache.marshal.dumps(("wrongkey", ["x"]))])
+    def test_corrupt(self, datadir: Path, tmp_path: Path, cached: bytes) -> None:
+        """Test that an unreadable cached table is parsed again, and replaced."""
+        source = _source(tmp_path, "a\n")
+        parse = Parser()
+        tablecache.load(source, parse)
+        (cachepath,) = (datadir / "tables").glob("table-*.marshal")
+        cachepath.write_bytes(cached)
+        assert tablecache.load(source, parse) == ["a"]
+        assert tablecache.load(source, parse) == ["a"]
+        assert parse.calls == 2
+
+    def test_unwritable(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test parsing every time when the cache can't be written."""
+        # a file where the directory should be
+        (tmp_path / "data").write_text("", encoding="utf-8")
+        monkeypatch.setenv("BIBLELIB_DATA_DIR", str(tmp_path / "data"))
+        source = _source(tmp_path, "a\n")
+        parse = Parser()
+        assert tablecache.load(source, parse) == ["a"]
+        assert tablecache.load(source, parse) == ["a"]
+        assert parse.calls == 2
+
+    def test_disabled(self, datadir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test turning the cache off."""
+        monkeypatch.setenv("BIBLELIB_TABLE_CACHE", "0")
+        assert not tablecache.is_enabled()
+        assert tablecache.load(_source(tmp_path, "a\n"), Parser()) == ["a"]
+        assert not datadir.exists()
+
+
+class TestBooks:
+    """Test book tables read from the cache."""
+
+    def test_same(self, datadir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that cached tables give the same books and localizations as parsing."""
+        book._read_books.cache_clear()
+        # parse and save, then read the cache
+        parsed = (dict(book.Books()), book.LocalizedBooks("fra"))
+        book._read_books.cache_clear()
+        cached = (dict(book.Books()), book.LocalizedBooks("fra"))
+        assert len(list((datadir / "tables").glob("books*.marshal"))) == 2
+        monkeypatch.setenv("BIBLELIB_TABLE_CACHE", "0")
+        book._read_books.cache_clear()
+        uncached = (dict(book.Books()), book.LocalizedBooks("fra"))
+        book._read_books.cache_clear()
+        assert parsed == cached == uncached
+        assert cached[0]["MRK"].logosID == 62
+        assert cached[0]["GEN"].usfmnumber == "01"
+        assert cached[1].cv_sep == "."
+        assert cached[1].get_name("GEN") == "Genèse"
+
+    def test_blank(self) -> None:
+        """Test that blank lines in a books table are skipped."""
+        text = (book.BOOKSPATH / "books.tsv").read_text(encoding="utf-8")
+        withblanks = text.replace("\n", "\n\n", 3) + "\n"
+        assert book._parse_books(withblanks) == book._parse_books(text)
+
+    def test_version(self) -> None:
+        """Test that the version in cache keys matches the package version."""
+        assert f'version = "{biblelib.__version__}"\n' in (ROOT / "pyproject.toml").read_text(encoding="utf-8")
@@ -0,0 +1,80 @@
+"""Test that importing Biblelib packages stays cheap."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import biblelib.book
+import biblelib.word
+import biblelib.word.mappings
+from biblelib.book import Books
+from biblelib.word import bcvwpid
+
+# run in a new interpreter, so nothing is imported yet
+IMPORTCODE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+from biblelib.book.book import _read_books
+print(json.dumps({{"seconds": seconds, "modules": sorted(sys.modules), "books": _read_books.cache_info().currsize}}))
+"""
+# loaded only when mappings or rendering are used
+HEAVY = [
+    "pooch",
+    "requests",
+    "multiprocessing",
+    "concurrent.futures",
+    "biblelib.data",
+    "biblelib.word.mappings",
+    "biblelib.word.refrender",
+    "biblelib.word.localref",
+    "biblelib.book.booktrie",
+]
+# generous, for slow CI machines: about 20ms is typical
+MAXSECONDS = 0.5
+
+
+def fresh_import(module: str) -> dict:
+    """Import module in a new interpreter, and return the seconds, loaded modules, and books tables read."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORTCODE.format(module=module)], capture_output=True, text=True, check=True
+    )
+    imported: dict = json.loads(result.stdout)
+    return imported
+
+
+class TestImports:
+    """Test lazy imports."""
+
+    @pytest.mark.parametrize("module", ["biblelib.word", "biblelib.book"])
+    def test_fresh(self, module: str) -> None:
+        """Test that importing doesn't load heavy dependencies or data."""
+        imported = fresh_import(module)
+        assert not set(HEAVY) & set(imported["modules"])
+        assert imported["books"] == 0
+        assert imported["seconds"] < MAXSECONDS
+
+    def test_lazy(self) -> None:
+        """Test that lazy names are available on first access."""
+        from biblelib.word import RefRenderer, fastid, fromubs
+
+        assert fromubs is biblelib.word.ubs.fromubs
+        assert fastid is biblelib.word.fastid
+        assert RefRenderer.__name__ == "RefRenderer"
+        for package in (biblelib.book, biblelib.word, biblelib.word.mappings):
+            assert set(package.__all__) <= set(dir(package))
+            assert all(getattr(package, name) is not None for name in package.__all__)
+            with pytest.raises(AttributeError):
+                getattr(package, "bogus")
+            # one implementation, so the packages can't drift apart
+            assert package.__getattr__.__module__ == package.__dir__.__module__ == "biblelib._lazy"
+
+    def test_books(self) -> None:
+        """Test that bcvwpid.BOOKS is created once, on first access."""
+        assert isinstance(bcvwpid.BOOKS, Books)
+        assert bcvwpid.BOOKS is bcvwpid.BOOKS
+        with pytest.raises(AttributeError):
+            _ = bcvwpid.BOGUS
@@ -0,0 +1,112 @@
+"""Test biblelib.metrics."""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+from typing import Iterator
+
+import pytest
+
+from biblelib import metrics
+from biblelib.book import Books, LocalizedBooks, get_localized_books
+from biblelib.versification import VrefReader, get_versetable
+from biblelib.word.mappings import GNTMappings
+
+
+@pytest.fixture
+def enabled() -> Iterator[None]:
+    """Record metrics from a clean start, and disable them afterwards."""
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+class TestMetrics:
+    """Test counters, timers, and sinks."""
+
+    def test_disabled(self) -> None:
+        """Test that nothing is recorded by default."""
+        metrics.reset()
+        assert not metrics.is_enabled()
+        _ = Books()
+        metrics.count("test.count")
+        with metrics.timer("test.timer"):
+            pass
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"] == {}
+        assert snapshot["timers"] == {}
+
+    def test_counters_and_timers(self, enabled: None) -> None:
+        """Test recording values directly."""
+        metrics.count("test.count")
+        metrics.count("test.count", 2)
+        metrics.record_time("test.timer", 0.5)
+        metrics.record_time("test.timer", 1.5)
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"]["test.count"] == 3
+        assert snapshot["timers"]["test.timer"] == {"count": 2, "total": 2.0, "mean": 1.0, "max": 1.5}
+
+    def test_library(self, enabled: None) -> None:
+        """Test the instrumented loads and caches."""
+        _ = Books()
+        _ = LocalizedBooks("fra")
+        get_localized_books("fra")
+        get_localized_books("fra")
+        _ = VrefReader("eng", "nt")
+        get_versetable("eng")
+        get_versetable("eng")
+        snapshot = metrics.snapshot()
+        for name in ("book.Books", "book.LocalizedBooks.load", "versification.VrefReader.load"):
+            assert snapshot["timers"][name]["count"] >= 1
+        assert snapshot["caches"]["book.localized_books"]["hits"] >= 1
+        assert snapshot["caches"]["versification.versetable"]["hits"] >= 1
+        assert 0 < snapshot["caches"]["versification.versetable"]["hit_rate"] <= 1
+
+    def test_mappings(self, enabled: None, tmp_path: Path) -> None:
+        """Test mapping table loads and index builds."""
+        path = tmp_path / "gnt.tsv"
+        rows = [
+            "NA1904_ID\tNA1904_Text\tNA27_ID\tNA28_ID\tSBLGNT_ID\tSBLGNT_Text\tMARBLE_ID",
+            "43001001001\tἘν\t43001001001\t43001001001\t43001001001\tἘν\t04300100100002",
+        ]
+        path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+        gnt = GNTMappings(str(path))
+        assert gnt.marble2sblgnt("04300100100002") == "n43001001001"
+        assert gnt.marble2sblgnt("04300100100004") == ""
+        snapshot = metrics.snapshot()
+        assert snapshot["timers"]["mappings.GNTMappings.load"]["count"] == 1
+        assert snapshot["counters"]["mappings.GNTMappings.rows"] == 1
+        # the index is built once
+        assert snapshot["timers"]["mappings.GNTMappings.marble_index"]["count"] == 1
+
+    def test_sinks(self, enabled: None) -> None:
+        """Test that sinks receive measurements, and failures only warn."""
+        received: list[tuple[str, str, float]] = []
+
+        def failing(kind: str, name: str, value: float) -> None:
+            raise RuntimeError("unavailable")
+
+        def sink(kind: str, name: str, value: float) -> None:
+            received.append((kind, name, value))
+
+        metrics.add_sink(sink)
+        metrics.add_sink(failing)
+        try:
+            with pytest.warns(UserWarning, match="unavailable"):
+                metrics.count("test.count", 2)
+        finally:
+            metrics.remove_sink(failing)
+        metrics.cache_miss("test.cache")
+        metrics.remove_sink(sink)
+        metrics.count("test.count")
+        assert received == [("count", "test.count", 2), ("miss", "test.cache", 1)]
+
+    def test_environment(self) -> None:
+        """Test enabling with BIBLELIB_METRICS."""
+        code = "from biblelib import metrics; print(metrics.is_enabled())"
+        env = {**os.environ, "BIBLELIB_METRICS": "1"}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        assert result.stdout.strip() == "True"
@@ -0,0 +1,52 @@
+"""Test biblelib.preload."""
+
+import gc
+from pathlib import Path
+
+import pytest
+
+import biblelib
+from biblelib.preload import COMPONENTS, warmup
+from biblelib.word import bcvwpid
+from biblelib.word.mappings import GNTMappings, marble
+
+LOCAL = ["books", "localizations", "versification", "pericopes"]
+
+
+class TestWarmup:
+    """Test warmup()."""
+
+    def test_local(self) -> None:
+        """Test loading the bundled data."""
+        timings = warmup(LOCAL, freeze=False)
+        assert list(timings) == LOCAL
+        assert all(seconds >= 0 for seconds in timings.values())
+        assert bcvwpid.BOOKS.findindex
+
+    def test_freeze(self) -> None:
+        """Test freezing what's loaded."""
+        try:
+            biblelib.warmup(["versification"])
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+    def test_mappings(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test building the mapping indexes."""
+        path = tmp_path / "gnt.tsv"
+        rows = [
+            "NA1904_ID\tNA1904_Text\tNA27_ID\tNA28_ID\tSBLGNT_ID\tSBLGNT_Text\tMARBLE_ID",
+            "43001001001\tἘν\t43001001001\t43001001001\t43001001001\tἘν\t04300100100002",
+        ]
+        path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+        gnt = GNTMappings(str(path))
+        monkeypatch.setattr(marble, "gnt_mappings", lambda: gnt)
+        warmup(["gnt"], freeze=False)
+        assert gnt.marble_ids == {"04300100100002": gnt[0]}
+        assert gnt.na28_ids == {"43001001001": gnt[0]}
+
+    def test_invalid(self) -> None:
+        """Test an unknown component."""
+        assert "bogus" not in COMPONENTS
+        with pytest.raises(AssertionError):
+            warmup(["books", "bogus"], freeze=False)
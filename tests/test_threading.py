@@ -0,0 +1,135 @@
+"""Stress test lazy loading and index builds from many threads at once."""
+
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from unicodedata import normalize
+
+import pytest
+
+from biblelib.book import book
+from biblelib.word.mappings import GNTMappings, WLCMMappings
+
+THREADS = 8
+ROUNDS = 20
+# enough rows that building an index spans many thread switches
+ROWS = 20000
+
+
+@pytest.fixture(autouse=True)
+def switchinterval() -> Iterator[None]:
+    """Switch threads as often as possible, so races show up."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def hammer(func: Callable[[], Any]) -> list[Any]:
+    """Call func from THREADS threads released at the same moment, and return their results."""
+    barrier = threading.Barrier(THREADS)
+    results: list[Any] = [None] * THREADS
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = func()
+        except Exception as err:
+            results[index] = err
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.fixture(scope="module")
+def gnt(tmp_path_factory: pytest.TempPathFactory) -> GNTMappings:
+    """Return GNT mappings with many rows."""
+    path: Path = tmp_path_factory.mktemp("mappings") / "gnt.tsv"
+    lines = ["NA1904_ID\tNA1904_Text\tNA27_ID\tNA28_ID\tSBLGNT_ID\tSBLGNT_Text\tMARBLE_ID"]
+    lines += [
+        f"4{index:010d}\t\t4{index:010d}\t4{index:010d}\t4{index:010d}\t\t04{index:012d}" for index in range(ROWS)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return GNTMappings(str(path), text="none")
+
+
+@pytest.fixture(scope="module")
+def wlcm(tmp_path_factory: pytest.TempPathFactory) -> WLCMMappings:
+    """Return WLCM mappings with many rows."""
+    path: Path = tmp_path_factory.mktemp("mappings") / "wlcm.tsv"
+    lines = ["MACULA_IDs\tMARBLE_IDs"] + [f"o{index:012d}\t001{index:011d}" for index in range(ROWS)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return WLCMMappings(str(path))
+
+
+class TestMappings:
+    """Test that no thread sees a partial mapping index."""
+
+    def test_gnt(self, gnt: GNTMappings) -> None:
+        """Test looking up the last row while the indexes are built."""
+        last = ROWS - 1
+        for _ in range(ROUNDS):
+            gnt.marble_ids = {}
+            gnt.na28_ids = {}
+            results = hammer(lambda: (gnt.marble2sblgnt(f"04{last:012d}"), gnt.na282sblgnt(f"4{last:010d}")))
+            assert results == [(f"n4{last:010d}", f"n4{last:010d}")] * THREADS
+        assert len(gnt.marble_ids) == len(gnt.na28_ids) == ROWS
+
+    def test_lazytext(self, tmp_path: Path) -> None:
+        """Test reading lazy text from many threads at once."""
+        path = tmp_path / "gnt.tsv"
+        lines = ["NA1904_ID\tNA1904_Text\tNA27_ID\tNA28_ID\tSBLGNT_ID\tSBLGNT_Text\tMARBLE_ID"]
+        lines += [f"4{index:010d}\tλόγος\t\t\t4{index:010d}\tλόγος\t04{index:012d}" for index in range(ROWS)]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        text = normalize("NFC", "λόγος")
+        for _ in range(ROUNDS):
+            gnt = GNTMappings(str(path), text="lazy")
+            # a few rows, so threads read the same ones at once
+            rows = gnt.data[:: ROWS // 100]
+            results = hammer(lambda: [(row.SBLGNT_Text, row.NA1904_Text) for row in rows])
+            assert results == [[(text, text)] * len(rows)] * THREADS
+
+    def test_wlcm(self, wlcm: WLCMMappings) -> None:
+        """Test looking up the last row while the index is built."""
+        last = ROWS - 1
+        for _ in range(ROUNDS):
+            wlcm.marble_ids = {}
+            results = hammer(lambda: wlcm.marble2macula(f"001{last:011d}"))
+            assert results == [[f"o{last:012d}"]] * THREADS
+        assert len(wlcm.marble_ids) == ROWS
+
+
+class TestBooks:
+    """Test that no thread sees a partial book index or localization."""
+
+    def test_books(self) -> None:
+        """Test lookups on a new Books instance from many threads."""
+
+        def lookups(books: book.Books) -> tuple[str, ...]:
+            return (
+                books.findbook("matth").usfmname,
+                books.findbook("Jhn", fuzzy=True).usfmname,
+                books.fromosis("Rev").usfmname,
+                books.frombiblia("Ge").usfmname,
+                books.fromusfmnumber("41").usfmname,
+                books.fromusfmnumber("41", legacynumbering=True).usfmname,
+                books.fromlogos(62).usfmname,
+            )
+
+        for _ in range(ROUNDS):
+            books = book.Books()
+            results = hammer(lambda: lookups(books))
+            assert results == [("MAT", "JHN", "REV", "GEN", "MRK", "MAT", "MRK")] * THREADS
+
+    def test_localized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a localization is loaded only once."""
+        for _ in range(ROUNDS):
+            monkeypatch.setattr(book, "_LOCALIZED_BOOKS", {})
+            results = hammer(lambda: book.get_localized_books("fra"))
+            assert isinstance(results[0], book.LocalizedBooks)
+            assert all(result is results[0] for result in results)
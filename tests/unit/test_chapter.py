@@ -1,9 +1,11 @@
 """Pytest tests for biblelib.unit.chapter."""
 
-# import pytest
+import warnings
 
-from biblelib.word import BCID
-from biblelib.unit import chapter
+import pytest
+
+from biblelib.word import BCID, BCVID
+from biblelib.unit import Versification, chapter
 
 
 class TestChapterVerses:
@@ -58,9 +60,22 @@ class TestChapter(object):
         gen1cv = list(chapters.values())[0]
         assert gen1cv.end_ID == "01001031"
 
-    def test_chapters(self) -> None:
-        """Test for _chapters."""
-        assert len(chapter.Chapter._chapters) == 1459
+    def test_versification(self) -> None:
+        """Test that verse counts follow the versification."""
+        # GEN 32 has 32 verses in 'eng', but 33 in 'org'
+        gen_32 = chapter.Chapter(inst=BCID("01032"))
+        assert gen_32.lastverse == 32
+        org_gen_32 = chapter.Chapter(inst=BCID("01032"), versification=Versification.ORG)
+        assert org_gen_32 is not gen_32
+        assert org_gen_32.lastverse == 33
+        assert org_gen_32[-1].inst == BCVID("01032033")
+        assert org_gen_32[-1].versification == Versification.ORG
+        # schemes without bundled data use eng counts
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            lxx_mrk_4 = chapter.Chapter(inst=BCID("41004"), versification=Versification.LXX)
+        assert lxx_mrk_4.lastverse == 41
+        assert lxx_mrk_4[-1].versification == Versification.LXX
 
     def test_enumerate(self) -> None:
         """Test for enumerate."""
@@ -76,3 +91,35 @@ class TestChapter(object):
         markrange = self.mark_4.enumerate(self.mark_4.lastverse)
         assert markrange[0].inst.ID == "41004001"
         assert markrange[-1].inst.ID == "41004041"
+
+    def test_interned(self) -> None:
+        """Test that chapters are interned by identifier."""
+        mark_4 = chapter.Chapter(inst=BCID(self.testid))
+        assert chapter.Chapter(inst=BCID(self.testid)) is mark_4
+        # the BC portion of a more specific ID selects the same chapter
+        assert chapter.Chapter(inst=BCVID("41004003")) is mark_4
+        assert chapter.Chapter(inst=BCID("41005")) is not mark_4
+
+    def test_interned_data(self) -> None:
+        """Test that an interned chapter's verses can't be changed through data."""
+        mark_4 = chapter.Chapter(inst=BCID(self.testid))
+        assert isinstance(mark_4.data, tuple)
+        with pytest.raises(AttributeError):
+            mark_4.data.append(mark_4[0])  # type: ignore[union-attr]
+        with pytest.raises(TypeError, match="shared"):
+            mark_4.data = []
+        assert len(chapter.Chapter(inst=BCID(self.testid))) == 41
+        # a chapter built from a list isn't interned, and can be changed
+        local = chapter.Chapter(inst=BCID(self.testid), initlist=list(mark_4))
+        local.data = local.data[:2]
+        assert len(local) == 2
+
+    def test_lazy_data(self) -> None:
+        """Test that verses are only created when first accessed."""
+        chapter.Chapter._cache.clear()
+        jude_1 = chapter.Chapter(inst=BCID("65001"))
+        assert jude_1._data is None
+        assert len(jude_1) == 25
+        assert jude_1._data is not None
+        # enumeration shares the populated verses
+        assert jude_1.enumerate(2, 4)[0] is jude_1[1]
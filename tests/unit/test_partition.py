@@ -0,0 +1,79 @@
+"""Pytest tests for biblelib.unit.partition."""
+
+import pickle
+
+import pytest
+
+from biblelib.book import NTCanon
+from biblelib.unit import RangeSet, Versification, partition
+from biblelib.word import BCVID, BCVIDRange
+from biblelib.versification import get_versetable
+
+
+def check_chunks(chunks: list[RangeSet], expected: RangeSet) -> None:
+    """Check that chunks are disjoint and together cover expected."""
+    covered = RangeSet(versification=expected.versification)
+    for chunk in chunks:
+        assert not (covered & chunk).intervals
+        covered = covered | chunk
+    assert covered == expected
+
+
+class TestPartition:
+    """Test splitting canons into chunks."""
+
+    nt = RangeSet([(get_versetable("eng").book_span("40")[0], get_versetable("eng").book_span("66")[1])])
+
+    def test_verses(self) -> None:
+        """Test balancing by verse count."""
+        chunks = partition(4, "NT")
+        assert len(chunks) == 4
+        sizes = [len(chunk) for chunk in chunks]
+        assert max(sizes) - min(sizes) <= 1
+        check_chunks(chunks, self.nt)
+        # contiguous, in order
+        assert all(len(chunk.intervals) == 1 for chunk in chunks)
+        assert all(left.intervals[0][1] + 1 == right.intervals[0][0] for left, right in zip(chunks, chunks[1:]))
+        # deterministic, for any way of naming the canon
+        assert partition(4, NTCanon) == chunks
+        assert partition(4, NTCanon()) == chunks
+
+    def test_boundaries(self) -> None:
+        """Test starting chunks only at chapters or books."""
+        versetable = get_versetable("eng")
+        starts = [versetable.from_ordinal(chunk.intervals[0][0]) for chunk in partition(6, "NT", boundary="chapter")]
+        assert all(start.endswith("001") for start in starts)
+        books = partition(6, "NT", boundary="book")
+        starts = [versetable.from_ordinal(chunk.intervals[0][0]) for chunk in books]
+        assert all(start.endswith("001001") for start in starts)
+        # Matthew has no smaller unit
+        assert len(partition(100, "NT", boundary="book")) == 27
+        with pytest.raises(AssertionError):
+            partition(6, "NT", boundary="word")
+        with pytest.raises(AssertionError):
+            partition(0, "NT")
+
+    def test_weights(self) -> None:
+        """Test balancing by weights."""
+        # Revelation's 404 verses weigh 100 each, and the other 7553 verses 1
+        weights = {bcvid.ID: 100 for bcvid in RangeSet([get_versetable("eng").book_span("66")])}
+        chunks = partition(2, "NT", weights=weights)
+        check_chunks(chunks, self.nt)
+        # so the second chunk is the last 240 verses of Revelation, weighing 24000 of 47953
+        assert chunks[1].to_bcvidranges() == [BCVIDRange(BCVID("66010002"), BCVID("66022021"))]
+        assert len(chunks[1]) == 240
+
+    def test_catholic(self) -> None:
+        """Test a canon whose order isn't book ID order, and an other versification."""
+        chunks = partition(5, "Catholic", Versification.ORG)
+        assert len(chunks) == 5
+        check_chunks(chunks, partition(1, "Catholic", Versification.ORG)[0])
+        # Tobit (book 67) follows Nehemiah (16), so a chunk has both
+        assert any(len(chunk.intervals) > 1 for chunk in chunks)
+
+    def test_pickle(self) -> None:
+        """Test that chunks pickle without their verse table."""
+        chunk = partition(4, "NT")[2]
+        pickled = pickle.dumps(chunk)
+        assert len(pickled) < 500
+        assert pickle.loads(pickled) == chunk
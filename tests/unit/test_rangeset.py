@@ -0,0 +1,126 @@
+"""Pytest tests for biblelib.unit.rangeset."""
+
+import random
+
+import pytest
+
+from biblelib.pericope import PericopeDict
+from biblelib.word import BID, BCID, BCVID, BCVIDRange
+from biblelib.unit import RangeSet, Versification, VerseRange
+from biblelib.versification import get_versetable
+
+
+def ordinal_set(rangeset: RangeSet) -> set[int]:
+    """Return the verse ordinals in rangeset, enumerated."""
+    return {ordinal for start, end in rangeset.intervals for ordinal in range(start, end + 1)}
+
+
+class TestRangeSet:
+    """Test basic functionality for RangeSet."""
+
+    mrk_4 = RangeSet.from_ids("41004001", "41004041")
+    sower = RangeSet.from_ids(BCVID("41004001"), BCVID("41004009"))
+
+    def test_init(self) -> None:
+        """Test normalizing intervals."""
+        rangeset = RangeSet([(10, 12), (0, 3), (2, 5), (6, 6)])
+        assert rangeset.intervals == [(0, 6), (10, 12)]
+        assert len(rangeset) == 10
+        assert len(RangeSet()) == 0
+        with pytest.raises(AssertionError):
+            RangeSet([(5, 4)])
+
+    def test_from(self) -> None:
+        """Test alternate constructors."""
+        assert RangeSet.from_bcvidrange(BCVIDRange(BCVID("41004001"), BCVID("41004009"))) == self.sower
+        assert RangeSet.from_verserange(VerseRange(startid=BCVID("41004001"), endid=BCVID("41004009"))) == self.sower
+        assert RangeSet.from_ref(BCID("41004")) == self.mrk_4
+        assert len(RangeSet.from_ref(BID("41"))) == 678
+        assert len(RangeSet.from_ref(BCVID("41004003"))) == 1
+        with pytest.raises(ValueError):
+            RangeSet.from_ids("41004001", "41004042")
+
+    def test_from_pericope(self) -> None:
+        """Test conversion from a Pericope."""
+        bsb = PericopeDict(language="eng", version="BSB")
+        rangeset = RangeSet.from_pericope(bsb.get_pericope(BCVID("41004003")))
+        assert rangeset == self.sower
+        assert len(RangeSet.from_pericope(bsb[0])) == len(bsb[0].enumerate())
+
+    def test_to_pericopes(self) -> None:
+        """Test conversion to the Pericopes that overlap a set."""
+        bsb = PericopeDict(language="eng", version="BSB")
+        sower = bsb.get_pericope(BCVID("41004003"))
+        assert RangeSet.from_pericope(sower).to_pericopes(bsb) == [sower]
+        # a verse at each end of a pericope, and one in the next book
+        rangeset = RangeSet.from_ids(sower.endid) | RangeSet.from_ids(sower.startid) | RangeSet.from_ids("42001001")
+        assert rangeset.to_pericopes(bsb) == [sower, bsb.get_pericope(BCVID("42001001"))]
+        covered = RangeSet.from_ids("41004001", "41005043")
+        pericopes = covered.to_pericopes(bsb)
+        assert pericopes == bsb.get_pericopes(BCVIDRange(BCVID("41004001"), BCVID("41005043")))
+        assert covered <= RangeSet([interval for p in pericopes for interval in RangeSet.from_pericope(p).intervals])
+        assert RangeSet().to_pericopes(bsb) == []
+        # a psalm pericope that starts with the superscription, verse 0
+        psalm = bsb.get_pericope(BCVID("19003001"))
+        assert RangeSet.from_pericope(psalm) == RangeSet.from_ref(BCID("19003"))
+        assert RangeSet.from_ids("19003001").to_pericopes(bsb) == [psalm]
+
+    def test_contains(self) -> None:
+        """Test verse membership."""
+        assert BCVID("41004009") in self.sower
+        assert "41004009" in self.sower
+        assert "n41004009001" in self.sower
+        assert BCVID("41004010") not in self.sower
+        assert "40004009" not in self.sower
+        # not a verse in the versification
+        assert "41004099" not in self.sower
+
+    def test_set_operations(self) -> None:
+        """Test union, intersection, and difference."""
+        later = RangeSet.from_ids("41004020", "41005003")
+        assert (self.sower | later).intervals == self.sower.intervals + later.intervals
+        assert len(self.sower | later) == 9 + 22 + 3
+        assert self.mrk_4 & later == RangeSet.from_ids("41004020", "41004041")
+        assert self.mrk_4 - later == RangeSet.from_ids("41004001", "41004019")
+        assert self.mrk_4 - self.sower == RangeSet.from_ids("41004010", "41004041")
+        # splitting an interval in two
+        middle = RangeSet.from_ids("41004010", "41004012")
+        assert (self.mrk_4 - middle).intervals == [
+            self.sower.intervals[0],
+            RangeSet.from_ids("41004013", "41004041").intervals[0],
+        ]
+        assert self.sower <= self.mrk_4
+        assert not self.mrk_4 <= self.sower
+        with pytest.raises(AssertionError):
+            self.sower | RangeSet.from_ids("41004001", versification=Versification.ORG)
+
+    def test_set_operations_random(self) -> None:
+        """Compare set operations against enumerated sets of ordinals."""
+        rng = random.Random(42)
+        for _ in range(50):
+            sets = []
+            for _ in range(2):
+                starts = [rng.randrange(0, 500) for _ in range(rng.randrange(0, 8))]
+                sets.append(RangeSet([(start, start + rng.randrange(0, 40)) for start in starts]))
+            left, right = sets
+            assert ordinal_set(left | right) == ordinal_set(left) | ordinal_set(right)
+            assert ordinal_set(left & right) == ordinal_set(left) & ordinal_set(right)
+            assert ordinal_set(left - right) == ordinal_set(left) - ordinal_set(right)
+
+    def test_to_ranges(self) -> None:
+        """Test conversion to BCVIDRange and VerseRange, split at book boundaries."""
+        eng = get_versetable("eng")
+        acrossbooks = RangeSet([(eng.ordinal("40028019"), eng.ordinal("41001002"))])
+        assert acrossbooks.to_bcvidranges() == [
+            BCVIDRange(BCVID("40028019"), BCVID("40028020")),
+            BCVIDRange(BCVID("41001001"), BCVID("41001002")),
+        ]
+        verseranges = acrossbooks.to_verseranges()
+        assert [vr.ID for vr in verseranges] == ["40028019-40028020", "41001001-41001002"]
+        assert [bcvid.ID for bcvid in acrossbooks] == ["40028019", "40028020", "41001001", "41001002"]
+
+    def test_whole_testament(self) -> None:
+        """Test operations over whole testaments without enumerating verses."""
+        nt = RangeSet([(get_versetable("eng").book_span("40")[0], get_versetable("eng").book_span("66")[1])])
+        assert len(nt) == 7959
+        assert len(nt - self.mrk_4) == 7959 - 41
@@ -0,0 +1,103 @@
+"""Pytest tests for biblelib.unit.reflist."""
+
+import pytest
+
+from biblelib.unit import RangeSet, RefListParser, Versification, parse_reflist
+from biblelib.unit.unitrange import detect_name_range
+
+
+def ids(rangeset: RangeSet) -> list[str]:
+    """Return the interval ID strings for a RangeSet."""
+    return [rangeset._interval_id(start, end) for start, end in rangeset.intervals]
+
+
+class TestParseRefList:
+    """Test basic functionality for parse_reflist()."""
+
+    def test_single(self) -> None:
+        """Test single references."""
+        assert ids(parse_reflist("Mark 4:3")) == ["41004003"]
+        assert ids(parse_reflist("Mark 4:3-9")) == ["41004003-41004009"]
+        assert ids(parse_reflist("Mark 4")) == ["41004001-41004041"]
+        assert ids(parse_reflist("MRK 4:35-5:20")) == ["41004035-41005020"]
+        assert ids(parse_reflist("1 Cor 2:3")) == ["46002003"]
+        assert ids(parse_reflist("Mk 4:3a-5b")) == ["41004003-41004005"]
+        assert len(parse_reflist("Jude")) == 25
+
+    def test_chapter_range(self) -> None:
+        """Test chapter ranges."""
+        assert ids(parse_reflist("Mark 2-4")) == ["41002001-41004041"]
+        assert ids(parse_reflist("Gen 2-3:5")) == ["01002001-01003005"]
+
+    def test_verse_context(self) -> None:
+        """Test carrying chapter context forward after a verse."""
+        assert ids(parse_reflist("Ezra 5:1,14-15")) == ["15005001", "15005014-15005015"]
+        assert ids(parse_reflist("Hag 2:1,10,18-20")) == ["37002001", "37002010", "37002018-37002020"]
+        assert ids(parse_reflist("Gen 2-3:5, 7")) == ["01002001-01003005", "01003007"]
+        # a stray final comma
+        assert ids(parse_reflist("Zech 1:7,")) == ["38001007"]
+
+    def test_chapter_context(self) -> None:
+        """Test bare numbers as chapters."""
+        assert ids(parse_reflist("Gen 1, 3")) == ["01001001-01001031", "01003001-01003024"]
+        assert ids(parse_reflist("Gen 1:1; 3")) == ["01001001", "01003001-01003024"]
+        assert ids(parse_reflist("Gen 1:1; 3:2")) == ["01001001", "01003002"]
+
+    def test_book_context(self) -> None:
+        """Test carrying book context forward, and switching books."""
+        rangeset = parse_reflist("Gen 1:1-3; 2:4; Exod 3")
+        assert ids(rangeset) == ["01001001-01001003", "01002004", "02003001-02003022"]
+        assert ids(parse_reflist("Rev 22:21; Gen 1:1")) == ["01001001", "66022021"]
+
+    def test_single_chapter_book(self) -> None:
+        """Test bare numbers in a single-chapter book."""
+        assert ids(parse_reflist("Jude 3-5")) == ["65001003-65001005"]
+        assert ids(parse_reflist("Obad 3, 5")) == ["31001003", "31001005"]
+
+    def test_versification(self) -> None:
+        """Test chapter and verse numbers in another versification."""
+        assert ids(parse_reflist("Mal 4")) == ["39004001-39004006"]
+        with pytest.raises(ValueError):
+            parse_reflist("Mal 4", versification=Versification.ORG)
+
+    def test_invalid(self) -> None:
+        """Test invalid references."""
+        for ref in ["Gen 50:27", "Gen 3:5-2", "Xyz 1:1", "3:16", "Gen 1:1-"]:
+            with pytest.raises(ValueError):
+                parse_reflist(ref)
+
+
+class TestRefListParser:
+    """Test basic functionality for RefListParser."""
+
+    def test_bookmap(self) -> None:
+        """Test resolving book aliases."""
+        parser = RefListParser(bookmap={"Hagg": "HAG"})
+        assert parser.resolve_book("Hagg") == "37"
+        assert ids(parser.parse("Hagg 2:1")) == ["37002001"]
+
+    def test_cvsep(self) -> None:
+        """Test another chapter/verse separator."""
+        parser = RefListParser(cvsep=".")
+        assert ids(parser.parse("Mk. 4.3-9")) == ["41004003-41004009"]
+
+    def test_strict(self) -> None:
+        """Test skipping invalid items."""
+        parser = RefListParser(strict=False)
+        assert ids(parser.parse("Gen 50:27, 26; Xyz 1")) == ["01050026"]
+
+    def test_parse_many(self) -> None:
+        """Test bulk parsing."""
+        parser = RefListParser()
+        refs = ["Jude 3-5", "Ps 23", "Jude 3-5"]
+        rangesets = list(parser.parse_many(refs))
+        assert [len(rangeset) for rangeset in rangesets] == [3, 6, 3]
+        assert rangesets[0] == rangesets[2]
+        # repeated references are cached
+        assert len(parser._cache) == 2
+
+
+def test_detect_name_range() -> None:
+    """Test detect_name_range()."""
+    assert ids(detect_name_range("Mark 4:35-5:20")) == ["41004035-41005020"]
+    assert ids(detect_name_range("Mark 2-4")) == ["41002001-41004041"]
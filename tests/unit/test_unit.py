@@ -1,5 +1,8 @@
 """Pytest tests for biblelib.unit."""
 
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
 import pytest
 
 
@@ -42,6 +45,60 @@ class TestUnit(object):
             assert unit0 == v0
 
 
+class TestUnitCache:
+    """Test basic functionality for UnitCache."""
+
+    def test_get(self) -> None:
+        """Test cache hits and eviction."""
+        cache = unit.UnitCache(maxsize=2)
+        first = cache.get("a", list)
+        assert cache.get("a", list) is first
+        cache.get("b", list)
+        # "a" was used most recently, so "b" is evicted
+        cache.get("a", list)
+        cache.get("c", list)
+        assert len(cache) == 2
+        assert "b" not in cache.data
+        assert cache.get("a", list) is first
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_threads(self) -> None:
+        """Test that threads racing to create and evict keys share one instance per key."""
+        cache = unit.UnitCache(maxsize=4)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                for key in range(50):
+                    instances = list(executor.map(lambda _: cache.get(key, object), range(8)))
+                    assert all(inst is instances[0] for inst in instances)
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_interned(self) -> None:
+        """Test that interned units can't be changed in place."""
+        shared = verse.Verse(verse.BCVID("41002003"))
+        assert shared is verse.Verse(verse.BCVID("41002003"))
+        for change in (
+            lambda: shared.append(1),
+            lambda: shared.extend([1]),
+            lambda: shared.sort(),
+            lambda: shared.__setitem__(0, 1),
+            lambda: shared.__iadd__([1]),
+        ):
+            with pytest.raises(TypeError, match="shared"):
+                change()
+        assert shared.data == ()
+        with pytest.raises(TypeError, match="shared"):
+            shared.data = [1]
+        # units that aren't interned can
+        local = unit.Unit([2, 1], identifier="41002003")
+        local.append(3)
+        local.sort()
+        assert local.data == [1, 2, 3]
+
+
 # possible test additions:
 # - __repr__()
 # - intersection()
@@ -6,6 +6,7 @@ Not to be confused with book.book.
 # import pytest
 
 from biblelib.word import BID
+from biblelib.unit import Versification
 from biblelib.unit.book import BookChapters, Book, AllBookChapters
 
 
@@ -36,10 +37,13 @@ class TestAllBookChapters:
 
     def test_init(self) -> None:
         """Test for instance."""
-        assert len(self.abc) == 88
-        assert len(self.abc.chapters) == 1459
+        # books in the 'eng' scheme JSON that have a USFM number
+        assert len(self.abc) == 86
+        assert len(self.abc.versetable.lastverses) == 1407
         assert len(self.abc["41"]) == 16
-        assert list(self.abc.keys())[-1] == "66"
+        # ordered by book ID
+        assert list(self.abc.keys())[65] == "66"
+        assert list(self.abc.keys())[-1] == "C3"
 
 
 class TestBook(object):
@@ -57,6 +61,11 @@ class TestBook(object):
         assert self.mark.parent == {}
         assert len(self.mark) == 16
 
+    def test_interned(self) -> None:
+        """Test that books are interned, and chapters are shared."""
+        assert Book(inst=BID(self.testid)) is self.mark
+        assert self.mark[3] is self.mark.enumerate(4)[-1]
+
     def test_enumerate(self) -> None:
         """Test for enumerate."""
         # check a stop enumeration
@@ -71,3 +80,11 @@ class TestBook(object):
         markrange = self.mark.enumerate(self.mark.lastchapter)
         assert markrange[0].identifier.ID == "41001"
         assert markrange[-1].identifier.ID == "41016"
+
+    def test_versification(self) -> None:
+        """Test that chapter counts follow the versification."""
+        # MAL has 4 chapters in 'eng', but 3 in 'org'
+        assert Book(inst=BID("39")).lastchapter == 4
+        org_mal = Book(inst=BID("39"), versification=Versification.ORG)
+        assert org_mal.lastchapter == 3
+        assert org_mal[-1].versification == Versification.ORG
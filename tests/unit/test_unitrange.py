@@ -2,8 +2,8 @@
 
 import pytest
 
-from biblelib.word import BID, BCID, BCVID
-from biblelib.unit import Chapter, Verse, unitrange
+from biblelib.word import BID, BCID, BCVID, BCVWPID
+from biblelib.unit import Chapter, Verse, Versification, unitrange
 
 
 class TestChapterRange(object):
@@ -89,3 +89,92 @@ class TestVerseRange(object):
         assert isinstance(enumerated[0], Verse)
         # vacuous range
         assert len(enumerated) == 36
+
+    def test_enumerate_versification(self) -> None:
+        """Test enumerating across chapters in another versification."""
+        # GEN 31:55 is the last verse of the chapter in 'eng', but GEN 32:1 in 'org'
+        engrange = unitrange.VerseRange(startid=BCVID("01031054"), endid=BCVID("01032002"))
+        assert len(engrange.enumerate()) == 4
+        orgrange = unitrange.VerseRange(
+            startid=BCVID("01031054"), endid=BCVID("01032002"), versification=Versification.ORG
+        )
+        assert [v.inst.ID for v in orgrange.enumerate()] == ["01031054", "01032001", "01032002"]
+
+
+class TestWordRange:
+    """Test basic functionality for WordRange."""
+
+    wordcounts = {"41004003": 3, "41004004": 2, "41004005": 4}.get
+    testrange = unitrange.WordRange(startid=BCVWPID("41004003002"), endid=BCVWPID("41004005002"))
+
+    def test_init(self) -> None:
+        """Test initialization."""
+        assert unitrange.WordRange("n41004003002", "41004005002") == self.testrange
+        assert self.testrange.ID == "410040030021-410040050021"
+        assert self.testrange.cross_verse
+        with pytest.raises(AssertionError):
+            unitrange.WordRange("41004005002", "41004003002")
+
+    def test_contains(self) -> None:
+        """Test containment without word data."""
+        assert "41004003002" in self.testrange
+        assert "n41004004099" in self.testrange
+        assert BCVWPID("41004005002") in self.testrange
+        assert "41004003001" not in self.testrange
+        assert "41004005003" not in self.testrange
+
+    def test_iter_ids(self) -> None:
+        """Test lazy enumeration with word counts."""
+        assert list(self.testrange.iter_ids(self.wordcounts)) == [
+            "410040030021",
+            "410040030031",
+            "410040040011",
+            "410040040021",
+            "410040050011",
+            "410040050021",
+        ]
+        assert self.testrange.count(self.wordcounts) == 6
+        # verses missing from the data have no words
+        assert self.testrange.count({"41004003": 3, "41004005": 4}.get) == 4
+
+    def test_iter_ids_parts(self) -> None:
+        """Test that start and end parts are enumerated."""
+        wordrange = unitrange.WordRange("010010010022", "010010010033")
+        assert list(wordrange.iter_ids({"01001001": 5}.get)) == ["010010010022", "010010010031", "010010010033"]
+
+    def test_encode(self) -> None:
+        """Test the compact encoding round-trips."""
+        code = self.testrange.encode()
+        assert code.bit_length() <= 80
+        assert unitrange.WordRange.decode(code) == self.testrange
+
+    def test_from_ids(self) -> None:
+        """Test compressing sorted tokens into ranges."""
+        tokens = [
+            "41004003001",
+            "41004003002",
+            "41004003003",
+            "41004004001",
+            "41004004002",
+            "41004005001",
+            "41004005003",
+            "410040050041",
+            "410040050042",
+        ]
+        assert [wordrange.ID for wordrange in unitrange.WordRange.from_ids(tokens)] == [
+            "410040030011-410040030031",
+            "410040040011-410040040021",
+            "410040050011-410040050011",
+            "410040050031-410040050042",
+        ]
+        # with word counts, ranges span verses
+        assert [wordrange.ID for wordrange in unitrange.WordRange.from_ids(tokens, self.wordcounts)] == [
+            "410040030011-410040050011",
+            "410040050031-410040050042",
+        ]
+        assert unitrange.WordRange.from_ids([]) == []
+
+    def test_from_ids_unsorted(self) -> None:
+        """Test that unsorted tokens are rejected."""
+        with pytest.raises(AssertionError):
+            unitrange.WordRange.from_ids(["41004003002", "41004003001"])
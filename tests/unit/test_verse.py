@@ -15,3 +15,9 @@ class TestVerse(object):
         assert mark_4_3.identifier.ID == testid
         assert len(mark_4_3) == 0
         assert mark_4_3.versification.name == "ENG"
+
+    def test_interned(self) -> None:
+        """Test that verses are interned by identifier and versification."""
+        mark_4_3 = verse.Verse(inst=BCVID("41004003"))
+        assert verse.Verse(inst=BCVID("41004003")) is mark_4_3
+        assert verse.Verse(inst=BCVID("41004003"), versification=verse.Versification.ORG) is not mark_4_3
@@ -0,0 +1,65 @@
+"""Test VerseTable()."""
+
+import pytest
+
+from biblelib.versification import VerseTable, get_versetable
+
+
+class TestVerseTable:
+    eng = get_versetable("eng")
+
+    def test_shared(self) -> None:
+        """Test that each scheme compiles a single shared table."""
+        assert get_versetable("eng") is self.eng
+        assert get_versetable("org") is not self.eng
+
+    def test_counts(self) -> None:
+        """Test verse and chapter counts."""
+        assert self.eng.lastverse("41004") == 41
+        assert self.eng.lastverse("41004003") == 41
+        assert self.eng.lastchapter("41") == 16
+        assert self.eng.chapters("65") == ["65001"]
+        assert get_versetable("org").lastverse("01032") == 33
+        with pytest.raises(KeyError):
+            self.eng.lastverse("41017")
+
+    def test_contains(self) -> None:
+        """Test verse membership."""
+        assert "41004041" in self.eng
+        assert "41004042" not in self.eng
+        assert "41004000" not in self.eng
+        assert "44019041" in self.eng
+        assert "44019041" not in get_versetable("org")
+
+    def test_ordinal(self) -> None:
+        """Test mapping verses to ordinals and back."""
+        assert self.eng.ordinal("01001001") == 0
+        assert self.eng.ordinal("01002001") == 31
+        assert self.eng.from_ordinal(31) == "01002001"
+        assert self.eng.from_ordinal(self.eng.total - 1) == "C3001020"
+        for bcvid in ("41004003", "19119176", "66022021"):
+            assert self.eng.from_ordinal(self.eng.ordinal(bcvid)) == bcvid
+        with pytest.raises(ValueError):
+            self.eng.ordinal("41004042")
+        with pytest.raises(ValueError):
+            self.eng.from_ordinal(self.eng.total)
+
+    def test_book_span(self) -> None:
+        """Test first and last ordinals for a book."""
+        first, last = self.eng.book_span("41")
+        assert self.eng.from_ordinal(first) == "41001001"
+        assert self.eng.from_ordinal(last) == "41016020"
+
+    def test_unsupported(self) -> None:
+        """Test unsupported schemes."""
+        with pytest.raises(AssertionError):
+            VerseTable("lxx")
+        with pytest.raises(AssertionError):
+            get_versetable("bogus")
+
+    @pytest.mark.parametrize("scheme", ["lxx", "rsc", "vul"])
+    def test_fallback(self, scheme: str) -> None:
+        """Test that Versification members without data fall back to eng, with a warning."""
+        # the uncached function, since the warning is only given once
+        with pytest.warns(UserWarning, match=f"No verse counts for the {scheme} versification"):
+            assert get_versetable.__wrapped__(scheme) is self.eng
@@ -0,0 +1,71 @@
+"""Test the text load modes of biblelib.word.mappings.GNTMappings, with a small mapping file."""
+
+from pathlib import Path
+from unicodedata import normalize
+
+import pytest
+
+from biblelib.word.mappings import GNTMapping, GNTMappings
+
+# Example mapping: JHN 1:1
+TESTMAPPING = GNTMapping(
+    NA1904_ID="n43001001005",
+    NA1904_Text="Λόγος,",
+    NA27_ID="43001001005",
+    NA28_ID="43001001005",
+    SBLGNT_ID="n43001001005",
+    SBLGNT_Text="λόγος,",
+    MARBLE_ID="04300100100010",
+)
+
+
+# decomposed text, which loading should normalize
+DECOMPOSED = normalize("NFD", "Λόγος,")
+
+
+@pytest.fixture
+def gntfile(tmp_path: Path) -> Path:
+    """Return the path to a small GNT mapping TSV."""
+    path = tmp_path / "gnt.tsv"
+    rows = [
+        "NA1904_ID\tNA1904_Text\tNA27_ID\tNA28_ID\tSBLGNT_ID\tSBLGNT_Text\tMARBLE_ID",
+        f"43001001005\t{DECOMPOSED}\t43001001005\t43001001005\t43001001005\tλόγος,\t04300100100010",
+        "43001001006\tἦν\t43001001006\t43001001006\t\t\t04300100100012",
+    ]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return path
+
+
+class TestGNTMappingsText:
+    """Test the text load modes of GNTMappings."""
+
+    def test_full(self, gntfile: Path) -> None:
+        """Test that text is normalized on loading."""
+        gnt = GNTMappings(str(gntfile))
+        assert gnt[0] == TESTMAPPING
+        assert gnt[0].NA1904_Text == "Λόγος,"
+        assert gnt[1].SBLGNT_ID == ""
+
+    def test_lazy(self, gntfile: Path) -> None:
+        """Test that text is normalized on first access."""
+        gnt = GNTMappings(str(gntfile), text="lazy")
+        assert gnt[0].NA1904_ID == "n43001001005"
+        assert "NA1904_Text" not in vars(gnt[0])
+        assert gnt[0].NA1904_Text == "Λόγος,"
+        assert vars(gnt[0])["NA1904_Text"] == "Λόγος,"
+        assert gnt[0] == TESTMAPPING
+        assert TESTMAPPING == gnt[0]
+        assert gnt.marble2sblgnt("04300100100010") == "n43001001005"
+        assert "_raw_NA1904_Text" not in vars(gnt[0])
+        with pytest.raises(AttributeError):
+            gnt[0].NA1904_Token
+        assert not hasattr(gnt[0], "_raw_NA1904_Text")
+
+    def test_none(self, gntfile: Path) -> None:
+        """Test loading IDs only."""
+        gnt = GNTMappings(str(gntfile), text="none")
+        assert gnt[0].NA1904_Text == gnt[0].SBLGNT_Text == ""
+        assert gnt.na282sblgnt("43001001005") == "n43001001005"
+        assert gnt.na282sblgnt("43001001006") == ""
+        with pytest.raises(AssertionError):
+            GNTMappings(str(gntfile), text="some")
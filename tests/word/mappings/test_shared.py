@@ -0,0 +1,101 @@
+"""Test biblelib.word.mappings.shared"""
+
+import pickle
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from biblelib.word import BCVID, BCVWPID, fromubs
+from biblelib.word.mappings import GNTMappings, SharedMappingExecutor, SharedMarbleTable, WLCMMappings, worker_table
+
+GNTROWS = [
+    "NA1904_ID\tNA1904_Text\tNA27_ID\tNA28_ID\tSBLGNT_ID\tSBLGNT_Text\tMARBLE_ID",
+    "41006045017\tκαὶ\t41006045017\t41006045017\t41006045017\tκαὶ\t04100604500034",
+    # not in SBLGNT
+    "40017021001\tτοῦτο\t40017021001\t40017021001\t\t\t04001702100002",
+    "43001001001\tἘν\t43001001001\t43001001001\t43001001001\tἘν\t04300100100002",
+]
+WLCMROWS = [
+    "MACULA_IDs\tMARBLE_IDs",
+    "o010010010061\t00100100100016",
+    "o230600060041 o230600060042\t02306000600008",
+]
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory: pytest.TempPathFactory) -> Iterator[SharedMarbleTable]:
+    """Publish a table from small mapping files."""
+    tmp_path: Path = tmp_path_factory.mktemp("mappings")
+    (tmp_path / "gnt.tsv").write_text("\n".join(GNTROWS) + "\n", encoding="utf-8")
+    (tmp_path / "wlcm.tsv").write_text("\n".join(WLCMROWS) + "\n", encoding="utf-8")
+    gnt = GNTMappings(str(tmp_path / "gnt.tsv"))
+    wlcm = WLCMMappings(str(tmp_path / "wlcm.tsv"))
+    with SharedMarbleTable.publish(gnt, wlcm) as table:
+        yield table
+
+
+def _lookup(marbleid: str) -> list[str]:
+    """Map a MARBLE ID in a worker."""
+    return worker_table().to_macula(marbleid)
+
+
+class TestSharedMarbleTable:
+    """Test publishing and reading a shared table."""
+
+    def test_get(self, table: SharedMarbleTable) -> None:
+        """Test lookups in the publishing process."""
+        assert len(table) == 5
+        assert table.get("00100100100016") == "o010010010061"
+        assert table.get("04300100100002") == "n43001001001"
+        assert table.get("04001702100002") == ""
+        assert table.get("04300100100004") == ""
+        assert table.get("04300100100004", "missing") == "missing"
+        assert table.get("0010010010001") == ""
+        assert table.get("00000000000000") == ""
+        assert table.get("09900000000000") == ""
+
+    def test_to_macula(self, table: SharedMarbleTable) -> None:
+        """Test the same results as Mapper.to_macula()."""
+        assert table.to_macula("00100100100016") == ["o010010010061"]
+        assert table.to_macula("02306000600008{N:001}") == ["o230600060041", "o230600060042"]
+        assert table.to_macula("04100604500034") == ["n41006045017"]
+        assert table.to_macula("04001702100002") == []
+        with pytest.warns(UserWarning, match="Invalid book ID"):
+            assert table.to_macula("07700101700022") == []
+
+    def test_attach(self, table: SharedMarbleTable) -> None:
+        """Test attaching by name, and by unpickling."""
+        with SharedMarbleTable.attach(table.name) as attached:
+            assert not attached.owner
+            assert attached.get("04100604500034") == "n41006045017"
+        unpickled = pickle.loads(pickle.dumps(table))
+        assert unpickled.name == table.name
+        assert unpickled.get("00100100100016") == "o010010010061"
+        unpickled.close()
+        # closing another attachment leaves this one usable
+        assert table.get("00100100100016") == "o010010010061"
+
+    def test_fromubs(self, table: SharedMarbleTable) -> None:
+        """Test converting UBS references with the shared table."""
+        assert fromubs("02306000600008", mapper=table) == [BCVWPID("o230600060041"), BCVWPID("o230600060042")]
+        assert fromubs("02306000600000", mapper=table) == [BCVID("23060006")]
+
+
+class TestSharedMappingExecutor:
+    """Test converting in worker processes."""
+
+    def test_fromubs(self, table: SharedMarbleTable) -> None:
+        """Test converting UBS references in parallel."""
+        refs = ["00100100100016", "04300100100002", "04001702100002", "02306000600000"]
+        with SharedMappingExecutor(max_workers=2, table=table) as executor:
+            converted = list(executor.fromubs(refs, chunksize=1))
+            assert list(executor.map(_lookup, refs[:2])) == [["o010010010061"], ["n43001001001"]]
+        assert converted == [fromubs(ref, mapper=table) for ref in refs]
+        # the executor doesn't free a table it didn't publish
+        assert table.get("00100100100016") == "o010010010061"
+
+    def test_invalid(self, table: SharedMarbleTable) -> None:
+        """Test that the executor keeps its own initializer."""
+        with pytest.raises(AssertionError):
+            SharedMappingExecutor(table=table, initializer=print)
@@ -0,0 +1,121 @@
+"""Test biblelib.word.mappings.wordcounts with small mapping files."""
+
+from pathlib import Path
+
+import pytest
+
+from biblelib.unit import WordRange
+from biblelib.word.mappings import WordCountTable, load_wordcounts
+
+GNTROWS = [
+    # NA1904_ID, NA1904_Text, NA27_ID, NA28_ID, SBLGNT_ID, SBLGNT_Text, MARBLE_ID
+    ("43001001001", "Ἐν", "43001001001", "43001001001", "43001001001", "Ἐν", "04300100100002"),
+    ("43001001002", "ἀρχῇ", "43001001002", "43001001002", "43001001002", "ἀρχῇ", "04300100100004"),
+    ("43001001003", "ἦν", "43001001003", "43001001003", "", "", "04300100100006"),
+    ("43001002001", "οὗτος", "43001002001", "43001002001", "43001002001", "οὗτος", "04300100200002"),
+]
+WLCMROWS = [
+    ("o010010010011 o010010010012", "00100100100002"),
+    ("o010010010021", "00100100100004"),
+    ("o010010010031 o010010010032 o010010010033", "00100100100006"),
+    ("o010010020011", "00100100200002"),
+]
+
+
+@pytest.fixture
+def gntfile(tmp_path: Path) -> Path:
+    """Return the path to a small GNT mapping TSV."""
+    path = tmp_path / "gnt.tsv"
+    header = "NA1904_ID\tNA1904_Text\tNA27_ID\tNA28_ID\tSBLGNT_ID\tSBLGNT_Text\tMARBLE_ID"
+    path.write_text("\n".join([header] + ["\t".join(row) for row in GNTROWS]) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def wlcmfile(tmp_path: Path) -> Path:
+    """Return the path to a small WLCM mapping TSV."""
+    path = tmp_path / "wlcm.tsv"
+    path.write_text(
+        "\n".join(["MACULA_IDs\tMARBLE_IDs"] + ["\t".join(row) for row in WLCMROWS]) + "\n", encoding="utf-8"
+    )
+    return path
+
+
+class TestWordCountTable:
+    """Test WordCountTable."""
+
+    def test_gnt(self, gntfile: Path) -> None:
+        """Test counts for Greek editions."""
+        sblgnt = load_wordcounts("SBLGNT", sourcefile=str(gntfile))
+        assert sblgnt.wordcount("43001001") == 2
+        assert sblgnt.wordcount("43001003") == 0
+        assert load_wordcounts("NA28", sourcefile=str(gntfile)).wordcount("43001001") == 3
+        assert sblgnt.offset("43001002") == 2
+        assert sblgnt.total == 3
+        assert list(sblgnt.token_ids("43001001")) == ["430010010011", "430010010021"]
+        assert sblgnt.token_range("43001001") == ("430010010011", "430010010021")
+
+    def test_wlcm(self, wlcmfile: Path) -> None:
+        """Test counts and parts for Hebrew."""
+        wlcm = load_wordcounts("WLCM", sourcefile=str(wlcmfile))
+        assert wlcm.wordcount("01001001") == 3
+        assert wlcm.tokencount("01001001") == 6
+        assert wlcm.parts == {"01001001": "213"}
+        assert wlcm.offset("01001002") == 6
+        assert list(wlcm.token_ids("01001001")) == [
+            "010010010011",
+            "010010010012",
+            "010010010021",
+            "010010010031",
+            "010010010032",
+            "010010010033",
+        ]
+        assert wlcm.token_range("01001001") == ("010010010011", "010010010033")
+
+    def test_word_range(self, gntfile: Path) -> None:
+        """Test WordRanges for verses, and as a source of word counts."""
+        sblgnt = load_wordcounts("SBLGNT", sourcefile=str(gntfile))
+        assert sblgnt.word_range("43001001") == WordRange("43001001001", "43001001002")
+        span = WordRange("43001001002", "43001002001")
+        assert list(span.iter_ids(sblgnt.wordcount)) == ["430010010021", "430010020011"]
+
+    def test_cache(self, gntfile: Path, tmp_path: Path) -> None:
+        """Test saving and reloading a table."""
+        cachefile = tmp_path / "wordcounts.json"
+        built = load_wordcounts("SBLGNT", sourcefile=str(gntfile), cachefile=str(cachefile))
+        assert cachefile.exists()
+        # the cache is used even if the source is gone
+        gntfile.unlink()
+        cached = load_wordcounts("SBLGNT", sourcefile=str(gntfile), cachefile=str(cachefile))
+        assert cached.wordcounts == built.wordcounts
+        assert cached.offsets == built.offsets
+
+    @pytest.mark.parametrize("cached", [b"", b'{"edition": "SBL', b"[]", b'{"edition": "SBLGNT"}', b"\xe9"])
+    def test_corrupt_cache(self, gntfile: Path, tmp_path: Path, cached: bytes) -> None:
+        """Test that an unreadable cached table is derived again, and replaced."""
+        cachefile = tmp_path / "wordcounts.json"
+        built = load_wordcounts("SBLGNT", sourcefile=str(gntfile), cachefile=str(cachefile))
+        cachefile.write_bytes(cached)
+        assert load_wordcounts("SBLGNT", sourcefile=str(gntfile), cachefile=str(cachefile)).offsets == built.offsets
+        assert WordCountTable.from_json(cachefile).offsets == built.offsets
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_unwritable_cache(self, gntfile: Path, tmp_path: Path) -> None:
+        """Test deriving the table when the cache can't be written."""
+        # a file where the directory should be
+        (tmp_path / "cache").write_text("", encoding="utf-8")
+        cachefile = tmp_path / "cache" / "wordcounts.json"
+        table = load_wordcounts("SBLGNT", sourcefile=str(gntfile), cachefile=str(cachefile))
+        assert table.wordcount("43001001") == 2
+        assert not cachefile.exists()
+
+    def test_from_ids(self) -> None:
+        """Test building from IDs in any order."""
+        table = WordCountTable.from_ids("SBLGNT", ["n41004003002", "n41004003001", "n41004001001"])
+        assert table.wordcounts == {"41004001": 1, "41004003": 2}
+        assert table.offset("41004003") == 1
+
+    def test_unknown_edition(self, gntfile: Path) -> None:
+        """Test an unknown edition name."""
+        with pytest.raises(AssertionError):
+            load_wordcounts("NA26", sourcefile=str(gntfile))
@@ -1,5 +1,7 @@
 """Test biblelib.word.bcvwpid."""
 
+from concurrent.futures import ThreadPoolExecutor
+import sys
 import typing
 
 import pytest
@@ -16,6 +18,11 @@ from biblelib.word import (
     to_bcv,
     make_id,
     is_bcvwpid,
+    invalid_ids,
+    validate_ids,
+    enable_interning,
+    disable_interning,
+    get_idpool,
 )
 
 from biblelib.word.bcvwpid import pad3
@@ -172,6 +179,13 @@ class TestFromUsfm:
             # zero word index is invalid
             assert fromusfm("MRK 4:1!0") == BCVWPID("41004001000")
 
+    def test_fromusfm_chapterrange(self) -> None:
+        """Test returned values"""
+        assert fromusfm("MRK 2-4") == BCVIDRange(BCVID("41002001"), BCVID("41004041"))
+        for ref in ("MRK 2-99", "MRK 99-100"):
+            with pytest.raises(ValueError, match="Invalid chapter range"):
+                fromusfm(ref)
+
     def test_fromusfm_verserange(self) -> None:
         """Test returned values"""
         assert fromusfm("MRK 4:1-4:9") == BCVIDRange(
@@ -232,6 +246,20 @@ class TestFromTBD:
         assert fromtbd("bref^1Thes_1_1").get_id() == "52001001"
         assert fromtbd("bref^Tb_1_1").get_id() == "68001001"
 
+    def test_fromtbd_crosschapter(self) -> None:
+        """Test cross-chapter ranges."""
+        assert fromtbd("bref^Zech_1_7-6_8").get_id() == "38001007-38006008"
+
+    def test_fromtbd_conjoined(self) -> None:
+        """Test conjoined references."""
+        rangeset = fromtbd("bref^Hagg_2_1,10,18-20")
+        assert len(rangeset) == 5
+        assert BCVID("37002010") in rangeset
+        assert BCVID("37002011") not in rangeset
+        # a stray final comma isn't a conjoined reference
+        assert fromtbd("bref^Zech_1_7,") == BCVID("38001007")
+        assert fromtbd("bref^Zech_1_7-6_8,").get_id() == "38001007-38006008"
+
     def test_fromtbd_validity(self) -> None:
         """Test fromtbd() with invalid input."""
         with pytest.raises(AssertionError):
@@ -274,14 +302,6 @@ class TestBID:
         assert not mark.includes(BCVID("40001001"))
         assert not mark.includes(BCVWPID("400010010011"))
 
-    def test_bookname(self) -> None:
-        "Test _get_bookname()."
-        onecor = BID("46")
-        assert onecor._get_bookname(style="usfmname") == "1CO"
-        assert onecor._get_bookname(style="name") == "1 Corinthians"
-        assert onecor._get_bookname(style="osisID") == "1Cor"
-        assert onecor._get_bookname(style="biblia") == "1Co"
-
 
 class TestBCID:
     """Test basic functionality of BCID dataclass."""
@@ -689,3 +709,180 @@ class TestIs_bcvwpid:
         assert is_bcvwpid("n410040030011") is True
         # not BCV
         assert is_bcvwpid("41004003") is False
+
+
+class TestIdComparison:
+    """Test ID-based equality, hashing, and ordering."""
+
+    def test_equality(self) -> None:
+        """Test equality within and across types."""
+        assert BCVWPID("n41004003001") == BCVWPID("410040030011")
+        assert BCID("41004") != BCID("41005")
+        # different types are never equal
+        assert BCID("41004") != BCVID("41004001")
+        assert BID("41") != "41"
+        assert BCVID("41004003") != BCVIDRange(BCVID("41004003"), BCVID("41004003"))
+
+    def test_hash(self) -> None:
+        """Test that hashes depend only on ID."""
+        assert hash(BCVWPID("n41004003001")) == hash("410040030011")
+        assert len({BCVID("41004003"), BCVID("41004003"), BCVID("41004004")}) == 2
+
+    def test_order(self) -> None:
+        """Test ordering across types."""
+        refs = [BCVWPID("41004003001"), BCVID("41004003"), BID("42"), BCID("41004"), BID("41"), BCVID("40001001")]
+        assert sorted(refs) == [
+            BCVID("40001001"),
+            BID("41"),
+            BCID("41004"),
+            BCVID("41004003"),
+            BCVWPID("41004003001"),
+            BID("42"),
+        ]
+        assert BCID("41004") < BCVID("41004001") <= BCVID("41004001") < BCID("41005")
+        assert BCVWPID("41004003001") > BCVID("41004003")
+        with pytest.raises(TypeError):
+            _ = BCID("41004") < "41005"
+
+
+class TestFromTrusted:
+    """Test from_trusted() construction without validation."""
+
+    @pytest.mark.parametrize(
+        "idtype, ID",
+        [
+            (BID, "41"),
+            (BCID, "41004"),
+            (BCVID, "41004003"),
+            (BCVWPID, "41004003001"),
+            (BCVWPID, "n41004003001"),
+            (BCVWPID, "o010010010012"),
+        ],
+    )
+    def test_same_as_init(self, idtype: type, ID: str) -> None:
+        """Test that trusted instances match validated ones."""
+        validated = idtype(ID)
+        trusted = idtype.from_trusted(ID)
+        assert type(trusted) is idtype
+        assert trusted == validated
+        assert hash(trusted) == hash(validated)
+        assert vars(trusted) == vars(validated)
+
+    def test_no_validation(self) -> None:
+        """Test that invalid IDs aren't checked."""
+        with pytest.raises(AssertionError):
+            BCVID("41999003")
+        assert BCVID.from_trusted("41999003").chapter_ID == "999"
+
+
+class TestInvalidIds:
+    """Test bulk ID validation."""
+
+    def test_invalid_ids(self) -> None:
+        """Test that every bad row is reported."""
+        ids = ["41004003001", "4100400300", "o41004003001", None, "n410040030012"]
+        assert invalid_ids(ids) == [(1, "4100400300"), (2, "o41004003001"), (3, None)]
+        assert invalid_ids(["41004003", "41151001", "D1001001", "C1001001"], BCVID) == [
+            (1, "41151001"),
+            (2, "D1001001"),
+        ]
+
+    @pytest.mark.parametrize("idtype", [BID, BCID, BCVID, BCVWPID])
+    def test_agrees_with_init(self, idtype: type) -> None:
+        """Test that invalid_ids() rejects exactly the IDs that initialization rejects."""
+        ids = [
+            "41",
+            "41004",
+            "41004003",
+            "4100a003",
+            "41150003",
+            "41151003",
+            "D1004003",
+            "41004003001",
+            "410040030012",
+            "o41004003001",
+            "n41004003001",
+            "o39004003001",
+            "n67004003001",
+            "x1004003001",
+        ]
+        rejected = []
+        for index, ID in enumerate(ids):
+            try:
+                idtype(ID)
+            except AssertionError:
+                rejected.append((index, ID))
+        assert invalid_ids(ids, idtype) == rejected
+
+    def test_validate_ids(self) -> None:
+        """Test that validate_ids() reports all bad rows at once."""
+        validate_ids(["41004003001", "n41004003001"])
+        with pytest.raises(ValueError, match=r"2 invalid BCVWPID identifiers: 0: '4100', 2: 'x'"):
+            validate_ids(["4100", "41004003001", "x"])
+
+
+class TestInterning:
+    """Test opt-in interning of reference instances."""
+
+    @pytest.fixture(autouse=True)
+    def pool(self) -> typing.Iterator:
+        """Enable interning for each test."""
+        yield enable_interning(maxsize=4)
+        disable_interning()
+
+    def test_shared(self, pool: typing.Any) -> None:
+        """Test that repeated IDs return the same instance."""
+        bcvid = BCVID("41004003")
+        assert BCVID("41004003") is bcvid
+        assert BID("41") is BID("41")
+        assert BCID("41004") is not BCID("41005")
+        assert pool.stats()["hits"] == 2
+        assert get_idpool() is pool
+
+    def test_simplify(self) -> None:
+        """Test that simplify() returns shared instances."""
+        bcvwpid = BCVWPID("41004003001")
+        assert simplify(bcvwpid, BCID) is simplify(bcvwpid, BCID)
+        assert simplify(bcvwpid, BCVID) is BCVID("41004003")
+        # word IDs are too numerous to intern
+        assert BCVWPID("41004003001") is not bcvwpid
+
+    def test_invalid(self, pool: typing.Any) -> None:
+        """Test that invalid IDs still fail and aren't interned."""
+        with pytest.raises(AssertionError):
+            BCVID("41999003")
+        with pytest.raises(AssertionError):
+            BCVID("41999003")
+        assert len(pool) == 0
+
+    def test_weak(self, pool: typing.Any) -> None:
+        """Test that instances beyond maxsize are dropped when unreferenced."""
+        kept = BCVID("41004003")
+        for verse in range(1, 10):
+            BCVID(f"41005{verse:03d}")
+        assert BCVID("41004003") is kept
+        assert len(pool) == 5
+
+    def test_threads(self, pool: typing.Any) -> None:
+        """Test that threads racing to create an ID share one instance, counted once as a miss."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                for verse in range(1, 51):
+                    instances = list(executor.map(lambda _: BCVID(f"41005{verse:03d}"), range(8)))
+                    assert all(inst is instances[0] for inst in instances)
+                    assert instances[0].verse_ID == f"{verse:03d}"
+        finally:
+            sys.setswitchinterval(interval)
+        assert pool.stats()["misses"] == 50
+        assert pool.stats()["hits"] == 350
+
+    def test_disable(self) -> None:
+        """Test that disabling restores normal construction."""
+        bcvid = BCVID("41004003")
+        disable_interning()
+        assert get_idpool() is None
+        assert BCVID("41004003") is not bcvid
+        assert BCVID("41004003") == bcvid
+
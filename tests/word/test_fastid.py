@@ -0,0 +1,75 @@
+"""Test string-level ID helpers against the reference classes."""
+
+import pytest
+
+from biblelib.word import BID, BCID, BCVID, BCVWPID, fastid, make_id, simplify, to_bcv
+
+WORDIDS = ["41004003001", "n41004003001", "410040030012", "o010010010012", "01001001001", "n660220210011"]
+IDS = ["41", "01", "41004", "41005", "41004003", "41004004", "01001001"] + WORDIDS
+CLASSES = {"BID": BID, "BCID": BCID, "BCVID": BCVID, "BCVWPID": BCVWPID}
+
+
+class TestFastId:
+    """Test that fastid matches instance attributes and methods."""
+
+    @pytest.mark.parametrize("ID", IDS)
+    def test_attributes(self, ID: str) -> None:
+        """Test kind, normalize, and component IDs."""
+        inst = make_id(ID)
+        assert fastid.kind(ID) == type(inst).__name__
+        assert fastid.normalize(ID) == inst.ID
+        assert fastid.book_ID(ID) == inst.book_ID
+        if hasattr(inst, "chapter_ID"):
+            assert fastid.chapter_ID(ID) == inst.chapter_ID
+        if hasattr(inst, "verse_ID"):
+            assert fastid.verse_ID(ID) == inst.verse_ID
+
+    @pytest.mark.parametrize("ID", WORDIDS)
+    def test_words(self, ID: str) -> None:
+        """Test word-level attributes and conversions."""
+        inst = BCVWPID(ID)
+        assert fastid.word_ID(ID) == inst.word_ID
+        assert fastid.part_ID(ID) == inst.part_ID
+        assert fastid.canon_prefix(ID) == inst.canon_prefix
+        assert fastid.to_bid(ID) == inst.to_bid
+        assert fastid.to_bcid(ID) == inst.to_bcid
+        assert fastid.to_bcvid(ID) == inst.to_bcvid == to_bcv(ID)
+
+    def test_kind_invalid(self) -> None:
+        """Test an unexpected length."""
+        with pytest.raises(ValueError):
+            fastid.kind("4100")
+
+    @pytest.mark.parametrize("ID", IDS)
+    @pytest.mark.parametrize("newkind", ["BID", "BCID", "BCVID", "BCVWPID"])
+    def test_simplify(self, ID: str, newkind: str) -> None:
+        """Test simplify() for every pair of kinds."""
+        try:
+            expected = simplify(make_id(ID), CLASSES[newkind]).ID
+        except (AssertionError, ValueError):
+            with pytest.raises(ValueError):
+                fastid.simplify(ID, newkind)
+        else:
+            assert fastid.simplify(ID, newkind) == expected
+
+    @pytest.mark.parametrize("outer", IDS)
+    @pytest.mark.parametrize("inner", IDS)
+    def test_includes(self, outer: str, inner: str) -> None:
+        """Test includes() for every pair of IDs."""
+        try:
+            expected = make_id(outer).includes(make_id(inner))
+        except AssertionError:
+            with pytest.raises(AssertionError):
+                fastid.includes(outer, inner)
+        else:
+            assert fastid.includes(outer, inner) == expected
+
+    @pytest.mark.parametrize("first", IDS)
+    @pytest.mark.parametrize("second", IDS)
+    def test_compare(self, first: str, second: str) -> None:
+        """Test compare() for IDs of the same kind."""
+        firstinst, secondinst = make_id(first), make_id(second)
+        if type(firstinst) is not type(secondinst):
+            return
+        expected = (firstinst > secondinst) - (firstinst < secondinst)
+        assert fastid.compare(first, second) == expected
@@ -0,0 +1,55 @@
+"""Pytest tests for biblelib.word.localref."""
+
+import pytest
+
+from biblelib.book import localized_languages
+from biblelib.word import BID, BCID, BCVID, BCVIDRange, LocalizedRefParser, parse_localized
+
+
+class TestParseLocalized:
+    """Test basic functionality for parse_localized()."""
+
+    def test_parse(self) -> None:
+        """Test books, chapters, verses, and ranges."""
+        assert parse_localized("Marc", lang="fra") == BID("41")
+        assert parse_localized("Marc 4", lang="fra") == BCID("41004")
+        assert parse_localized("Marc 4.3", lang="fra") == BCVID("41004003")
+        assert parse_localized("Mc 4.3-8", lang="fra") == BCVIDRange(BCVID("41004003"), BCVID("41004008"))
+        assert parse_localized("Mc 4.3-5.8", lang="fra") == BCVIDRange(BCVID("41004003"), BCVID("41005008"))
+        assert parse_localized("Mc 4-5", lang="fra") == BCVIDRange(BCVID("41004001"), BCVID("41005043"))
+
+    def test_cv_sep(self) -> None:
+        """Test each language's chapter-verse separator."""
+        with pytest.raises(ValueError):
+            parse_localized("Marc 4:3", lang="fra")
+        assert parse_localized("Marcos 4:3", lang="spa") == BCVID("41004003")
+        # any separator without a language
+        assert parse_localized("Marc 4.3") == parse_localized("Marc 4:3") == BCVID("41004003")
+
+    def test_fallback(self) -> None:
+        """Test falling back to a shorter name when a longer one leaves no valid chapter."""
+        assert parse_localized("Baruk 4:1", lang="bis") == BCVID("73004001")
+
+    def test_invalid(self) -> None:
+        """Test invalid references."""
+        for ref in ["Xyz 1:1", "Marc 4.3.2", "Marc four", "Marc 2-99", "Marc 99-100"]:
+            with pytest.raises(ValueError):
+                parse_localized(ref, lang="fra")
+
+
+class TestLocalizedRefParser:
+    """Test basic functionality for LocalizedRefParser."""
+
+    def test_parse_many(self) -> None:
+        """Test batch parsing."""
+        parser = LocalizedRefParser("fra")
+        assert parser.cv_sep == "."
+        assert parser.parse_many(["Gn 1.1", "Mc 4.3"]) == [BCVID("01001001"), BCVID("41004003")]
+
+    @pytest.mark.parametrize("lang", localized_languages())
+    def test_roundtrip(self, lang: str) -> None:
+        """Test parsing rendered references in every language."""
+        parser = LocalizedRefParser(lang)
+        for ref in [BCVID("01001001"), BCVID("41004003"), BCVIDRange(BCVID("66021001"), BCVID("66022005"))]:
+            assert parser.parse(ref.to_nameref(lang=lang)).ID == ref.ID
+            assert parser.parse(ref.to_abbrevref(lang=lang)).ID == ref.ID
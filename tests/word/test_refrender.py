@@ -0,0 +1,57 @@
+"""Pytest tests for biblelib.word.refrender."""
+
+import pytest
+
+from biblelib.book import localized_languages
+from biblelib.word import BCVID, BCVIDRange, BCVWPID
+from biblelib.word.refrender import RefRenderer, get_refrenderer, preload_refrenderers
+
+
+class TestRefRenderer:
+    """Test basic functionality for RefRenderer."""
+
+    def test_render_english(self) -> None:
+        """Test English styles."""
+        assert get_refrenderer("eng", "name").render(BCVID("01001001")) == "Genesis 1:1"
+        assert get_refrenderer("eng", "abbrev").render(BCVID("01001001")) == "Ge 1:1"
+        assert get_refrenderer("eng", "osisID").render_id("46002003") == "1Cor 2:3"
+        assert get_refrenderer("eng", "usfmname").render_id("46002003") == "1CO 2:3"
+        assert get_refrenderer("eng", "name").render_id("46002003") == "1 Corinthians 2:3"
+        assert get_refrenderer("eng", "biblia").render_id("46002003") == "1Co 2:3"
+        with pytest.raises(AssertionError):
+            RefRenderer("eng", "bogus")
+
+    def test_render_localized(self) -> None:
+        """Test localized names, abbreviations, and separators."""
+        assert get_refrenderer("fra", "name").render(BCVID("41004003")) == "Marc 4.3"
+        assert get_refrenderer("fra", "abbrev").render(BCVID("41004003")) == "Mc 4.3"
+        mrk = BCVIDRange(BCVID("41004003"), BCVID("41005008"))
+        assert get_refrenderer("fra", "abbrev").render(mrk) == "Mc 4.3-5.8"
+        # word IDs render as their verse
+        assert get_refrenderer("fra", "name").render(BCVWPID("410040030011")) == "Marc 4.3"
+
+    def test_render_many(self) -> None:
+        """Test rendering a batch of IDs."""
+        renderer = get_refrenderer("spa", "name")
+        assert renderer.render_many(["01001001", "41004003"]) == [
+            BCVID("01001001").to_nameref(lang="spa"),
+            BCVID("41004003").to_nameref(lang="spa"),
+        ]
+
+    def test_unsupported(self) -> None:
+        """Test falling back to English."""
+        with pytest.warns(UserWarning):
+            renderer = RefRenderer("zzy", "abbrev")
+        assert renderer.render_id("01001001") == "Ge 1:1"
+
+    def test_shared(self) -> None:
+        """Test that renderers are shared."""
+        assert get_refrenderer("fra", "name") is get_refrenderer("fra", "name")
+
+    def test_preload(self) -> None:
+        """Test preloading every language."""
+        renderers = preload_refrenderers()
+        assert len(renderers) == 2 * (1 + len(localized_languages()))
+        assert {renderer.lang for renderer in renderers} == {"eng", *localized_languages()}
+        for renderer in renderers:
+            assert renderer.render_id("41004003")